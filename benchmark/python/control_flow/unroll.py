@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Compare the Python unroll of Gluon RNN cells with the fused (foreach) unroll.
+
+For every configuration the script reports the number of nodes of the unrolled
+graph, the time of the first hybridized call (graph construction and binding)
+and the mean/std time of the following calls.
+"""
+from __future__ import print_function
+
+import argparse
+from itertools import product
+from time import time
+
+import mxnet as mx
+import numpy as np
+from mxnet import gluon
+
+
+_parser = argparse.ArgumentParser(description='Benchmark fused RNN cell unrolling.')
+_parser.add_argument('--seq_lens', type=int, nargs='+', default=[25, 100, 400])
+_parser.add_argument('--batch_size', type=int, default=32)
+_parser.add_argument('--hidden_dim', type=int, default=256)
+_parser.add_argument('--warmup_rounds', type=int, default=5)
+_parser.add_argument('--test_rounds', type=int, default=20)
+_parser.add_argument('--train', action='store_true', help='Also run the backward pass.')
+_parser.add_argument('--gpu', action='store_true')
+args = _parser.parse_args()
+
+
+class UnrollRNN(gluon.HybridBlock):
+    def __init__(self, cell, length, fused):
+        super(UnrollRNN, self).__init__()
+        self.cell = cell
+        self.length = length
+        self.fused = fused
+
+    def hybrid_forward(self, F, inputs, valid_length):
+        out, _ = self.cell.unroll(self.length, inputs, layout='TNC', merge_outputs=True,
+                                  valid_length=valid_length, fused=self.fused)
+        return out
+
+
+def _stacked(cell_type, hidden_dim):
+    def make():
+        cell = gluon.rnn.SequentialRNNCell()
+        cell.add(cell_type(hidden_dim))
+        cell.add(cell_type(hidden_dim))
+        return cell
+    make.__name__ = 'Sequential(2 x %s)' % cell_type.__name__
+    return make
+
+
+def _num_nodes(make_cell, seq_len, fused):
+    out, _ = make_cell().unroll(seq_len, mx.sym.var('data'), layout='TNC',
+                                merge_outputs=True, fused=fused)
+    return len(out.get_internals().list_outputs())
+
+
+def run_benchmark(make_cell, ctx, seq_len, fused):
+    inputs = mx.nd.random.normal(shape=(seq_len, args.batch_size, args.hidden_dim), ctx=ctx)
+    valid_length = mx.nd.round(mx.nd.random.uniform(low=1, high=seq_len,
+                                                    shape=(args.batch_size,), ctx=ctx))
+    layer = UnrollRNN(make_cell(), seq_len, fused)
+    layer.initialize(ctx=ctx)
+    layer.hybridize(static_alloc=True)
+
+    def step():
+        if args.train:
+            with mx.autograd.record():
+                out = layer(inputs, valid_length)
+            out.backward()
+        else:
+            out = layer(inputs, valid_length)
+        mx.nd.waitall()
+
+    tick = time()
+    step()
+    first = (time() - tick) * 1000.0
+    times = []
+    for _ in range(args.warmup_rounds + args.test_rounds):
+        tick = time()
+        step()
+        times.append((time() - tick) * 1000.0)
+    times = times[args.warmup_rounds:]
+    print("%-8s nodes = %6d  first call = %9.3f ms  mean = %8.3f ms  std = %7.3f ms" %
+          ('fused' if fused else 'python', _num_nodes(make_cell, seq_len, fused),
+           first, np.mean(times), np.std(times)))
+
+
+def main():
+    cell_types = [gluon.rnn.RNNCell, gluon.rnn.GRUCell, gluon.rnn.LSTMCell]
+    make_cells = [lambda cell_type=cell_type: cell_type(args.hidden_dim)
+                  for cell_type in cell_types]
+    for make_cell, cell_type in zip(make_cells, cell_types):
+        make_cell.__name__ = cell_type.__name__
+    make_cells.append(_stacked(gluon.rnn.LSTMCell, args.hidden_dim))
+    ctxs = [mx.gpu(0)] if args.gpu else [mx.cpu(0)]
+    for make_cell, ctx, seq_len in product(make_cells, ctxs, args.seq_lens):
+        print("--------------------------------------")
+        print("cell: %s  ctx: %s  length: %d  batch size: %d  dim: %d  train: %r" %
+              (make_cell.__name__, str(ctx), seq_len, args.batch_size, args.hidden_dim,
+               args.train))
+        for fused in [False, True]:
+            run_benchmark(make_cell, ctx, seq_len, fused)
+
+
+if __name__ == "__main__":
+    main()
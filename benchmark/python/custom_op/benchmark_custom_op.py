@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Throughput of a Python CustomOp against the equivalent built-in operator.
+
+The network applies the operator to `--branches` independent inputs, so the
+custom op invocations can run concurrently on the custom op worker pool. Run
+with different `--num-threads` and `--batch-size` values to compare pool
+settings. Throughput is measured with the profiler stopped, per-op Python timings
+are then collected by a separate profiled pass."""
+import argparse
+import os
+import time
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument('--shape', type=int, nargs='+', default=[64, 1024])
+parser.add_argument('--branches', type=int, default=8)
+parser.add_argument('--num-threads', type=int, default=0,
+                    help='MXNET_CUSTOM_OP_NUM_THREADS, 0 for an unbounded pool')
+parser.add_argument('--batch-size', type=int, default=1,
+                    help='MXNET_CUSTOM_OP_BATCH_SIZE')
+parser.add_argument('--warmup', type=int, default=10)
+parser.add_argument('--repeats', type=int, default=100)
+args = parser.parse_args()
+os.environ['MXNET_CUSTOM_OP_NUM_THREADS'] = str(args.num_threads)
+os.environ['MXNET_CUSTOM_OP_BATCH_SIZE'] = str(args.batch_size)
+
+import mxnet as mx  # pylint: disable=wrong-import-position
+
+
+class Sigmoid(mx.operator.CustomOp):
+    def forward(self, is_train, req, in_data, out_data, aux):
+        self.assign(out_data[0], req[0], mx.nd.sigmoid(in_data[0]))
+
+    def backward(self, req, out_grad, in_data, out_data, in_grad, aux):
+        y = out_data[0]
+        self.assign(in_grad[0], req[0], out_grad[0] * y * (1 - y))
+
+
+@mx.operator.register('bench_sigmoid')
+class SigmoidProp(mx.operator.CustomOpProp):
+    def __init__(self):
+        super(SigmoidProp, self).__init__(need_top_grad=True)
+
+    def infer_shape(self, in_shape):
+        return in_shape, [in_shape[0]], []
+
+    def create_operator(self, ctx, shapes, dtypes):
+        return Sigmoid()
+
+
+def run(op, inputs, warmup, repeats):
+    for x in inputs:
+        x.attach_grad()
+
+    def step():
+        with mx.autograd.record():
+            outs = [op(x) for x in inputs]
+        mx.autograd.backward(outs)
+        mx.nd.waitall()
+
+    for _ in range(warmup):
+        step()
+    tic = time.time()
+    for _ in range(repeats):
+        step()
+    return repeats * len(inputs) / (time.time() - tic)
+
+
+def custom_op(x):
+    return mx.nd.Custom(x, op_type='bench_sigmoid')
+
+
+if __name__ == '__main__':
+    inputs = [mx.nd.random.uniform(-1, 1, shape=args.shape) for _ in range(args.branches)]
+    builtin = run(mx.nd.sigmoid, inputs, args.warmup, args.repeats)
+    custom = run(custom_op, inputs, args.warmup, args.repeats)
+    # separate pass for the per-op timings, so that profiling does not slow down
+    # the throughput measurement of one op but not the other
+    mx.profiler.set_config(aggregate_stats=True)
+    mx.profiler.set_state('run')
+    run(custom_op, inputs, 0, args.repeats)
+    mx.profiler.set_state('stop')
+    print('threads=%d batch=%d shape=%s branches=%d'
+          % (args.num_threads, args.batch_size, args.shape, args.branches))
+    print('%-10s %-16s' % ('op', 'calls/s (fwd+bwd)'))
+    print('%-10s %-16.1f' % ('built-in', builtin))
+    print('%-10s %-16.1f (%.1f%% of built-in)' % ('custom', custom, custom / builtin * 100))
+    for stat in mx.profiler.get_aggregate_stats(reset=True):
+        if stat.domain == 'Python' and stat.name.startswith('CustomOp::'):
+            print('%-36s count=%-8d avg=%.3f ms' % (stat.name, stat.count, stat.avg))
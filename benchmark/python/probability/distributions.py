@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Benchmark sampling and log-likelihood of gluon.probability distributions.
+
+Each distribution is batched over `--batch` independent parameter sets, as in
+variational models. The script reports the time of `sample_n`, `log_prob` and
+`kl_divergence` both imperatively and inside a hybridized block.
+"""
+
+import argparse
+import time
+
+import mxnet as mx
+import numpy as onp
+from mxnet import np, gluon
+from mxnet.util import use_np
+import mxnet.gluon.probability as mgp
+
+_parser = argparse.ArgumentParser(description='Benchmark gluon.probability distributions.')
+_parser.add_argument('--batch', type=int, nargs='+', default=[1000, 100000])
+_parser.add_argument('--num-samples', type=int, default=10)
+_parser.add_argument('--event-dim', type=int, default=16)
+_parser.add_argument('--repeat', type=int, default=50)
+_parser.add_argument('--gpu', action='store_true')
+args = _parser.parse_args()
+
+
+def _positive(shape):
+    return np.random.uniform(0.5, 2.0, size=shape)
+
+
+def _simplex(shape):
+    p = _positive(shape)
+    return p / p.sum(-1, keepdims=True)
+
+
+def make_families(batch, dim):
+    """(name, distribution factory, parameter arrays) of the benchmarked families."""
+    cov = np.eye(dim) + 0.1
+    return [
+        ('Normal', mgp.Normal, [np.random.normal(size=(batch,)), _positive((batch,))]),
+        ('Bernoulli', lambda p: mgp.Bernoulli(prob=p), [np.random.uniform(size=(batch,))]),
+        ('Categorical', lambda p: mgp.Categorical(dim, prob=p), [_simplex((batch, dim))]),
+        ('Gamma', mgp.Gamma, [_positive((batch,)), _positive((batch,))]),
+        ('Beta', mgp.Beta, [_positive((batch,)), _positive((batch,))]),
+        ('Dirichlet', mgp.Dirichlet, [_positive((batch, dim))]),
+        ('MultivariateNormal', lambda loc: mgp.MultivariateNormal(loc, cov=cov),
+         [np.random.normal(size=(batch, dim))]),
+    ]
+
+
+@use_np
+class LogProb(gluon.HybridBlock):
+    def __init__(self, factory):
+        super(LogProb, self).__init__()
+        self._factory = factory
+
+    def hybrid_forward(self, F, value, *params):
+        return self._factory(*params).log_prob(value)
+
+
+def _time(fn):
+    fn().wait_to_read()
+    tic = time.time()
+    for _ in range(args.repeat):
+        out = fn()
+    out.wait_to_read()
+    return (time.time() - tic) / args.repeat * 1000
+
+
+def run(name, factory, params):
+    dist = factory(*params)
+    samples = dist.sample()
+    block = LogProb(factory)
+    block.hybridize()
+    t_sample = _time(lambda: dist.sample_n(args.num_samples))
+    t_log_prob = _time(lambda: dist.log_prob(samples))
+    t_hybrid = _time(lambda: block(samples, *params))
+    try:
+        other = factory(*params)
+        t_kl = '%8.3f' % _time(lambda: mgp.kl_divergence(dist, other))
+    except NotImplementedError:
+        t_kl = '     n/a'
+    print("%-20s sample_n = %8.3f ms  log_prob = %8.3f ms  hybridized = %8.3f ms  kl = %s ms"
+          % (name, t_sample, t_log_prob, t_hybrid, t_kl))
+
+
+@use_np
+def main():
+    ctx = mx.gpu(0) if args.gpu else mx.cpu(0)
+    with ctx:
+        for batch in args.batch:
+            print("--------------------------------------")
+            print("batch: %d  event dim: %d  num samples: %d  ctx: %s"
+                  % (batch, args.event_dim, args.num_samples, ctx))
+            for name, factory, params in make_families(batch, args.event_dim):
+                run(name, factory, params)
+
+
+if __name__ == "__main__":
+    onp.random.seed(0)
+    main()
@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""CPU inference latency of a Gluon model zoo network in FP32 and after INT8
+post-training quantization with `mxnet.contrib.quantization.quantize_net`."""
+import argparse
+import time
+import mxnet as mx
+from mxnet.gluon.model_zoo import vision
+from mxnet.contrib.quantization import quantize_net
+
+
+def measure_latency(net, data, warmup, repeats):
+    for _ in range(warmup):
+        net(data).wait_to_read()
+    tic = time.time()
+    for _ in range(repeats):
+        net(data).wait_to_read()
+    return (time.time() - tic) / repeats * 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', type=str, default='resnet50_v1')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 16, 64])
+    parser.add_argument('--image-shape', type=int, nargs=3, default=[3, 224, 224])
+    parser.add_argument('--calib-mode', type=str, default='naive',
+                        choices=['none', 'naive', 'entropy'])
+    parser.add_argument('--num-calib-samples', type=int, default=128)
+    parser.add_argument('--backend', type=str, default='MKLDNN_QUANTIZE',
+                        help='subgraph backend, "none" to disable')
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+    backend = None if args.backend == 'none' else args.backend
+
+    net = vision.get_model(args.model)
+    net.initialize(mx.init.Xavier())
+    net.hybridize(static_alloc=True, static_shape=True)
+
+    calib_set = mx.gluon.data.ArrayDataset(
+        mx.nd.random.uniform(-1, 1, shape=[args.num_calib_samples] + args.image_shape))
+    calib_data = mx.gluon.data.DataLoader(calib_set, batch_size=32)
+    tic = time.time()
+    qnet = quantize_net(net, calib_data=calib_data, calib_mode=args.calib_mode,
+                        num_calib_samples=args.num_calib_samples, backend=backend)
+    print('quantize_net (%s calibration, %d samples): %.1f s'
+          % (args.calib_mode, args.num_calib_samples, time.time() - tic))
+
+    print('%-10s %-12s %-12s %-8s' % ('batch', 'FP32 (ms)', 'INT8 (ms)', 'speedup'))
+    for batch_size in args.batch_sizes:
+        data = mx.nd.random.uniform(-1, 1, shape=[batch_size] + args.image_shape)
+        fp32 = measure_latency(net, data, args.warmup, args.repeats)
+        int8 = measure_latency(qnet, data, args.warmup, args.repeats)
+        print('%-10d %-12.2f %-12.2f %-8.2f' % (batch_size, fp32, int8, fp32 / int8))
@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Benchmark distributed training of an embedding with sparse gradients.
+
+Reports, per worker and step, an estimate of the bytes pushed to and pulled
+from the servers and the measured step time, with and without
+Trainer.prefetch_rows. The byte counts are computed from the number of rows in
+each push and pull, not measured on the wire, so they exclude row ids and
+message overhead. Run it on localhost
+with the local launcher, e.g.
+
+    python tools/launch.py -n 2 -s 2 --launcher local \
+        python benchmark/python/sparse/dist_embedding.py --prefetch
+"""
+
+import argparse
+import time
+
+import mxnet as mx
+import numpy as np
+from mxnet import gluon
+
+parser = argparse.ArgumentParser(description='Benchmark sparse embedding training on dist kvstore')
+parser.add_argument('--vocab', type=int, default=1000000, help='number of embedding rows')
+parser.add_argument('--dim', type=int, default=128, help='embedding dimension')
+parser.add_argument('--batch-size', type=int, default=256)
+parser.add_argument('--seq-len', type=int, default=32)
+parser.add_argument('--num-batches', type=int, default=50)
+parser.add_argument('--optimizer', type=str, default='adam')
+parser.add_argument('--kvstore', type=str, default='dist_sync')
+parser.add_argument('--prefetch', action='store_true',
+                    help='pull only the rows read by the next batch')
+args = parser.parse_args()
+
+
+def zipf_dataset(num_samples, rank):
+    """Token ids following a Zipf distribution, as in natural language corpora."""
+    rng = np.random.RandomState(rank)
+    tokens = rng.zipf(1.2, size=(num_samples, args.seq_len)) % args.vocab
+    return gluon.data.ArrayDataset(tokens.astype('int64'))
+
+
+def lookahead(iterable):
+    """Yields (batch, next_batch) pairs so the row ids of the next batch are known."""
+    it = iter(iterable)
+    batch = next(it, None)
+    while batch is not None:
+        next_batch = next(it, None)
+        yield batch, next_batch
+        batch = next_batch
+
+
+kv = mx.kv.create(args.kvstore)
+net = gluon.nn.Embedding(args.vocab, args.dim, sparse_grad=True)
+net.initialize(mx.init.Uniform(0.1))
+trainer = gluon.Trainer(net.collect_params(), args.optimizer,
+                        {'learning_rate': 0.01, 'lazy_update': True}, kvstore=kv)
+row_bytes = args.dim * np.dtype('float32').itemsize
+data_loader = gluon.data.DataLoader(zipf_dataset(args.num_batches * args.batch_size, kv.rank),
+                                    batch_size=args.batch_size)
+
+# estimated payload: rows transferred times the size of a row
+pushed = pulled = 0
+step_times = []
+for i, (batch, next_batch) in enumerate(lookahead(data_loader)):
+    tic = time.time()
+    with mx.autograd.record():
+        loss = net(batch).sum()
+    loss.backward()
+    pushed += net.weight.grad().indices.size * row_bytes
+    if args.prefetch and next_batch is not None:
+        trainer.prefetch_rows({net.weight: next_batch})
+        pulled += np.unique(next_batch.asnumpy()).size * row_bytes
+    else:
+        pulled += args.vocab * row_bytes
+    trainer.step(args.batch_size)
+    mx.nd.waitall()
+    if i > 0:
+        step_times.append(time.time() - tic)
+
+num_steps = args.num_batches
+print("worker %d: prefetch=%r  table=%.1f MB  est. pushed/step=%.3f MB  est. pulled/step=%.3f MB  "
+      "step=%.2f ms" % (kv.rank, args.prefetch, args.vocab * row_bytes / 1e6,
+                        pushed / num_steps / 1e6, pulled / num_steps / 1e6,
+                        np.mean(step_times) * 1000))
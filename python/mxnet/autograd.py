@@ -29,6 +29,7 @@ from .ndarray import NDArray, _ndarray_cls
 from .ndarray import _GRAD_REQ_MAP
 from .symbol import Symbol
 from .util import is_np_array
+from . import profiler
 
 
 def set_recording(is_recording): #pylint: disable=redefined-outer-name
@@ -438,7 +439,8 @@ class Function(object):
         self._used = True
 
         prev_recording = set_recording(False)
-        outputs = self.forward(*inputs)
+        with profiler.hot_path('Function::%s::forward' % type(self).__name__):
+            outputs = self.forward(*inputs)
         set_recording(prev_recording)
 
         if not prev_recording:
@@ -449,6 +451,7 @@ class Function(object):
             outputs = (outputs,)
 
         key = Function._registry.inc()
+        backward_name = 'Function::%s::backward' % type(self).__name__
         if is_np_array():
             from .numpy import ndarray
             array_cls = ndarray
@@ -464,7 +467,8 @@ class Function(object):
                 input_grads = [array_cls(ctypes.cast(i, NDArrayHandle), writable=True) \
                                for i in ptrs[num_ograds:num_ograds+num_igrads]]
                 reqs = [reqs[i] for i in range(num_igrads)]
-                rets = self.backward(*output_grads)
+                with profiler.hot_path(backward_name):
+                    rets = self.backward(*output_grads)
                 if isinstance(rets, array_cls):
                     rets = (rets,)
                 assert len(rets) == len(input_grads), \
@@ -18,10 +18,18 @@
 # coding: utf-8
 """Callback functions that can be used to track various status during epoch."""
 
+import csv
 import logging
 import math
 import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+from . import profiler
 from .model import save_checkpoint
+from .ndarray import waitall
 
 def do_checkpoint(prefix, period=1):
     """A callback that saves a model checkpoint every few epochs.
@@ -152,6 +160,276 @@ class Speedometer(object):
             self.tic = time.time()
 
 
+class ThroughputMonitor(object):
+    """Measures training throughput and attributes the step time to phases.
+
+    The wall time of every step is split into
+
+    - ``data``: waiting for the next batch,
+    - ``comm``: gradient communication (kvstore push/pull, allreduce),
+    - ``update``: the optimizer update,
+    - ``compute``: the remainder, i.e. forward, backward and everything else.
+
+    Phases are measured from the framework hot paths listed in `hot_paths`, such as
+    ``DataLoader::wait`` or ``Trainer::update``, and from :py:meth:`phase` scopes in user
+    code. The default hot paths cover the Gluon DataLoader and Trainer and the parameter
+    update helpers of :py:mod:`mxnet.model`. Anything else, e.g. fetching batches from a
+    ``DataIter``, is charged to ``compute`` unless it runs in a :py:meth:`phase` scope. Hot paths completing inside a :py:meth:`phase` scope of the same phase are not
+    charged again. Since operators run asynchronously, with `synchronize` the monitor waits for
+    the engine at the boundaries of the phases and steps, so that each phase is charged
+    with the work it issued. This makes the breakdown accurate at the cost of the
+    overlap between phases.
+
+    Every `frequent` steps a record with the throughput, rolling step time percentiles
+    over the last `window` steps, the average time per step of each phase and the
+    metric values is passed to each sink.
+
+    The monitor is used as `batch_end_callback`, or from a Gluon loop by calling
+    :py:meth:`step` at the end of each iteration.
+
+    Parameters
+    ----------
+    batch_size: int
+        Batch size of data.
+    frequent: int
+        Number of steps between two records.
+    window: int
+        Number of most recent steps the step time percentiles are computed over.
+    sinks: list of callable
+        Called with each record, an OrderedDict. Objects with a ``close`` method are
+        closed by :py:meth:`close`. Defaults to a :py:class:`LogSink`.
+    synchronize: bool
+        Whether to wait for the engine at phase and step boundaries.
+    hot_paths: dict of str to str
+        Maps profiler hot path names to the phase their time is charged to, one of
+        `PHASES`.
+    auto_reset : bool
+        Reset the evaluation metrics after each record.
+
+    Example
+    -------
+    >>> monitor = mx.callback.ThroughputMonitor(batch_size, frequent=100,
+    ...     sinks=[mx.callback.LogSink(), mx.callback.CSVSink('throughput.csv')])
+    >>> for epoch in range(num_epochs):
+    ...     for data, label in train_data:
+    ...         with autograd.record():
+    ...             loss = loss_fn(net(data), label)
+    ...         loss.backward()
+    ...         trainer.step(batch_size)
+    ...         monitor.step(epoch)
+    >>> monitor.close()
+    """
+    PHASES = ('data', 'compute', 'comm', 'update')
+    HOT_PATHS = {'DataLoader::wait': 'data',
+                 'Trainer::allreduce_grads': 'comm',
+                 'Trainer::update': 'update',
+                 'Model::update_on_kvstore': 'comm',
+                 'Model::allreduce_grads': 'comm',
+                 'Model::update': 'update'}
+
+    def __init__(self, batch_size, frequent=50, window=1000, sinks=None, synchronize=True,
+                 hot_paths=None, auto_reset=True):
+        self.batch_size = batch_size
+        self.frequent = frequent
+        self.sinks = [LogSink()] if sinks is None else list(sinks)
+        self.synchronize = synchronize
+        self.auto_reset = auto_reset
+        self.num_steps = 0
+        self._hot_paths = dict(self.HOT_PATHS if hot_paths is None else hot_paths)
+        for name, phase in self._hot_paths.items():
+            if phase not in self.PHASES:
+                raise ValueError('Hot path %s is charged to unknown phase %s, expected one '
+                                 'of %s' % (name, phase, ', '.join(self.PHASES)))
+        self._step_times = deque(maxlen=window)
+        self._pending = dict.fromkeys(self.PHASES, 0.)
+        self._totals = dict.fromkeys(self.PHASES, 0.)
+        # number of open phase() scopes per phase
+        self._open = dict.fromkeys(self.PHASES, 0)
+        self._tic = None
+        self._period_start = None
+        self._period_steps = 0
+        self._last_count = 0
+        profiler.add_hot_path_listener(self._on_hot_path,
+                                       synchronize=self._hot_paths if synchronize else ())
+
+    def _on_hot_path(self, name, elapsed):
+        phase = self._hot_paths.get(name)
+        # the time is already measured by an enclosing phase() scope
+        if phase is not None and not self._open[phase]:
+            self._pending[phase] += elapsed
+
+    @contextmanager
+    def phase(self, name):
+        """Charges the time spent in the scope to phase `name`, one of `PHASES`.
+
+        Hot paths of the same phase completing within the scope, such as
+        ``DataLoader::wait`` for ``data``, are not charged on top of it.
+
+        Example
+        -------
+        >>> with monitor.phase('update'):
+        ...     ema.update(net.collect_params())
+        """
+        if name not in self.PHASES:
+            raise ValueError('Unknown phase %s, expected one of %s'
+                             % (name, ', '.join(self.PHASES)))
+        if self.synchronize:
+            waitall()
+        tic = time.perf_counter()
+        self._open[name] += 1
+        try:
+            yield
+        finally:
+            if self.synchronize:
+                waitall()
+            self._open[name] -= 1
+            if not self._open[name]:
+                self._pending[name] += (time.perf_counter() - tic) * 1000
+
+    def reset(self):
+        """Starts a new measurement, dropping the partially measured step and period."""
+        self._tic = None
+        self._period_steps = 0
+        self._totals = dict.fromkeys(self.PHASES, 0.)
+        self._pending = dict.fromkeys(self.PHASES, 0.)
+
+    def step(self, epoch=None, batch=None, metric=None):
+        """Marks the end of a training step.
+
+        The first call only starts the clock.
+
+        Parameters
+        ----------
+        epoch : int
+            Epoch number to include in the records.
+        batch : int
+            Batch number to include in the records, defaults to the number of steps.
+        metric : EvalMetric
+            Metric whose values are included in the records.
+
+        Returns
+        -------
+        OrderedDict or None
+            The record passed to the sinks, if one was emitted at this step.
+        """
+        if self.synchronize:
+            waitall()
+        now = time.perf_counter()
+        pending, self._pending = self._pending, dict.fromkeys(self.PHASES, 0.)
+        if self._tic is None:
+            self._tic = self._period_start = now
+            return None
+        step_time = (now - self._tic) * 1000
+        self._tic = now
+        self._step_times.append(step_time)
+        for phase, elapsed in pending.items():
+            self._totals[phase] += elapsed
+        self._totals['compute'] += max(step_time - sum(pending.values()), 0.)
+        self.num_steps += 1
+        self._period_steps += 1
+        if self._period_steps < self.frequent:
+            return None
+
+        period = now - self._period_start
+        record = OrderedDict()
+        record['step'] = self.num_steps
+        record['epoch'] = epoch
+        record['batch'] = self.num_steps if batch is None else batch
+        record['samples_per_sec'] = self._period_steps * self.batch_size / period \
+            if period > 0 else float('inf')
+        p50, p90, p99 = np.percentile(self._step_times, [50, 90, 99])
+        record['step_ms_p50'], record['step_ms_p90'], record['step_ms_p99'] = p50, p90, p99
+        for phase in self.PHASES:
+            record['%s_ms' % phase] = self._totals[phase] / self._period_steps
+        if metric is not None:
+            for name, value in metric.get_name_value():
+                record[name] = value
+            if self.auto_reset:
+                metric.reset()
+        for sink in self.sinks:
+            sink(record)
+        self._period_start = now
+        self._period_steps = 0
+        self._totals = dict.fromkeys(self.PHASES, 0.)
+        return record
+
+    def __call__(self, param):
+        """Callback to record the end of a batch."""
+        count = param.nbatch
+        if self._last_count > count:
+            # a new epoch starts, do not charge the time in between to a step
+            self.reset()
+        self._last_count = count
+        self.step(param.epoch, count, param.eval_metric)
+
+    def close(self):
+        """Stops listening to hot paths and closes the sinks."""
+        profiler.remove_hot_path_listener(self._on_hot_path)
+        for sink in self.sinks:
+            if hasattr(sink, 'close'):
+                sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class LogSink(object):
+    """Logs the records of :py:class:`ThroughputMonitor`.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        Logger to use, defaults to the root logger.
+    """
+    _fields = frozenset(['step', 'epoch', 'batch', 'samples_per_sec', 'step_ms_p50',
+                         'step_ms_p90', 'step_ms_p99'] +
+                        ['%s_ms' % phase for phase in ThroughputMonitor.PHASES])
+
+    def __init__(self, logger=None):
+        self.logger = logger if logger is not None else logging.getLogger()
+
+    def __call__(self, record):
+        msg = 'Epoch[%s] Batch[%s]\tSpeed: %.2f samples/sec\tstep p50=%.1fms p99=%.1fms' \
+              '\tdata=%.1fms compute=%.1fms comm=%.1fms update=%.1fms'
+        args = [record['epoch'], record['batch'], record['samples_per_sec'],
+                record['step_ms_p50'], record['step_ms_p99'], record['data_ms'],
+                record['compute_ms'], record['comm_ms'], record['update_ms']]
+        for name, value in record.items():
+            if name not in self._fields:
+                msg += '\t%s=%f'
+                args += [name, value]
+        self.logger.info(msg, *args)
+
+
+class CSVSink(object):
+    """Appends the records of :py:class:`ThroughputMonitor` to a CSV file.
+
+    The columns are those of the first record.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the CSV file, overwritten if it exists.
+    """
+    def __init__(self, filename):
+        self._file = open(filename, 'w', newline='')
+        self._writer = None
+
+    def __call__(self, record):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(record),
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(record)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
 class ProgressBar(object):
     """Displays a progress bar, indicating the percentage of batches processed within each epoch.
 
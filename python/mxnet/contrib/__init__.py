@@ -30,3 +30,4 @@ from . import text
 from . import onnx
 from . import io
 from . import tensorrt
+from . import quantization
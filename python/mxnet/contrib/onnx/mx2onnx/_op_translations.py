@@ -177,6 +177,7 @@ def convert_weights_and_inputs(node, **kwargs):
     name, _, _ = get_inputs(node, kwargs)
 
     if kwargs["is_input"] is False:
+        from onnx import numpy_helper
         weights = kwargs["weights"]
         initializer = kwargs["initializer"]
         np_arr = weights[name]
@@ -185,15 +186,8 @@ def convert_weights_and_inputs(node, **kwargs):
 
         tensor_node = onnx.helper.make_tensor_value_info(name, data_type, dims)
 
-        initializer.append(
-            onnx.helper.make_tensor(
-                name=name,
-                data_type=data_type,
-                dims=dims,
-                vals=np_arr.flatten().tolist(),
-                raw=False
-            )
-        )
+        # store the weight as raw bytes instead of a python list of scalars
+        initializer.append(numpy_helper.from_array(np_arr, name=name))
 
         return [tensor_node]
     else:
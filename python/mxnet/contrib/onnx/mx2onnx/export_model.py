@@ -20,6 +20,7 @@
 
 """Exports an MXNet model to the ONNX model format"""
 import logging
+import time
 import numpy as np
 
 from ....base import string_types
@@ -29,7 +30,8 @@ from ._export_helper import load_module
 
 
 def export_model(sym, params, input_shape, input_type=np.float32,
-                 onnx_file_path='model.onnx', verbose=False, opset_version=None):
+                 onnx_file_path='model.onnx', verbose=False, opset_version=None,
+                 external_data=False, external_data_threshold=1024, deduplicate=True):
     """Exports the MXNet model file, passed as a parameter, into ONNX model.
     Accepts both symbol,parameter objects as well as json and params filepaths as input.
     Operator support and coverage -
@@ -49,6 +51,17 @@ def export_model(sym, params, input_shape, input_type=np.float32,
         Path where to save the generated onnx file
     verbose : Boolean
         If true will print logs of the model conversion
+    opset_version : Int
+        ONNX opset version to use for export, defaults to latest supported by onnx package
+    external_data : Boolean
+        If true, weights are streamed to ``onnx_file_path + '.data'`` and referenced as
+        ONNX external data, so that models above the 2GB protobuf limit can be exported.
+        The data file must stay next to the onnx file.
+    external_data_threshold : int
+        Size in bytes from which weights are stored as external data
+    deduplicate : Boolean
+        If true, weights and constants holding identical values are stored once and
+        shared by the nodes using them
 
     Returns
     -------
@@ -74,28 +87,39 @@ def export_model(sym, params, input_shape, input_type=np.float32,
         opset_version = onnx_opset_version()
 
     data_format = np.dtype(input_type)
+    external_data_path = onnx_file_path + '.data' if external_data else None
+    load_time = None
     # if input parameters are strings(file paths), load files and create symbol parameter objects
     if isinstance(sym, string_types) and isinstance(params, string_types):
         logging.info("Converting json and weight file to sym and params")
-        sym_obj, params_obj = load_module(sym, params)
-        onnx_graph = converter.create_onnx_graph_proto(sym_obj, params_obj, input_shape,
-                                                       mapping.NP_TYPE_TO_TENSOR_TYPE[data_format],
-                                                       verbose=verbose, opset_version=opset_version)
-    elif isinstance(sym, symbol.Symbol) and isinstance(params, dict):
-        onnx_graph = converter.create_onnx_graph_proto(sym, params, input_shape,
-                                                       mapping.NP_TYPE_TO_TENSOR_TYPE[data_format],
-                                                       verbose=verbose, opset_version=opset_version)
-    else:
+        tic = time.time()
+        sym, params = load_module(sym, params)
+        load_time = time.time() - tic
+    elif not (isinstance(sym, symbol.Symbol) and isinstance(params, dict)):
         raise ValueError("Input sym and params should either be files or objects")
+    onnx_graph = converter.create_onnx_graph_proto(sym, params, input_shape,
+                                                   mapping.NP_TYPE_TO_TENSOR_TYPE[data_format],
+                                                   verbose=verbose, opset_version=opset_version,
+                                                   external_data_path=external_data_path,
+                                                   external_data_threshold=external_data_threshold,
+                                                   deduplicate=deduplicate)
+
+    if load_time is not None:
+        converter.phase_times['load'] = load_time
+        converter.phase_times.move_to_end('load', last=False)
 
     # Create the model (ModelProto)
     onnx_model = helper.make_model(onnx_graph)
 
     # Save model on disk
+    tic = time.time()
     with open(onnx_file_path, "wb") as file_handle:
         serialized = onnx_model.SerializeToString()
         file_handle.write(serialized)
         logging.info("Input shape of the model %s ", input_shape)
         logging.info("Exported ONNX file %s saved to disk", onnx_file_path)
+    converter.phase_times['serialize'] = time.time() - tic
+    logging.info("ONNX export time per phase: %s",
+                 ", ".join("%s %.3fs" % (k, v) for k, v in converter.phase_times.items()))
 
     return onnx_file_path
@@ -49,10 +49,90 @@
 """MXNet to ONNX graph converter functions"""
 import logging
 import json
+import hashlib
+import os
+import time
+from collections import OrderedDict
 
 from .... import ndarray as nd
 
 
+class _NumpyWeights(dict):
+    """Weights looked up by the operator converters, each converted to numpy on access
+    and not kept afterwards"""
+    def __init__(self, params):
+        super(_NumpyWeights, self).__init__()
+        self._params = dict([(k.replace("arg:", "").replace("aux:", ""), v)
+                             for k, v in params.items()])
+
+    def __missing__(self, name):
+        return self._params[name].asnumpy()
+
+
+class _InitializerWriter(list):
+    """List of graph initializers that deduplicates and externalizes tensors as the
+    operator converters append them, so the raw data of a large initializer is written
+    out and released before the next one is converted.
+
+    Parameters
+    ----------
+    file_handle : file or None
+        Open external data file, large initializers are kept in the model if None
+    location : str
+        Name of the external data file relative to the model file
+    size_threshold : int
+        Initializers smaller than this many bytes are kept in the model
+    deduplicate : Boolean
+        If true, a tensor identical to an earlier initializer is not stored again and
+        its name is recorded in `aliases` instead
+    """
+    def __init__(self, file_handle=None, location=None, size_threshold=1024, deduplicate=True):
+        super(_InitializerWriter, self).__init__()
+        self._file_handle = file_handle
+        self._location = location
+        self._size_threshold = size_threshold
+        self._deduplicate = deduplicate
+        self._kept = {}
+        self.aliases = {}
+
+    def append(self, tensor):
+        from onnx import TensorProto, numpy_helper
+        from onnx.external_data_helper import set_external_data
+
+        if self._deduplicate:
+            data = tensor.raw_data if tensor.HasField('raw_data') \
+                else numpy_helper.to_array(tensor).tobytes()
+            key = (tensor.data_type, tuple(tensor.dims), hashlib.sha1(data).hexdigest())
+            if key in self._kept:
+                if self._kept[key] != tensor.name:
+                    self.aliases[tensor.name] = self._kept[key]
+                return
+            self._kept[key] = tensor.name
+        if self._file_handle is not None and tensor.HasField('raw_data') \
+                and len(tensor.raw_data) >= self._size_threshold:
+            offset = self._file_handle.tell()
+            self._file_handle.write(tensor.raw_data)
+            set_external_data(tensor, self._location, offset=offset, length=len(tensor.raw_data))
+            tensor.data_location = TensorProto.EXTERNAL
+            tensor.ClearField('raw_data')
+        super(_InitializerWriter, self).append(tensor)
+
+    def extend(self, tensors):
+        for tensor in tensors:
+            self.append(tensor)
+
+    def resolve_aliases(self, nodes, inputs):
+        """Rename node inputs referring to merged initializers and return the graph
+        inputs without them"""
+        if not self.aliases:
+            return inputs
+        for node in nodes:
+            for i, name in enumerate(node.input):
+                if name in self.aliases:
+                    node.input[i] = self.aliases[name]
+        return [i for i in inputs if i.name not in self.aliases]
+
+
 class MXNetGraph(object):
     """Class to convert MXNet to ONNX graph"""
     registry_ = {}
@@ -63,6 +143,14 @@ class MXNetGraph(object):
         self.nodes = []
         self.input_tensors = []
         self.output_tensors = []
+        # seconds spent in each phase of the last export
+        self.phase_times = OrderedDict()
+
+    def _end_phase(self, phase, tic):
+        """Record the time spent in `phase` since `tic` and return the current time"""
+        toc = time.time()
+        self.phase_times[phase] = self.phase_times.get(phase, 0.) + toc - tic
+        return toc
 
     @staticmethod
     def register(op_name):
@@ -159,7 +247,8 @@ class MXNetGraph(object):
         return dict([(k.replace("arg:", "").replace("aux:", ""), v.asnumpy())
                      for k, v in weights_dict.items()])
 
-    def create_onnx_graph_proto(self, sym, params, in_shape, in_type, verbose=False, opset_version=None):
+    def create_onnx_graph_proto(self, sym, params, in_shape, in_type, verbose=False, opset_version=None,
+                                external_data_path=None, external_data_threshold=1024, deduplicate=True):
         """Convert MXNet graph to ONNX graph
 
         Parameters
@@ -176,6 +265,13 @@ class MXNetGraph(object):
             If true will print logs of the model conversion
         opset_version : Int
             ONNX opset version to use for export, defaults to latest supported by onnx package
+        external_data_path : str
+            If set, initializers of at least `external_data_threshold` bytes are written
+            to this file instead of being embedded in the graph
+        external_data_threshold : int
+            Size in bytes from which initializers are stored as external data
+        deduplicate : Boolean
+            If true, initializers holding identical tensors are stored once
 
         Returns
         -------
@@ -183,8 +279,6 @@ class MXNetGraph(object):
             ONNX graph
         """
         try:
-            from onnx import (checker, helper, NodeProto, ValueInfoProto, TensorProto)
-            from onnx.helper import make_tensor_value_info
             from onnx.defs import onnx_opset_version
         except ImportError:
             raise ImportError("Onnx and protobuf need to be installed. "
@@ -193,6 +287,8 @@ class MXNetGraph(object):
         if opset_version is None:
             opset_version = onnx_opset_version()
 
+        self.phase_times = OrderedDict()
+        tic = time.time()
         # When MXNet model is saved to json file , MXNet adds a node for label.
         # The name of this node is, name of the last node + "_label" ( i.e if last node
         # name is "Softmax", this node will have a name "Softmax_label". Also, the new node
@@ -200,11 +296,32 @@ class MXNetGraph(object):
         # Deriving the output_label name.
         output_label = sym.get_internals()[len(sym.get_internals()) - 1].name + "_label"
 
-        weights = MXNetGraph.convert_weights_to_numpy(params)
+        # weights are converted to numpy one at a time, when their node is converted
+        weights = _NumpyWeights(params)
 
         mx_graph = json.loads(sym.tojson())["nodes"]
 
-        initializer = []
+        if external_data_path is not None:
+            data_file = open(external_data_path, 'wb')
+            location = os.path.basename(external_data_path)
+        else:
+            data_file, location = None, None
+        try:
+            graph = self._convert_graph(mx_graph, sym, params, weights, in_shape, in_type,
+                                        output_label, verbose, opset_version, tic,
+                                        _InitializerWriter(data_file, location,
+                                                           external_data_threshold, deduplicate))
+        finally:
+            if data_file is not None:
+                data_file.close()
+        return graph
+
+    def _convert_graph(self, mx_graph, sym, params, weights, in_shape, in_type, output_label,
+                       verbose, opset_version, tic, initializer):
+        """Convert the nodes of `mx_graph`, streaming initializers to `initializer`"""
+        from onnx import (checker, helper, NodeProto, ValueInfoProto, TensorProto)
+        from onnx.helper import make_tensor_value_info
+
         all_processed_nodes = []
         onnx_processed_nodes = []
         onnx_processed_inputs = []
@@ -214,6 +331,7 @@ class MXNetGraph(object):
         # Determine output and internal shapes
         graph_outputs = MXNetGraph.get_outputs(sym, params, in_shape, output_label)
         graph_shapes = MXNetGraph.get_outputs(sym.get_internals(), params, in_shape, output_label, verbose=False)
+        tic = self._end_phase('infer_shape', tic)
 
         graph_input_idx = 0
         for idx, node in enumerate(mx_graph):
@@ -307,6 +425,9 @@ class MXNetGraph(object):
                     index_lookup.append(len(converted) - 1)
             else:
                 logging.info("Operator converter function should always return a list")
+        onnx_processed_inputs = initializer.resolve_aliases(onnx_processed_nodes,
+                                                            onnx_processed_inputs)
+        tic = self._end_phase('convert', tic)
 
         graph = helper.make_graph(
             onnx_processed_nodes,
@@ -318,4 +439,5 @@ class MXNetGraph(object):
         graph.initializer.extend(initializer)
 
         checker.check_graph(graph)
+        self._end_phase('check', tic)
         return graph
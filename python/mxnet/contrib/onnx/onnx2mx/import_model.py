@@ -19,9 +19,9 @@
 """Functions for importing ONNX models to MXNet and for checking metadata"""
 # pylint: disable=no-member
 
-from .import_onnx import GraphProto
+from .import_onnx import GraphProto, load_model_proto
 
-def import_model(model_file):
+def import_model(model_file, cache_dir=None):
     """Imports the ONNX model file, passed as a parameter, into MXNet symbol and parameters.
     Operator support and coverage -
     https://cwiki.apache.org/confluence/display/MXNET/ONNX+Operator+Coverage
@@ -30,6 +30,9 @@ def import_model(model_file):
     ----------
     model_file : str
         ONNX model file name
+    cache_dir : str, optional
+        If set, the translated symbol is cached in this directory, keyed by a hash of
+        the model graph, so that importing the same model again skips the translation.
 
     Returns
     -------
@@ -47,17 +50,13 @@ def import_model(model_file):
     This method is available when you ``import mxnet.contrib.onnx``
 
     """
-    graph = GraphProto()
-
-    try:
-        import onnx
-    except ImportError:
-        raise ImportError("Onnx and protobuf need to be installed. "
-                          + "Instructions to install - https://github.com/onnx/onnx")
-    # loads model file and returns ONNX protobuf object
-    model_proto = onnx.load_model(model_file)
+    # loads model file and returns ONNX protobuf object, external data is read
+    # directly into the parameters
+    model_proto, model_dir = load_model_proto(model_file)
+    graph = GraphProto(model_dir)
     model_opset_version = max([x.version for x in model_proto.opset_import])
-    sym, arg_params, aux_params = graph.from_onnx(model_proto.graph, opset_version=model_opset_version)
+    sym, arg_params, aux_params = graph.from_onnx(model_proto.graph, opset_version=model_opset_version,
+                                                  cache_dir=cache_dir)
     return sym, arg_params, aux_params
 
 def get_model_metadata(model_file):
@@ -83,12 +82,6 @@ def get_model_metadata(model_file):
           'output_tensor_data' : list of tuples representing the shape of the output of the model
     """
     graph = GraphProto()
-
-    try:
-        import onnx
-    except ImportError:
-        raise ImportError("Onnx and protobuf need to be installed. "
-                          + "Instructions to install - https://github.com/onnx/onnx")
-    model_proto = onnx.load_model(model_file)
+    model_proto, _ = load_model_proto(model_file)
     metadata = graph.get_graph_metadata(model_proto.graph)
     return metadata
@@ -18,17 +18,53 @@
 # coding: utf-8
 # pylint: disable=invalid-name,too-many-locals,no-self-use
 """ Support import export formats."""
+import hashlib
+import os
+import sys
+import uuid
 import numpy as np
 from .... import symbol
 from .... import ndarray as nd
 from ....base import string_types
+from ....libinfo import __version__
 from ._import_helper import _convert_map as convert_map
 
+# initializers up to this many elements may be read by the operator translations
+# (e.g. shapes or pads), so their values are part of the translation cache key
+_CACHE_KEY_MAX_ELEMENTS = 1024
+
+
+def load_model_proto(model_file):
+    """Load an ONNX model without reading its external data. The external data is
+    read by `GraphProto` directly into the parameters.
+
+    Parameters
+    ----------
+    model_file : str
+        ONNX model file name
+
+    Returns
+    -------
+    model_proto : onnx.ModelProto
+        The loaded model
+    model_dir : str
+        Directory the external data locations are relative to
+    """
+    try:
+        import onnx
+    except ImportError:
+        raise ImportError("Onnx and protobuf need to be installed. "
+                          + "Instructions to install - https://github.com/onnx/onnx")
+    model_proto = onnx.load_model(model_file, load_external_data=False)
+    return model_proto, os.path.dirname(os.path.abspath(model_file))
+
+
 class GraphProto(object): # pylint: disable=too-few-public-methods
     """A helper class for handling mxnet symbol copying from pb2.GraphProto.
     Definition: https://github.com/onnx/onnx/blob/master/onnx/onnx.proto
     """
-    def __init__(self):
+    def __init__(self, model_dir=None):
+        self._model_dir = model_dir
         self._nodes = {}
         self._params = {}
         self._num_input = 0
@@ -73,13 +109,39 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
             return mxnet_sym
         return op_name
 
-    def from_onnx(self, graph, opset_version):
+    def _graph_signature(self, graph):
+        """Hash of everything the translation of `graph` depends on."""
+        sha = hashlib.sha1('{}:{}'.format(__version__, self.opset_version).encode('utf-8'))
+        for proto in list(graph.input) + list(graph.output) + list(graph.node):
+            sha.update(proto.SerializeToString())
+        for init_tensor in graph.initializer:
+            param = self._params[init_tensor.name]
+            sha.update('{}:{}:{}'.format(init_tensor.name, param.dtype, param.shape).encode('utf-8'))
+            if param.size <= _CACHE_KEY_MAX_ELEMENTS:
+                sha.update(param.asnumpy().tobytes())
+        return sha.hexdigest()
+
+    def _split_params(self, sym):
+        """Split params into the args and aux params of `sym`, sharing the arrays."""
+        for args in sym.list_arguments():
+            if args in self._params:
+                self.arg_dict[args] = self._params[args]
+        for aux in sym.list_auxiliary_states():
+            if aux in self._params:
+                self.aux_dict[aux] = self._params[aux]
+
+    def from_onnx(self, graph, opset_version, cache_dir=None):
         """Construct symbol from onnx graph.
 
         Parameters
         ----------
         graph : onnx protobuf object
             The loaded onnx graph
+        opset_version : int
+            Opset version of the model
+        cache_dir : str, optional
+            If set, translated symbols are cached in this directory, keyed by a hash
+            of the graph, and reused by later imports of the same graph
 
         Returns
         -------
@@ -97,6 +159,14 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
                 raise ValueError("Tensor's name is required.")
             self._params[init_tensor.name] = self._parse_array(init_tensor)
 
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = os.path.join(cache_dir, self._graph_signature(graph) + '-symbol.json')
+            if os.path.isfile(cache_file):
+                out = symbol.load(cache_file)
+                self._split_params(out)
+                return out, self.arg_dict, self.aux_dict
+
         # converting GraphProto message
         for i in graph.input:
             if i.name in self._params:
@@ -120,12 +190,7 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
                 self._nodes[k] = mxnet_sym[i]
 
             # splitting params into args and aux params
-            for args in mxnet_sym.list_arguments():
-                if args in self._params:
-                    self.arg_dict.update({args: nd.array(self._params[args])})
-            for aux in mxnet_sym.list_auxiliary_states():
-                if aux in self._params:
-                    self.aux_dict.update({aux: nd.array(self._params[aux])})
+            self._split_params(mxnet_sym)
 
         # now return the outputs
         out = [self._nodes[i.name] for i in graph.output]
@@ -133,6 +198,14 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
             out = symbol.Group(out)
         else:
             out = out[0]
+        if cache_file is not None:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, exist_ok=True)
+            # write to a temporary file first so that concurrent imports never
+            # read a partially written symbol
+            tmp_file = '{}.{}.tmp'.format(cache_file, uuid.uuid4().hex)
+            out.save(tmp_file)
+            os.replace(tmp_file, cache_file)
         return out, self.arg_dict, self.aux_dict
 
     def get_graph_metadata(self, graph):
@@ -158,7 +231,7 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
                    }
         return metadata
 
-    def graph_to_gluon(self, graph, ctx, opset_version):
+    def graph_to_gluon(self, graph, ctx, opset_version, cache_dir=None, static_alloc=True):
         """Construct SymbolBlock from onnx graph.
 
         Parameters
@@ -167,14 +240,20 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
             The loaded onnx graph
         ctx : Context or list of Context
             Loads the model into one or many context(s).
+        opset_version : int
+            Opset version of the model
+        cache_dir : str, optional
+            Directory used to cache translated symbols, see `from_onnx`
+        static_alloc : bool
+            Whether to hybridize the returned block with static memory allocation
 
         Returns
         -------
         sym_block :gluon.nn.SymbolBlock
             The returned gluon SymbolBlock
         """
-        sym, arg_params, aux_params = self.from_onnx(graph, opset_version)
-        metadata = self.get_graph_metadata(graph)
+        sym, arg_params, aux_params = self.from_onnx(graph, opset_version, cache_dir)
+        metadata = self.model_metadata
         data_names = [input_tensor[0] for input_tensor in metadata['input_tensor_data']]
         data_inputs = [symbol.var(data_name) for data_name in data_names]
 
@@ -189,21 +268,41 @@ class GraphProto(object): # pylint: disable=too-few-public-methods
             if param in net_params:
                 net_params[param].shape = aux_params[param].shape
                 net_params[param]._load_init(aux_params[param], ctx=ctx)
+        if static_alloc:
+            net.hybridize(static_alloc=True)
         return net
 
     def _parse_array(self, tensor_proto):
-        """Grab data in TensorProto and convert to numpy array."""
+        """Grab data in TensorProto and convert to NDArray.
+
+        Raw and external data are viewed in place, so that the only copy is the one
+        into the NDArray."""
         try:
+            from onnx import TensorProto
+            from onnx.mapping import TENSOR_TYPE_TO_NP_TYPE
             from onnx.numpy_helper import to_array
         except ImportError:
             raise ImportError("Onnx and protobuf need to be installed. "
                               + "Instructions to install - https://github.com/onnx/onnx")
-        if len(tuple(tensor_proto.dims)) > 0:
-            np_array = to_array(tensor_proto).reshape(tuple(tensor_proto.dims))
+        # If onnx's params are scalar values without dims mentioned.
+        shape = tuple(tensor_proto.dims) or (1,)
+        dtype = TENSOR_TYPE_TO_NP_TYPE[tensor_proto.data_type]
+        if tensor_proto.data_location == TensorProto.EXTERNAL:
+            np_array = self._map_external_data(tensor_proto, dtype, shape)
+        elif tensor_proto.HasField('raw_data') and sys.byteorder == 'little':
+            np_array = np.frombuffer(tensor_proto.raw_data, dtype=dtype).reshape(shape)
         else:
-            # If onnx's params are scalar values without dims mentioned.
-            np_array = np.array([to_array(tensor_proto)])
-        return nd.array(np_array)
+            np_array = to_array(tensor_proto).reshape(shape)
+        return nd.array(np_array, dtype=np_array.dtype)
+
+    def _map_external_data(self, tensor_proto, dtype, shape):
+        """Memory map the external data of `tensor_proto`."""
+        info = {entry.key: entry.value for entry in tensor_proto.external_data}
+        location = info['location']
+        if self._model_dir is not None:
+            location = os.path.join(self._model_dir, location)
+        return np.memmap(location, dtype=dtype, mode='r',
+                         offset=int(info.get('offset', 0)), shape=shape)
 
     def _parse_attr(self, attr_proto):
         """Convert a list of AttributeProto to a dict, with names as keys."""
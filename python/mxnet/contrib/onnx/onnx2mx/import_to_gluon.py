@@ -19,9 +19,9 @@
 """Import ONNX model to gluon interface"""
 # pylint: disable=no-member
 
-from .import_onnx import GraphProto
+from .import_onnx import GraphProto, load_model_proto
 
-def import_to_gluon(model_file, ctx):
+def import_to_gluon(model_file, ctx, cache_dir=None, static_alloc=True):
     """
     Imports the ONNX model files, passed as a parameter, into Gluon SymbolBlock object.
 
@@ -31,6 +31,11 @@ def import_to_gluon(model_file, ctx):
         ONNX model file name
     ctx : Context or list of Context
         Loads the model into one or many context(s).
+    cache_dir : str, optional
+        If set, the translated symbol is cached in this directory, keyed by a hash of
+        the model graph, so that importing the same model again skips the translation.
+    static_alloc : bool
+        Whether the returned block is hybridized with static memory allocation.
 
     Returns
     -------
@@ -42,13 +47,9 @@ def import_to_gluon(model_file, ctx):
     This method is available when you ``import mxnet.contrib.onnx``
 
     """
-    graph = GraphProto()
-    try:
-        import onnx
-    except ImportError:
-        raise ImportError("Onnx and protobuf need to be installed. Instructions to"
-                          + " install - https://github.com/onnx/onnx#installation")
-    model_proto = onnx.load_model(model_file)
+    model_proto, model_dir = load_model_proto(model_file)
+    graph = GraphProto(model_dir)
     model_opset_version = max([x.version for x in model_proto.opset_import])
-    net = graph.graph_to_gluon(model_proto.graph, ctx, model_opset_version)
+    net = graph.graph_to_gluon(model_proto.graph, ctx, model_opset_version,
+                               cache_dir=cache_dir, static_alloc=static_alloc)
     return net
@@ -0,0 +1,458 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# coding: utf-8
+"""Post-training INT8 quantization of Gluon HybridBlocks."""
+__all__ = ['quantize_net']
+
+import ctypes
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import uuid
+import numpy as np
+
+from ..base import _LIB, check_call, c_str, c_array, c_str_array, mx_uint, SymbolHandle, py_str
+from ..context import cpu, Context
+from .. import ndarray
+from ..symbol import Symbol
+from .. import symbol
+from ..util import is_np_array
+
+
+def _quantize_symbol(sym, ctx, excluded_symbols=None, excluded_operators=None,
+                     offline_params=None, quantized_dtype='int8', quantize_mode='full',
+                     quantize_granularity='tensor-wise'):
+    """Replace the FP32 operators of `sym` with their quantized counterparts.
+
+    Returns the quantized symbol and the names of the tensors to calibrate.
+    """
+    excluded_symbols = excluded_symbols or []
+    excluded_operators = excluded_operators or []
+    offline_params = offline_params or []
+
+    out = SymbolHandle()
+    size = mx_uint()
+    calib_str = ctypes.POINTER(ctypes.c_char_p)()
+    check_call(_LIB.MXQuantizeSymbol(sym.handle,
+                                     ctypes.byref(out),
+                                     ctypes.byref(ctypes.c_int(ctx.device_typeid)),
+                                     mx_uint(len(excluded_symbols)),
+                                     c_str_array(excluded_symbols),
+                                     mx_uint(len(excluded_operators)),
+                                     c_str_array(excluded_operators),
+                                     mx_uint(len(offline_params)),
+                                     c_array(ctypes.c_char_p, [c_str(k) for k in offline_params]),
+                                     c_str(quantized_dtype),
+                                     ctypes.c_bool(True),
+                                     c_str(quantize_mode),
+                                     c_str(quantize_granularity),
+                                     ctypes.byref(size),
+                                     ctypes.byref(calib_str)))
+    calib_layers = [py_str(calib_str[i]) for i in range(size.value)]
+    return Symbol(out), calib_layers
+
+
+def _calibrate_quantized_sym(qsym, th_dict):
+    """Set the calibrated ranges in `th_dict` as attributes of the quantized nodes."""
+    if not th_dict:
+        return qsym
+    names = list(th_dict.keys())
+    calibrated_sym = SymbolHandle()
+    check_call(_LIB.MXSetCalibTableToQuantizedSymbol(qsym.handle,
+                                                     mx_uint(len(names)),
+                                                     c_str_array(names),
+                                                     c_array(ctypes.c_float,
+                                                             [th_dict[k][0] for k in names]),
+                                                     c_array(ctypes.c_float,
+                                                             [th_dict[k][1] for k in names]),
+                                                     ctypes.byref(calibrated_sym)))
+    return Symbol(calibrated_sym)
+
+
+def _quantize_params(qsym, params, th_dict):
+    """Quantize the weights consumed offline by `qsym` and collect its other params."""
+    quantized_params = {}
+    for name in qsym.list_arguments() + qsym.list_auxiliary_states():
+        if name.endswith(('weight_quantize', 'bias_quantize')):
+            param = params[name[:-len('_quantize')]]
+            # pylint: disable=unbalanced-tuple-unpacking
+            val, vmin, vmax = ndarray.contrib.quantize(data=param,
+                                                       min_range=ndarray.min(param),
+                                                       max_range=ndarray.max(param),
+                                                       out_type='int8')
+            quantized_params[name] = val
+            quantized_params[name + '_min'] = vmin
+            quantized_params[name + '_max'] = vmax
+        elif name in params:
+            quantized_params[name] = params[name]
+        elif name.endswith('_min') and name[:-len('_min')] in th_dict:
+            quantized_params[name] = ndarray.array([th_dict[name[:-len('_min')]][0]])
+        elif name.endswith('_max') and name[:-len('_max')] in th_dict:
+            quantized_params[name] = ndarray.array([th_dict[name[:-len('_max')]][1]])
+    return quantized_params
+
+
+class _LayerOutputMinMaxCollector(object):
+    """Track the min and max value of every layer output to calibrate."""
+    def __init__(self, include_layers, logger=None):
+        self.include_layers = set(include_layers)
+        self.min_max_dict = {}
+        self.logger = logger
+        self._seen = set()
+
+    def new_batch(self):
+        """Start collecting a new batch."""
+        self._seen.clear()
+
+    def _min_max(self, name, arr):
+        """Min and max of `arr`, or None if `name` is not calibrated or already seen."""
+        if name not in self.include_layers or name in self._seen:
+            return None
+        # with monitor_all, an input tensor is reported once per consumer
+        self._seen.add(name)
+        min_max = ndarray.concat(ndarray.min(arr).reshape((1,)),
+                                 ndarray.max(arr).reshape((1,)), dim=0).asnumpy()
+        return float(min_max[0]), float(min_max[1])
+
+    def collect(self, name, op_name, arr):  # pylint: disable=unused-argument
+        """Callback collecting the range of the layer outputs."""
+        min_max = self._min_max(name, arr)
+        if min_max is None:
+            return
+        if name in self.min_max_dict:
+            cur_min, cur_max = self.min_max_dict[name]
+            min_max = (min(cur_min, min_max[0]), max(cur_max, min_max[1]))
+        self.min_max_dict[name] = min_max
+
+    def thresholds(self):
+        """Return the calibrated range of every collected layer."""
+        if self.logger:
+            for name, (min_val, max_val) in self.min_max_dict.items():
+                self.logger.debug('layer=%s, min_val=%f, max_val=%f', name, min_val, max_val)
+        return dict(self.min_max_dict)
+
+
+class _LayerHistogramCollector(_LayerOutputMinMaxCollector):
+    """Accumulate a histogram of every layer output to calibrate.
+
+    The histograms stay on the device of the layer outputs and are merged batch by
+    batch, only the min and max of each output are copied to the host. When an output
+    exceeds the current range, the histogram is widened by whole bins of the same
+    width, so that the counts collected so far stay aligned."""
+    def __init__(self, include_layers, quantized_dtype='int8', num_bins=8001, logger=None):
+        super(_LayerHistogramCollector, self).__init__(include_layers, logger)
+        self.quantized_dtype = quantized_dtype
+        self.num_bins = num_bins
+        self.hist_dict = {}
+
+    def collect(self, name, op_name, arr):  # pylint: disable=unused-argument
+        """Callback collecting the histogram of the layer outputs."""
+        min_max = self._min_max(name, arr)
+        if min_max is None:
+            return
+        min_val, max_val = min_max
+        th = max(abs(min_val), abs(max_val), 1e-8)
+        if name not in self.hist_dict:
+            hist, _ = ndarray.histogram(arr, bins=self.num_bins, range=(-th, th))
+            self.hist_dict[name] = (hist, min_val, max_val, th)
+            return
+        old_hist, old_min, old_max, old_th = self.hist_dict[name]
+        old_num_bins = old_hist.shape[0]
+        if th <= old_th:
+            hist, _ = ndarray.histogram(arr, bins=old_num_bins, range=(-old_th, old_th))
+            hist = old_hist + hist
+        else:
+            old_step = 2 * old_th / old_num_bins
+            half_increased_bins = int((th - old_th) // old_step + 1)
+            new_num_bins = old_num_bins + 2 * half_increased_bins
+            th = old_th + half_increased_bins * old_step
+            hist, _ = ndarray.histogram(arr, bins=new_num_bins, range=(-th, th))
+            padding = ndarray.zeros((half_increased_bins,), ctx=old_hist.context,
+                                    dtype=old_hist.dtype)
+            hist = hist + ndarray.concat(padding, old_hist, padding, dim=0)
+            old_th = th
+        self.hist_dict[name] = (hist, min(old_min, min_val), max(old_max, max_val), old_th)
+
+    def thresholds(self):
+        """Return the range minimizing the KL divergence of every collected layer."""
+        num_quantized_bins = 255
+        th_dict = {}
+        for name, (hist, min_val, max_val, th) in self.hist_dict.items():
+            num_bins = hist.shape[0]
+            hist_edges = ndarray.array(np.linspace(-th, th, num_bins + 1), ctx=cpu())
+            threshold, divergence = ndarray.contrib.calibrate_entropy(
+                hist=hist.astype('float32').as_in_context(cpu()), hist_edges=hist_edges,
+                num_quantized_bins=num_quantized_bins)
+            threshold = float(threshold.asscalar())
+            if min_val >= 0 and self.quantized_dtype in ['auto', 'uint8']:
+                th_dict[name] = (0., threshold)
+            else:
+                th_dict[name] = (-threshold, threshold)
+            if self.logger:
+                self.logger.debug('layer=%s, min_val=%f, max_val=%f, th=%f, divergence=%f',
+                                  name, min_val, max_val, threshold,
+                                  float(divergence.asscalar()))
+        return th_dict
+
+
+def _as_inputs(batch, num_inputs, ctx):
+    """Select the network inputs of a calibration batch."""
+    if not isinstance(batch, (list, tuple)):
+        batch = [batch]
+    return [x.as_in_context(ctx) for x in batch[:num_inputs]]
+
+
+def _infer_num_inputs(network, batch):
+    """Number of network inputs in a calibration batch when no `data_shapes` are given:
+    a single array is one input, the leading entries of a list are matched against the
+    required positional arguments of `network.forward`."""
+    if not isinstance(batch, (list, tuple)):
+        return 1
+    params = inspect.signature(network.forward).parameters.values()
+    if any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in params):
+        raise ValueError('Cannot infer the number of inputs of {} from its forward '
+                         'signature, pass data_shapes'.format(type(network).__name__))
+    num_inputs = sum(1 for p in params if p.default is inspect.Parameter.empty and
+                     p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                inspect.Parameter.POSITIONAL_OR_KEYWORD))
+    if num_inputs < 1 or num_inputs > len(batch):
+        raise ValueError('{} takes {} inputs but calibration batches have {} entries, '
+                         'pass data_shapes'.format(type(network).__name__, num_inputs,
+                                                   len(batch)))
+    return num_inputs
+
+
+_HYBRID_STATE = ('_active', '_flags', '_partition_if_dynamic', '_cached_graph',
+                 '_cached_op', '_cached_op_args', '_first_forward')
+
+
+@contextlib.contextmanager
+def _preserve_hybrid_state(network):
+    """Restore the hybridization flags and cached graphs of `network` and its children
+    on exit, so that hybridizing it for export leaves the caller's network as it was."""
+    states = []
+    def _save(block):
+        # lists are copied as building the cache extends them, other values are kept
+        states.append((block, {k: list(v) if isinstance(v, list) else v
+                               for k, v in block.__dict__.items() if k in _HYBRID_STATE}))
+    network.apply(_save)
+    try:
+        yield
+    finally:
+        for block, state in states:
+            block.__dict__.update(state)
+
+
+def _calib_cache_key(sym, params, first_batch, settings):
+    """Hash identifying a calibration table: the model, its weights, the first
+    calibration batch and the calibration settings."""
+    sha = hashlib.sha1(sym.tojson().encode('utf-8'))
+    for name in sorted(params):
+        sha.update(name.encode('utf-8'))
+        sha.update(params[name].asnumpy().tobytes())
+    for x in first_batch:
+        sha.update(str(x.shape).encode('utf-8'))
+        sha.update(x.asnumpy().tobytes())
+    sha.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def _make_block(sym, data_names, params, ctx):
+    """Create a SymbolBlock running `sym` with `params`."""
+    from ..gluon import SymbolBlock
+    if is_np_array():
+        inputs = [symbol.var(name).as_np_ndarray() for name in data_names]
+        params = {k: v.as_np_ndarray() for k, v in params.items()}
+    else:
+        inputs = [symbol.var(name) for name in data_names]
+    net = SymbolBlock(sym, inputs)
+    net.load_dict(params, ctx=ctx, cast_dtype=True, dtype_source='saved')
+    return net
+
+
+def quantize_net(network, quantized_dtype='auto', quantize_mode='full',
+                 quantize_granularity='tensor-wise', exclude_layers=None,
+                 exclude_operators=None, calib_data=None, data_shapes=None,
+                 calib_mode='entropy', num_calib_samples=None, num_bins=8001,
+                 calib_cache_dir=None, backend=None, ctx=None, logger=None):
+    """Quantize a Gluon HybridBlock to INT8 and return it as a hybridized SymbolBlock.
+
+    The network is exported to a symbol, its supported operators are replaced by
+    quantized ones, and the ranges of the quantized tensors are calibrated by running
+    the FP32 network on `calib_data`. Batches are consumed one at a time, up to
+    `num_calib_samples` samples, and per-layer statistics are merged into running
+    min/max values or histograms on `ctx`, so the calibration set never has to fit
+    in memory.
+
+    Parameters
+    ----------
+    network : HybridBlock
+        FP32 network to quantize.
+    quantized_dtype : str
+        Type of the quantized tensors: 'int8', 'uint8', or 'auto' to pick the type
+        from the calibrated ranges.
+    quantize_mode : str
+        'full' quantizes all supported operators, 'smart' skips operators that would
+        not benefit from it.
+    quantize_granularity : str
+        'tensor-wise' or 'channel-wise' quantization of the weights.
+    exclude_layers : list of str, optional
+        Names of the nodes of the exported symbol to keep in FP32.
+    exclude_operators : list of str, optional
+        Names of operators to keep in FP32.
+    calib_data : DataLoader or iterable, optional
+        Calibration batches. Each batch is either an input array or a list whose first
+        entries are the network inputs. Without `data_shapes`, the number of inputs is
+        the number of required positional arguments of `network.forward`.
+    data_shapes : list of tuple, optional
+        Shapes of the network inputs, used to export the network when `calib_data`
+        is not given.
+    calib_mode : str
+        'none' for no calibration (ranges are computed at runtime), 'naive' for the
+        min/max of the layer outputs, 'entropy' for the thresholds minimizing the KL
+        divergence between the FP32 and quantized distributions.
+    num_calib_samples : int, optional
+        Maximum number of samples used for calibration, all of `calib_data` by default.
+    num_bins : int
+        Number of histogram bins collected per layer for 'entropy' calibration.
+    calib_cache_dir : str, optional
+        If set, calibration tables are saved in this directory, keyed by a hash of the
+        model, its weights, the first calibration batch and the settings, and reused
+        instead of running the calibration again.
+    backend : str, optional
+        Subgraph backend applied before and after quantization, e.g. 'MKLDNN_QUANTIZE'.
+    ctx : Context
+        Context to calibrate and run the quantized network on, `cpu()` by default.
+    logger : logging.Logger, optional
+        Logger for calibration progress.
+
+    Returns
+    -------
+    SymbolBlock
+        The quantized network, hybridized with static memory allocation.
+    """
+    from ..gluon import HybridBlock
+    if not isinstance(network, HybridBlock):
+        raise TypeError('quantize_net expects a HybridBlock, got {}'.format(type(network)))
+    if calib_mode not in ('none', 'naive', 'entropy'):
+        raise ValueError('Unknown calib_mode {}, expected one of none, naive, '
+                         'entropy'.format(calib_mode))
+    if quantized_dtype not in ('int8', 'uint8', 'auto'):
+        raise ValueError('Unknown quantized_dtype {}, expected one of int8, uint8, '
+                         'auto'.format(quantized_dtype))
+    if calib_mode != 'none' and calib_data is None:
+        raise ValueError('calib_data must be provided when calib_mode={}'.format(calib_mode))
+    if calib_data is None and data_shapes is None:
+        raise ValueError('Either calib_data or data_shapes must be provided')
+    ctx = cpu() if ctx is None else ctx
+    if not isinstance(ctx, Context):
+        raise ValueError('ctx must be a Context, got {}'.format(type(ctx)))
+
+    calib_iter = iter(calib_data) if calib_data is not None else None
+    if calib_iter is not None:
+        first_batch = next(calib_iter)
+        num_inputs = _infer_num_inputs(network, first_batch) if data_shapes is None \
+            else len(data_shapes)
+        first_batch = _as_inputs(first_batch, num_inputs, ctx)
+    else:
+        num_inputs = len(data_shapes)
+        first_batch = [ndarray.zeros(shape, ctx=ctx) for shape in data_shapes]
+        if is_np_array():
+            first_batch = [x.as_np_ndarray() for x in first_batch]
+    data_names = ['data'] if num_inputs == 1 else \
+        ['data{}'.format(i) for i in range(num_inputs)]
+
+    # export the FP32 graph, keeping the hybridization state of the caller's network
+    with _preserve_hybrid_state(network):
+        network.hybridize()
+        network(*first_batch)
+        sym, export_params = network.export(None)
+    params = {k[4:]: v.as_nd_ndarray() for k, v in export_params.items()}
+    arg_names = [k[4:] for k in export_params if k.startswith('arg:')]
+    if backend is not None:
+        sym = sym.get_backend_symbol(backend)
+
+    qsym, calib_layers = _quantize_symbol(sym, ctx, excluded_symbols=exclude_layers,
+                                          excluded_operators=exclude_operators,
+                                          offline_params=arg_names,
+                                          quantized_dtype=quantized_dtype,
+                                          quantize_mode=quantize_mode,
+                                          quantize_granularity=quantize_granularity)
+
+    th_dict = {}
+    if calib_mode != 'none':
+        cache_file = None
+        if calib_cache_dir is not None:
+            settings = {'calib_mode': calib_mode, 'num_calib_samples': num_calib_samples,
+                        'num_bins': num_bins, 'quantized_dtype': quantized_dtype,
+                        'quantize_mode': quantize_mode,
+                        'quantize_granularity': quantize_granularity,
+                        'exclude_layers': exclude_layers, 'exclude_operators': exclude_operators,
+                        'backend': backend}
+            key = _calib_cache_key(sym, params, first_batch, settings)
+            cache_file = os.path.join(calib_cache_dir, key + '-calib.json')
+            if os.path.isfile(cache_file):
+                with open(cache_file) as f:
+                    th_dict = {k: tuple(v) for k, v in json.load(f).items()}
+                if logger:
+                    logger.info('Loaded calibration table from %s', cache_file)
+
+        if not th_dict:
+            if calib_mode == 'entropy':
+                collector = _LayerHistogramCollector(calib_layers, quantized_dtype,
+                                                     num_bins, logger)
+            else:
+                collector = _LayerOutputMinMaxCollector(calib_layers, logger)
+            # calibrate on a copy of the FP32 graph, so that `network` keeps no hook
+            calib_net = _make_block(sym, data_names, params, ctx)
+            calib_net.hybridize()
+            calib_net.register_op_hook(collector.collect, monitor_all=True)
+            num_samples = 0
+            batch = first_batch
+            while batch is not None:
+                collector.new_batch()
+                calib_net(*batch)
+                num_samples += batch[0].shape[0]
+                if num_calib_samples is not None and num_samples >= num_calib_samples:
+                    break
+                batch = next(calib_iter, None)
+                if batch is not None:
+                    batch = _as_inputs(batch, num_inputs, ctx)
+            if logger:
+                logger.info('Collected statistics of %d layers from %d samples',
+                            len(calib_layers), num_samples)
+            th_dict = collector.thresholds()
+            if cache_file is not None:
+                os.makedirs(calib_cache_dir, exist_ok=True)
+                # write to a temporary file first so that concurrent runs never read
+                # a partially written table
+                tmp_file = '{}.{}.tmp'.format(cache_file, uuid.uuid4().hex)
+                with open(tmp_file, 'w') as f:
+                    json.dump(th_dict, f)
+                os.replace(tmp_file, cache_file)
+
+        qsym = _calibrate_quantized_sym(qsym, th_dict)
+
+    if backend is not None:
+        qsym = qsym.get_backend_symbol(backend)
+    qparams = _quantize_params(qsym, params, th_dict)
+    net = _make_block(qsym, data_names, qparams, ctx)
+    net.hybridize(static_alloc=True, static_shape=True)
+    return net
@@ -18,7 +18,213 @@
 # coding: utf-8
 """TensorBoard functions that can be used to log various status during epoch."""
 
+import atexit
 import logging
+import numbers
+import queue
+import threading
+import time
+
+import numpy as np
+
+from ..ndarray import NDArray
+from .. import ndarray as nd
+
+
+def _create_writer(logging_dir):
+    try:
+        from mxboard import SummaryWriter
+        return SummaryWriter(logging_dir)
+    except ImportError:
+        logging.error('You can install mxboard via `pip install mxboard`.')
+        return None
+
+
+def _to_host(value):
+    """Copies NDArrays to host memory, other values are returned as is."""
+    if isinstance(value, NDArray):
+        return value.asnumpy()
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_host(v) for v in value)
+    return value
+
+
+class AsyncSummaryWriter(object):
+    """Forwards logging calls to a summary writer from a background thread.
+
+    Calls are put in a bounded queue and return immediately. The background thread
+    copies NDArray arguments to host memory, which waits for their computation
+    without blocking the caller, calls the writer in batches and flushes it every
+    `flush_secs` seconds. Writers that are not closed explicitly are closed at
+    interpreter exit, so pending calls are not lost.
+
+    Parameters
+    ----------
+    writer : object
+        The summary writer, such as ``mxboard.SummaryWriter``.
+    max_queue : int
+        Maximum number of pending calls.
+    flush_secs : float
+        Interval between two flushes of the writer.
+    block : bool
+        Whether to wait for a free slot when the queue is full, otherwise the call
+        is dropped and counted in `dropped`.
+    """
+    def __init__(self, writer, max_queue=1024, flush_secs=10, block=False):
+        self.writer = writer
+        self.flush_secs = flush_secs
+        self.block = block
+        self.dropped = 0
+        self._queue = queue.Queue(max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='AsyncSummaryWriter')
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules ``fn(writer, *args, **kwargs)`` with NDArray arguments copied to host."""
+        if self._closed:
+            raise RuntimeError('AsyncSummaryWriter is closed')
+        try:
+            self._queue.put((fn, args, kwargs), block=self.block)
+        except queue.Full:
+            self.dropped += 1
+
+    def add_scalar(self, tag, value, global_step=None):
+        """Logs a scalar, `value` may be an NDArray with a single element."""
+        self.submit(_add_scalar, tag, value, global_step)
+
+    def add_histogram(self, tag, values, global_step=None, bins='default'):
+        """Logs the histogram of `values`, computed by the writer on the host."""
+        self.submit(_call, 'add_histogram', tag, values, global_step=global_step, bins=bins)
+
+    def _run(self):
+        last_flush = time.time()
+        while True:
+            timeout = max(self.flush_secs - (time.time() - last_flush), 0)
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # write everything that is already queued in one go
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for item in items:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    self._flush()
+                    last_flush = time.time()
+                    item.set()
+                else:
+                    fn, args, kwargs = item
+                    try:
+                        fn(self.writer, *_to_host(args),
+                           **{k: _to_host(v) for k, v in kwargs.items()})
+                    except Exception:  # pylint: disable=broad-except
+                        logging.exception('Failed to write summary with %s', fn)
+            if time.time() - last_flush >= self.flush_secs:
+                self._flush()
+                last_flush = time.time()
+            if stop:
+                self._flush()
+                return
+
+    def _flush(self):
+        if hasattr(self.writer, 'flush'):
+            self.writer.flush()
+
+    def flush(self):
+        """Waits until all pending calls are written and flushes the writer."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        """Writes the pending calls, stops the background thread and closes the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._thread.join()
+        if hasattr(self.writer, 'close'):
+            self.writer.close()
+
+
+def _call(writer, method, *args, **kwargs):
+    getattr(writer, method)(*args, **kwargs)
+
+
+def _add_scalar(writer, tag, value, global_step):
+    writer.add_scalar(tag, float(np.asarray(value).reshape(-1)[0]), global_step=global_step)
+
+
+def _add_histogram_summary(writer, tag, stats, counts, edges, global_step):
+    """Writes a histogram from the compact summary computed by :py:func:`summarize`.
+
+    The bin counts are written as they are, the values are never rebuilt on the host.
+    """
+    vmin, vmax, vsum, vsum_sq, num = stats.tolist()
+    counts = counts.astype(np.int64).tolist()
+    limits = edges[1:].tolist()
+    if hasattr(writer, 'add_histogram_raw'):
+        writer.add_histogram_raw(tag, min=vmin, max=vmax, num=int(num), sum=vsum,
+                                 sum_squares=vsum_sq, bucket_limits=limits,
+                                 bucket_counts=counts, global_step=global_step)
+    elif hasattr(writer, '_file_writer'):
+        # mxboard.SummaryWriter only builds histograms from values, write the
+        # histogram proto through its event file writer instead
+        from mxboard.proto.summary_pb2 import Summary, HistogramProto
+        histo = HistogramProto(min=vmin, max=vmax, num=num, sum=vsum, sum_squares=vsum_sq,
+                               bucket_limit=limits, bucket=counts)
+        writer._file_writer.add_summary(Summary(value=[Summary.Value(tag=tag, histo=histo)]),
+                                        global_step)
+    else:
+        raise TypeError('{} cannot write precomputed histograms'.format(type(writer)))
+    mean = vsum / num
+    writer.add_scalar(tag + '/mean', mean, global_step=global_step)
+    writer.add_scalar(tag + '/std', max(vsum_sq / num - mean * mean, 0) ** 0.5,
+                      global_step=global_step)
+
+
+def summarize(x, bins=30):
+    """Computes a compact summary of an array on its device.
+
+    Parameters
+    ----------
+    x : NDArray
+        The array to summarize.
+    bins : int
+        Number of equal-width bins between the minimum and maximum of `x`.
+
+    Returns
+    -------
+    stats : NDArray
+        float32 array of min, max, sum, sum of squares and number of elements.
+    counts : NDArray
+        Histogram counts, with `bins` elements.
+    edges : NDArray
+        Bin edges, with `bins` + 1 elements.
+    """
+    x = x.as_nd_ndarray().reshape((-1,)).astype('float32', copy=False)
+    vmin, vmax = nd.min(x), nd.max(x)
+    width = nd.maximum(vmax - vmin, 1e-12)
+    steps = nd.arange(bins, ctx=x.context) / bins
+    # the last edge is the maximum itself so that rounding cannot drop it
+    edges = nd.concat(nd.broadcast_add(vmin, nd.broadcast_mul(width, steps)),
+                      nd.maximum(vmax, vmin + width), dim=0)
+    counts, _ = nd.histogram(x, bins=edges)
+    stats = nd.concat(vmin, vmax, nd.sum(x), nd.sum(nd.square(x)),
+                      nd.full((1,), x.size, ctx=x.context), dim=0)
+    return stats, counts, edges
 
 
 class LogMetricsCallback(object):
@@ -36,6 +242,12 @@ class LogMetricsCallback(object):
         You might want to use this param to leverage TensorBoard plot feature,
         where TensorBoard plots different curves in one graph when they have same `name`.
         The follow example shows the usage(how to compare a train and eval metric in a same graph).
+    asynchronous : bool
+        Write events from a background thread through an :py:class:`AsyncSummaryWriter`
+        instead of blocking the training loop. Call :py:meth:`close` to write the
+        pending events, otherwise they are written at interpreter exit.
+    max_queue : int
+        Maximum number of pending events when `asynchronous` is set.
 
     Examples
     --------
@@ -53,13 +265,11 @@ class LogMetricsCallback(object):
     >>>     eval_end_callback  = eval_end_callbacks)
     >>> # Then use `tensorboard --logdir=logs/` to launch TensorBoard visualization.
     """
-    def __init__(self, logging_dir, prefix=None):
+    def __init__(self, logging_dir, prefix=None, asynchronous=True, max_queue=1024):
         self.prefix = prefix
-        try:
-            from mxboard import SummaryWriter
-            self.summary_writer = SummaryWriter(logging_dir)
-        except ImportError:
-            logging.error('You can install mxboard via `pip install mxboard`.')
+        self.summary_writer = _create_writer(logging_dir)
+        if asynchronous and self.summary_writer is not None:
+            self.summary_writer = AsyncSummaryWriter(self.summary_writer, max_queue=max_queue)
 
     def __call__(self, param):
         """Callback to log training speed and metrics in TensorBoard."""
@@ -70,3 +280,135 @@ class LogMetricsCallback(object):
             if self.prefix is not None:
                 name = '%s-%s' % (self.prefix, name)
             self.summary_writer.add_scalar(name, value, global_step=param.epoch)
+
+    def close(self):
+        """Write the pending events and close the event file."""
+        if self.summary_writer is not None:
+            self.summary_writer.close()
+
+
+class LogParamsCallback(object):
+    """Log histograms of parameters and their gradients periodically in TensorBoard.
+
+    Histograms, mean and standard deviation are computed on the device of each
+    parameter by :py:func:`summarize`. Only the bin counts and a few statistics are
+    copied to the host, by the background thread of an :py:class:`AsyncSummaryWriter`.
+
+    Parameters
+    ----------
+    logging_dir : str
+        TensorBoard event file directory.
+    params : dict of str to Parameter or NDArray
+        The arrays to log, e.g. ``net.collect_params()``. For a Parameter the data on
+        its first context is used.
+    interval : int
+        Number of steps between two summaries. Summaries cost a few device
+        operations per parameter, the default keeps them rare.
+    bins : int
+        Number of histogram bins.
+    log_grads : bool
+        Whether to also log the gradients of Parameters that have one.
+    prefix : str
+        Prefix of the histogram names.
+    max_queue : int
+        Maximum number of pending summaries, further summaries are dropped.
+
+    Examples
+    --------
+    >>> params_log = mx.contrib.tensorboard.LogParamsCallback('logs/params',
+    ...                                                       net.collect_params())
+    >>> for data, label in train_data:
+    ...     ...
+    ...     trainer.step(batch_size)
+    ...     params_log.step()
+    >>> params_log.close()
+    """
+    def __init__(self, logging_dir, params, interval=100, bins=30, log_grads=True,
+                 prefix=None, max_queue=1024):
+        self.params = params
+        self.interval = interval
+        self.bins = bins
+        self.log_grads = log_grads
+        self.prefix = prefix
+        self.num_steps = 0
+        writer = _create_writer(logging_dir)
+        self.summary_writer = AsyncSummaryWriter(writer, max_queue=max_queue) \
+            if writer is not None else None
+
+    def _log(self, name, x, global_step):
+        if self.prefix is not None:
+            name = '%s-%s' % (self.prefix, name)
+        stats, counts, edges = summarize(x, self.bins)
+        self.summary_writer.submit(_add_histogram_summary, name, stats, counts, edges,
+                                   global_step)
+
+    def step(self, global_step=None):
+        """Marks the end of a training step and logs the summaries if one is due.
+
+        Parameters
+        ----------
+        global_step : int
+            Step to log the summaries at, defaults to the number of calls.
+        """
+        self.num_steps += 1
+        if (self.num_steps - 1) % self.interval != 0:
+            return
+        global_step = self.num_steps if global_step is None else global_step
+        for name, param in self.params.items():
+            if isinstance(param, NDArray):
+                self._log(name, param, global_step)
+                continue
+            self._log(name, param.list_data()[0], global_step)
+            if self.log_grads and param.grad_req != 'null':
+                self._log(name + '_grad', param.list_grad()[0], global_step)
+
+    def __call__(self, param):
+        """Callback to log parameter summaries at the end of a batch."""
+        self.step()
+
+    def close(self):
+        """Write the pending summaries and close the event file."""
+        if self.summary_writer is not None:
+            self.summary_writer.close()
+
+
+class ThroughputSink(object):
+    """Writes the records of :py:class:`mxnet.callback.ThroughputMonitor` to TensorBoard.
+
+    Every numeric entry of a record is logged as a scalar named `prefix/entry`, with the
+    step count of the monitor as global step.
+
+    Parameters
+    ----------
+    logging_dir : str
+        TensorBoard event file directory.
+    prefix : str
+        Prefix of the scalar names.
+    asynchronous : bool
+        Write events from a background thread through an :py:class:`AsyncSummaryWriter`.
+    max_queue : int
+        Maximum number of pending events when `asynchronous` is set.
+
+    Examples
+    --------
+    >>> monitor = mx.callback.ThroughputMonitor(
+    ...     batch_size, sinks=[mx.contrib.tensorboard.ThroughputSink('logs/train')])
+    """
+    def __init__(self, logging_dir, prefix='throughput', asynchronous=True, max_queue=1024):
+        self.prefix = prefix
+        self.summary_writer = _create_writer(logging_dir)
+        if asynchronous and self.summary_writer is not None:
+            self.summary_writer = AsyncSummaryWriter(self.summary_writer, max_queue=max_queue)
+
+    def __call__(self, record):
+        """Log the numeric entries of a throughput record."""
+        for name, value in record.items():
+            if name in ('step', 'epoch', 'batch') or not isinstance(value, numbers.Number):
+                continue
+            self.summary_writer.add_scalar('%s/%s' % (self.prefix, name), value,
+                                           global_step=record['step'])
+
+    def close(self):
+        """Flush and close the event file."""
+        if self.summary_writer is not None:
+            self.summary_writer.close()
@@ -33,10 +33,19 @@ class Executor:
     >>> b = mx.sym.var('b')
     >>> c = 2 * a + b
     >>> texec = c._bind(mx.cpu(), {'a': mx.nd.array([1,2]), 'b':mx.nd.array([2,3])})
+
+    Argument arrays that are already on `ctx` and do not require gradient are bound
+    directly, without being copied, both at construction and in :py:meth:`forward`.
+    The executor never writes into such arrays; auxiliary states, which are updated
+    by the forward pass, are always copied.
     """
-    def __init__(self, sym, ctx, args, args_grad, grad_req, aux_states):
+    def __init__(self, sym, ctx, args, args_grad, grad_req, aux_states,
+                 static_alloc=False, static_shape=False):
+        assert static_alloc or not static_shape, \
+            "static_shape requires static_alloc to be enabled"
         self.outputs = None
         self._input_names = sym.list_inputs()
+        self._input_index = {name: i for i, name in enumerate(self._input_names)}
         self._aux_names = sym.list_auxiliary_states()
         self._arg_names = sym.list_arguments()
         self._output_names = sym.list_outputs()
@@ -59,55 +68,50 @@ class Executor:
 
         # args
         self._args = [None] * len(self._input_names)
+        # indices of the inputs whose array was allocated by the executor
+        self._owned = set()
         if isinstance(args, dict):
             for k, v in args.items():
-                try:
-                    i = self._input_names.index(k)
-                    self._args[i] = v.copyto(ctx)
+                i = self._input_index.get(k)
                 # ignore provided arg which is not present in
                 # input_names
-                except ValueError:
-                    pass
+                if i is not None:
+                    self._bind_input(i, k, v)
         else:
             assert isinstance(args, (list, tuple))
             for i, arg in enumerate(args):
                 name = self._arg_names[i]
-                index = self._input_names.index(name)
-                self._args[index] = arg.copyto(ctx)
+                self._bind_input(self._input_index[name], name, arg)
 
         # aux states
         if aux_states:
             if isinstance(aux_states, dict):
                 for k, v in aux_states.items():
                     if k in self._aux_names:
-                        i = self._input_names.index(k)
+                        i = self._input_index[k]
                         self._args[i] = v.copyto(ctx)
+                        self._owned.add(i)
             else:
                 assert isinstance(aux_states, (list, tuple))
                 for i, v in enumerate(aux_states):
-                    index = self._input_names.index(self._aux_names[i])
+                    index = self._input_index[self._aux_names[i]]
                     self._args[index] = v.copyto(ctx)
+                    self._owned.add(index)
 
         # arg grad
         if self._args_grad:
             if isinstance(self._args_grad, dict):
                 for k, g in self._args_grad.items():
-                    try:
-                        i = self._input_names.index(k)
-                        # get req
-                        if isinstance(grad_req, str):
-                            req = grad_req
-                        else:
-                            assert isinstance(grad_req, dict)
-                            req = grad_req[k]
-                        if req != 'null':
-                            with self._ctx:
-                                self._args[i].attach_grad(req, stype=g.stype)
-                                self._args[i].grad[:] = g
+                    i = self._input_index.get(k)
                     # ignore provided arg which is not present in
                     # input_names
-                    except ValueError:
-                        pass
+                    if i is None:
+                        continue
+                    req = self._get_grad_req(k)
+                    if req != 'null':
+                        with self._ctx:
+                            self._args[i].attach_grad(req, stype=g.stype)
+                            self._args[i].grad[:] = g
             else:
                 assert isinstance(self._args_grad, (list, tuple))
                 for i, g in enumerate(self._args_grad):
@@ -121,7 +125,27 @@ class Executor:
                         with self._ctx:
                             self._args[i].attach_grad(req, stype=g.stype)
                             self._args[i].grad[:] = g
-        self._cached_op = ndarray.CachedOp(sym)
+        flags = [('static_alloc', static_alloc), ('static_shape', static_shape)]
+        self._cached_op = ndarray.CachedOp(sym, flags)
+
+    def _get_grad_req(self, name):
+        """Return the gradient request of input `name`."""
+        if isinstance(self._grad_req, str):
+            return self._grad_req
+        assert isinstance(self._grad_req, dict)
+        return self._grad_req.get(name, 'null')
+
+    def _bind_input(self, index, name, array):
+        """Bind `array` to input `name` as is if it is on the executor context, or a
+        copy of it otherwise. Arrays requiring gradient are always copied so that
+        attaching the gradient does not modify the caller's array."""
+        if array.context == self._ctx and \
+                (self._args_grad is None or self._get_grad_req(name) == 'null'):
+            self._args[index] = array
+            self._owned.discard(index)
+        else:
+            self._args[index] = array.copyto(self._ctx)
+            self._owned.add(index)
 
     def get_optimized_symbol(self):
         """Get an optimized version of the symbol from the executor.
@@ -144,7 +168,11 @@ class Executor:
             a backward call is expected to follow.
 
         **kwargs
-            Additional specification of input arguments.
+            Additional specification of input arguments. An NDArray already on the
+            executor context, whose input does not require gradient, is bound as is
+            instead of being copied. It then stays bound for subsequent calls. Other
+            values are copied into an array owned by the executor, never into an
+            array bound from the caller.
 
         Examples
         --------
@@ -159,23 +187,30 @@ class Executor:
         """
         if kwargs:
             for name, array in kwargs.items():
-                if name in self._input_names:
-                    index = self._input_names.index(name)
-                    with self._ctx:
-                        arr = ndarray.array(array, dtype=array.dtype)
-                        if self._args[index] is None:
-                            self._args[index] = arr
-                            # get req
-                            if isinstance(self._grad_req, str):
-                                req = self._grad_req
-                            else:
-                                assert isinstance(self._grad_req, dict)
-                                req = self._grad_req[name]
-                            if req != 'null':
-                                with self._ctx:
-                                    self._args[index].attach_grad(req)
-                        else:
-                            self._args[index][:] = arr
+                index = self._input_index.get(name)
+                if index is None:
+                    continue
+                current = self._args[index]
+                # bind NDArrays that already match the slot directly, without copies
+                req = self._get_grad_req(name)
+                if isinstance(array, ndarray.NDArray) and array.context == self._ctx and \
+                        req == 'null' and name not in self._aux_names and \
+                        (current is None or (current.shape == array.shape and
+                                             current.dtype == array.dtype and
+                                             current.stype == array.stype)):
+                    self._args[index] = array
+                    self._owned.discard(index)
+                    continue
+                with self._ctx:
+                    if index in self._owned:
+                        current[:] = array
+                    else:
+                        # the bound array belongs to the caller, copy into a new one
+                        dtype = array.dtype if current is None else current.dtype
+                        self._args[index] = ndarray.array(array, dtype=dtype)
+                        self._owned.add(index)
+                        if req != 'null':
+                            self._args[index].attach_grad(req)
 
         from . import autograd
         default_ctx = None if self._input_names else self._ctx
@@ -214,14 +249,11 @@ class Executor:
 
             if isinstance(self._args_grad, dict):
                 for k, v in self._args_grad.items():
-                    try:
-                        i = self._input_names.index(k)
-                        if self._args[i].grad is not None:
-                            v[:] = self._args[i].grad
+                    i = self._input_index.get(k)
                     # ignore provided arg grad which is not present in
                     # input_names
-                    except ValueError:
-                        pass
+                    if i is not None and self._args[i].grad is not None:
+                        v[:] = self._args[i].grad
             else:
                 assert isinstance(self._args_grad, (list, tuple))
                 for arg, out in zip(self._args, self._args_grad):
@@ -234,7 +266,7 @@ class Executor:
         assert isinstance(self._args, list)
         aux_array = []
         for name in self._aux_names:
-            index = self._input_names.index(name)
+            index = self._input_index[name]
             aux_array.append(self._args[index])
         return aux_array
 
@@ -244,7 +276,7 @@ class Executor:
         assert isinstance(self._args, list)
         arg_array = []
         for name in self._arg_names:
-            index = self._input_names.index(name)
+            index = self._input_index[name]
             arg_array.append(self._args[index])
         return arg_array
 
@@ -258,14 +290,11 @@ class Executor:
         if self._args_grad:
             assert isinstance(self._args_grad, dict)
             for k, _ in self._args_grad.items():
-                try:
-                    i = self._input_names.index(k)
-                    j = self._arg_names.index(k)
-                    arr[j] = self._args[i].grad
+                i = self._input_index.get(k)
                 # ignore provided arg grad which is not present in
                 # input_names
-                except ValueError:
-                    pass
+                if i is not None and k in self._arg_names:
+                    arr[self._arg_names.index(k)] = self._args[i].grad
         return arr
 
     @property
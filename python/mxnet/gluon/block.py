@@ -552,7 +552,7 @@ class Block:
         return self
 
     def initialize(self, init=initializer.Uniform(), ctx=None, verbose=False,
-                   force_reinit=False):
+                   force_reinit=False, lazy=False):
         """Initializes :py:class:`Parameter` s of this :py:class:`Block` and its children.
 
         Parameters
@@ -566,12 +566,17 @@ class Block:
             Whether to verbosely print out details on initialization.
         force_reinit : bool, default False
             Whether to force re-initialization if parameter is already initialized.
+        lazy : bool, default False
+            Postpone allocation and initialization of each parameter until its
+            data is first accessed. Parameters that are loaded from a checkpoint
+            with :py:meth:`load_parameters` before that are allocated directly
+            from the loaded values and never run their initializer.
         """
         params = self.collect_params()
         if verbose:
             init.set_verbosity(verbose=verbose)
         for v in params.values():
-            v.initialize(None, ctx, init, force_reinit=force_reinit)
+            v.initialize(None, ctx, init, force_reinit=force_reinit, lazy=lazy)
 
     def hybridize(self, active=True, **kwargs):
         """ Please refer description of HybridBlock hybridize().
@@ -1168,7 +1173,8 @@ class HybridBlock(Block):
         args_without_none = [ele for ele in args if ele is not None]
         cargs = [args_without_none[i] if is_arg else i.data()
                  for is_arg, name, i in self._cached_op_args]
-        out = self._cached_op(*cargs)
+        with _profiler.hot_path('CachedOp::call'):
+            out = self._cached_op(*cargs)
         if isinstance(out, NDArray):
             out = [out]
         return _regroup(out, self._out_format)
@@ -22,6 +22,7 @@
 import copy
 import logging
 import sys
+import time
 import warnings
 
 from .event_handler import MetricHandler, ValidationHandler, LoggingHandler, StoppingHandler, GradientUpdateHandler
@@ -137,6 +138,12 @@ class Estimator(object):
         self._initialize(initializer)
         self.trainer = self._check_trainer(trainer)
         self.batch_processor = self._check_batch_processor(batch_processor)
+        self.fused_step = False
+        self.metric_update_interval = 1
+        self.handler_timings = {}
+        # index of the current batch in the running fit or evaluate loop
+        self.batch_idx = 0
+        self._metric_handlers = []
 
     def _check_loss(self, loss):
         if not isinstance(loss, gluon_loss):
@@ -306,30 +313,42 @@ class Estimator(object):
         epoch_end, _ = self._categorize_handlers(event_handlers)
 
         estimator_ref = self
+        # evaluate may run inside fit, e.g. from ValidationHandler
+        fit_state = self.batch_idx, self._metric_handlers
+        self.batch_idx = 0
+        self._metric_handlers = [handler for handler in event_handlers
+                                 if isinstance(handler, MetricHandler)]
+        try:
+            for handler in epoch_begin:
+                handler.epoch_begin(estimator_ref)
 
-        for handler in epoch_begin:
-            handler.epoch_begin(estimator_ref)
-
-        for _, batch in enumerate(val_data):
-            for handler in batch_begin:
-                handler.batch_begin(estimator_ref, batch=batch)
+            for _, batch in enumerate(val_data):
+                for handler in batch_begin:
+                    handler.batch_begin(estimator_ref, batch=batch)
 
-            _, label, pred, loss = \
-            self.batch_processor.evaluate_batch(estimator_ref, batch,
-                                                batch_axis)
+                _, label, pred, loss = \
+                self.batch_processor.evaluate_batch(estimator_ref, batch,
+                                                    batch_axis)
 
-            for handler in batch_end:
-                handler.batch_end(estimator_ref, batch=batch, pred=pred, label=label, loss=loss)
+                for handler in batch_end:
+                    handler.batch_end(estimator_ref, batch=batch, pred=pred, label=label,
+                                      loss=loss)
+                self.batch_idx += 1
 
-        for handler in epoch_end:
-            handler.epoch_end(estimator_ref)
+            for handler in epoch_end:
+                handler.epoch_end(estimator_ref)
+        finally:
+            self.batch_idx, self._metric_handlers = fit_state
 
     def fit(self, train_data,
             val_data=None,
             epochs=None,
             event_handlers=None,
             batches=None,
-            batch_axis=0):
+            batch_axis=0,
+            fused_step=False,
+            metric_update_interval=10,
+            profile_handlers=False):
         """Trains the model with a given :py:class:`DataLoader` for a specified
         number of epochs or batches. The batch size is inferred from the
         data loader's batch_size.
@@ -358,6 +377,21 @@ class Estimator(object):
             You can only specify one and only one type of iteration(epochs or batches).
         batch_axis : int, default 0
             Batch axis to split the training data into devices.
+        fused_step : bool, default False
+            Performance mode for the training loop. MetricHandlers without an explicit
+            `update_interval` defer metric updates by `metric_update_interval` batches,
+            and a BatchEnd handler exposing a `batch_end_interval` attribute is only
+            invoked after every `batch_end_interval`-th batch, or never if it is None.
+            The built-in LoggingHandler, CheckpointHandler and ValidationHandler declare
+            their batch interval. Forward, backward and the trainer step are then issued
+            back to back without waiting on the host between batches.
+        metric_update_interval : int, default 10
+            Number of batches a MetricHandler accumulates before updating the training
+            metrics when `fused_step` is True.
+        profile_handlers : bool, default False
+            Record the wall time spent in the batch processor and in every event handler.
+            A summary is logged at the end of training and is available afterwards
+            through :py:meth:`handler_timing_report`.
         """
         if not isinstance(train_data, DataLoader):
             raise ValueError("Estimator only support input as Gluon DataLoader. Alternatively, you "
@@ -374,37 +408,56 @@ class Estimator(object):
         self.max_epoch = epochs
         self.max_batch = batches
         self.batch_axis = batch_axis
+        self.fused_step = fused_step
+        self.metric_update_interval = metric_update_interval if fused_step else 1
+        self.handler_timings = {}
 
         # provide default handlers
         event_handlers = self._prepare_default_handlers(val_data, event_handlers)
 
         train_begin, epoch_begin, batch_begin, \
         batch_end, epoch_end, train_end = self._categorize_handlers(event_handlers)
+        if fused_step:
+            batch_end = [(handler, getattr(handler, 'batch_end_interval', 1))
+                         for handler in batch_end]
+            # handlers without per-batch work are not called at batch end at all
+            batch_end = [(handler, interval) for handler, interval in batch_end if interval]
+        else:
+            batch_end = [(handler, 1) for handler in batch_end]
+        self.batch_idx = 0
+        self._metric_handlers = [handler for handler in event_handlers
+                                 if isinstance(handler, MetricHandler)]
+
+        call = self._timed_call if profile_handlers else self._call
 
         # pass a reference to all event handlers
         estimator_ref = self
         # training begin
         for handler in train_begin:
-            handler.train_begin(estimator_ref)
+            call(handler, 'train_begin', estimator_ref)
 
         while True:
             # epoch begin
             for handler in epoch_begin:
-                handler.epoch_begin(estimator_ref)
+                call(handler, 'epoch_begin', estimator_ref)
 
             for i, batch in enumerate(train_data):
                 # batch begin
                 for handler in batch_begin:
-                    handler.batch_begin(estimator_ref, batch=batch)
+                    call(handler, 'batch_begin', estimator_ref, batch=batch)
 
-                _, label, pred, loss = self.batch_processor.fit_batch(estimator_ref,
-                                                                      batch, batch_axis)
+                _, label, pred, loss = call(self.batch_processor, 'fit_batch', estimator_ref,
+                                            batch, batch_axis)
                 # batch end
 
                 batch_end_result = []
-                for handler in batch_end:
-                    batch_end_result.append(handler.batch_end(estimator_ref, batch=batch,
-                                                              pred=pred, label=label, loss=loss))
+                for handler, interval in batch_end:
+                    if (self.batch_idx + 1) % interval:
+                        continue
+                    batch_end_result.append(call(handler, 'batch_end', estimator_ref,
+                                                 batch=batch, pred=pred, label=label,
+                                                 loss=loss))
+                self.batch_idx += 1
                 # if any handler signaled to stop
                 if any(batch_end_result):
                     break
@@ -412,14 +465,59 @@ class Estimator(object):
             # epoch end
             epoch_end_result = []
             for handler in epoch_end:
-                epoch_end_result.append(handler.epoch_end(estimator_ref))
+                epoch_end_result.append(call(handler, 'epoch_end', estimator_ref))
             # if any handler signaled to stop
             if any(epoch_end_result):
                 break
 
         # train end
         for handler in train_end:
-            handler.train_end(estimator_ref)
+            call(handler, 'train_end', estimator_ref)
+
+        if profile_handlers:
+            self.logger.info(self.handler_timing_report())
+
+    @staticmethod
+    def _call(handler, event, *args, **kwargs):
+        return getattr(handler, event)(*args, **kwargs)
+
+    def _timed_call(self, handler, event, *args, **kwargs):
+        """Invoke `handler.event` and accumulate its wall time in `handler_timings`."""
+        start = time.time()
+        ret = getattr(handler, event)(*args, **kwargs)
+        elapsed = time.time() - start
+        key = '%s.%s' % (type(handler).__name__, event)
+        record = self.handler_timings.setdefault(key, [0, 0.0])
+        record[0] += 1
+        record[1] += elapsed
+        return ret
+
+    def handler_timing_report(self):
+        """Return a table of the wall time spent in each handler during the last
+        :py:meth:`fit` call with `profile_handlers=True`, sorted by total time.
+
+        Operators run asynchronously, so the time attributed to `fit_batch` and to
+        the handlers is the host-side time needed to issue the work, plus any time
+        spent waiting on results (for example when a metric copies predictions to
+        the host).
+        """
+        if not self.handler_timings:
+            return 'No handler timings recorded, call fit() with profile_handlers=True.'
+        total = sum(record[1] for record in self.handler_timings.values())
+        lines = ['%-40s %10s %12s %12s %8s' % ('Handler.event', 'Calls', 'Total(ms)',
+                                               'Avg(ms)', 'Share')]
+        for key, (count, elapsed) in sorted(self.handler_timings.items(),
+                                            key=lambda item: -item[1][1]):
+            lines.append('%-40s %10d %12.3f %12.3f %7.1f%%' % (
+                key, count, elapsed * 1000, elapsed * 1000 / count,
+                100.0 * elapsed / total if total else 0))
+        return '\n'.join(lines)
+
+    def flush_metrics(self):
+        """Apply the metric updates that MetricHandlers of the running fit or evaluate
+        loop have deferred, so that the metrics include every batch seen so far."""
+        for handler in self._metric_handlers:
+            handler.flush()
 
     def _prepare_default_handlers(self, val_data, event_handlers):
         event_handlers = _check_event_handlers(event_handlers)
@@ -465,7 +563,8 @@ class Estimator(object):
 
         # add default logging handler and metric handler for validation
         if not any(isinstance(handler, MetricHandler) for handler in event_handlers):
-            added_default_handlers.append(MetricHandler(metrics=self.val_metrics))
+            added_default_handlers.append(MetricHandler(metrics=self.val_metrics,
+                                                        update_interval=1))
 
         if not any(isinstance(handler, LoggingHandler) for handler in event_handlers):
             added_default_handlers.append(LoggingHandler(metrics=self.val_metrics))
@@ -26,6 +26,7 @@ import warnings
 import numpy as np
 
 from ...metric import CompositeEvalMetric, EvalMetric
+from .... import profiler
 from ...metric import Loss as metric_loss
 from .utils import _check_metrics
 
@@ -119,7 +120,7 @@ class StoppingHandler(TrainBegin, BatchEnd, EpochEnd):
         return self.stop_training
 
 
-class MetricHandler(EpochBegin, BatchEnd):
+class MetricHandler(EpochBegin, BatchEnd, EpochEnd):
     """Metric Handler that update metric values at batch end
 
     :py:class:`MetricHandler` takes model predictions and true labels
@@ -133,15 +134,28 @@ class MetricHandler(EpochBegin, BatchEnd):
     priority : scalar
         Priority level of the MetricHandler. Priority level is sorted in ascending
         order. The lower the number is, the higher priority level the handler is.
+    update_interval : int, default None
+        Number of batches to accumulate before updating the metrics. Metric updates
+        copy predictions to the host, so deferring them lets several training steps
+        be queued before the host waits on the results. Pending batches are always
+        flushed at epoch end. If None, the `metric_update_interval` of the estimator
+        is used, which is 1 unless training with `fused_step=True`.
     """
 
-    def __init__(self, metrics, priority=-1000):
+    def __init__(self, metrics, priority=-1000, update_interval=None):
         self.metrics = _check_metrics(metrics)
         # order to be called among all callbacks
         # metrics need to be calculated before other callbacks can access them
         self.priority = priority
+        if update_interval is not None and \
+                (not isinstance(update_interval, int) or update_interval < 1):
+            raise ValueError("update_interval must be a positive integer, "
+                             "got: {}".format(update_interval))
+        self.update_interval = update_interval
+        self._pending = []
 
     def epoch_begin(self, estimator, *args, **kwargs):
+        self._pending = []
         for metric in self.metrics:
             metric.reset()
 
@@ -149,12 +163,32 @@ class MetricHandler(EpochBegin, BatchEnd):
         pred = kwargs['pred']
         label = kwargs['label']
         loss = kwargs['loss']
-        for metric in self.metrics:
-            if isinstance(metric, metric_loss):
-                # metric wrapper for loss values
-                metric.update(0, loss)
-            else:
-                metric.update(label, pred)
+        update_interval = self.update_interval or estimator.metric_update_interval
+        if update_interval == 1:
+            self._update(label, pred, loss)
+            return
+        self._pending.append((label, pred, loss))
+        if len(self._pending) >= update_interval:
+            self.flush()
+
+    def epoch_end(self, estimator, *args, **kwargs):
+        self.flush()
+        return False
+
+    def flush(self):
+        """Update the metrics with all batches accumulated since the last update."""
+        pending, self._pending = self._pending, []
+        for label, pred, loss in pending:
+            self._update(label, pred, loss)
+
+    def _update(self, label, pred, loss):
+        with profiler.hot_path('Metric::update'):
+            for metric in self.metrics:
+                if isinstance(metric, metric_loss):
+                    # metric wrapper for loss values
+                    metric.update(0, loss)
+                else:
+                    metric.update(label, pred)
 
 
 class ValidationHandler(TrainBegin, BatchEnd, EpochEnd):
@@ -205,13 +239,18 @@ class ValidationHandler(TrainBegin, BatchEnd, EpochEnd):
         self.priority = priority
         self.event_handlers = event_handlers
 
+    @property
+    def batch_end_interval(self):
+        """Batches between two calls of `batch_end` that the handler needs."""
+        return self.batch_period
+
     def train_begin(self, estimator, *args, **kwargs):
         # reset epoch and batch counter
         self.current_batch = 0
         self.current_epoch = 0
 
     def batch_end(self, estimator, *args, **kwargs):
-        self.current_batch += 1
+        self.current_batch = estimator.batch_idx + 1
         if self.batch_period and self.current_batch % self.batch_period == 0:
             self.eval_fn(val_data=self.val_data, batch_axis=estimator.batch_axis,
                          event_handlers=self.event_handlers)
@@ -234,7 +273,9 @@ class LoggingHandler(TrainBegin, TrainEnd, EpochBegin, EpochEnd, BatchBegin, Bat
     log_interval: int or str, default 'epoch'
         Logging interval during training.
         log_interval='epoch': display metrics every epoch
-        log_interval=integer k: display metrics every interval of k batches
+        log_interval=integer k: display metrics every interval of k batches. Deferred
+        metric updates are applied before logging. With `fused_step=True` the
+        intervals are counted over all batches of the fit instead of every epoch.
     metrics : list of EvalMetrics
         Metrics to be logged, logged at batch end, epoch end, train end.
     priority : scalar, default np.Inf
@@ -258,6 +299,14 @@ class LoggingHandler(TrainBegin, TrainEnd, EpochBegin, EpochEnd, BatchBegin, Bat
         self.priority = priority
         self.log_interval = log_interval
         self.log_interval_time = 0
+        self._epoch_start_idx = 0
+        self._last_log_idx = None
+        self._last_log_time = None
+
+    @property
+    def batch_end_interval(self):
+        """Batches between two calls of `batch_end` that the handler needs."""
+        return self.log_interval if isinstance(self.log_interval, int) else None
 
     def train_begin(self, estimator, *args, **kwargs):
         self.train_start = time.time()
@@ -287,27 +336,36 @@ class LoggingHandler(TrainBegin, TrainEnd, EpochBegin, EpochEnd, BatchBegin, Bat
         estimator.logger.info(msg.rstrip(', '))
 
     def batch_begin(self, estimator, *args, **kwargs):
+        # batch_end may be skipped in fused step mode, count samples here
         if isinstance(self.log_interval, int):
-            self.batch_start = time.time()
+            self.processed_samples += kwargs['batch'][0].shape[0]
 
     def batch_end(self, estimator, *args, **kwargs):
-        if isinstance(self.log_interval, int):
-            batch_time = time.time() - self.batch_start
-            msg = '[Epoch %d][Batch %d]' % (self.current_epoch, self.batch_index)
-            self.processed_samples += kwargs['batch'][0].shape[0]
-            msg += '[Samples %s] ' % (self.processed_samples)
-            self.log_interval_time += batch_time
-            if self.batch_index % self.log_interval == 0:
-                msg += 'time/interval: %.3fs ' % self.log_interval_time
-                self.log_interval_time = 0
-                for metric in self.metrics:
-                    # only log current training loss & metric after each interval
-                    name, value = metric.get()
-                    msg += '%s: %.4f, ' % (name, value)
-                estimator.logger.info(msg.rstrip(', '))
-        self.batch_index += 1
+        self.batch_index = estimator.batch_idx - self._epoch_start_idx
+        if not isinstance(self.log_interval, int):
+            return
+        # log the first batch of an epoch and then every log_interval batches; when
+        # batch_end only runs every log_interval batches, log on every call
+        if self._last_log_idx is not None and \
+                estimator.batch_idx - self._last_log_idx < self.log_interval:
+            return
+        now = time.time()
+        self.log_interval_time = now - self._last_log_time
+        self._last_log_idx, self._last_log_time = estimator.batch_idx, now
+        msg = '[Epoch %d][Batch %d]' % (self.current_epoch, self.batch_index)
+        msg += '[Samples %s] ' % (self.processed_samples)
+        msg += 'time/interval: %.3fs ' % self.log_interval_time
+        estimator.flush_metrics()
+        for metric in self.metrics:
+            # only log current training loss & metric after each interval
+            name, value = metric.get()
+            msg += '%s: %.4f, ' % (name, value)
+        estimator.logger.info(msg.rstrip(', '))
 
     def epoch_begin(self, estimator, *args, **kwargs):
+        self._epoch_start_idx = estimator.batch_idx
+        self._last_log_idx = None
+        self._last_log_time = time.time()
         if isinstance(self.log_interval, int) or self.log_interval == 'epoch':
             is_training = False
             # use the name hack defined in __init__() of estimator class
@@ -402,6 +460,7 @@ class CheckpointHandler(TrainBegin, BatchEnd, EpochEnd):
         self.max_checkpoints = max_checkpoints
         self.resume_from_checkpoint = resume_from_checkpoint
         self.saved_checkpoints = []
+        self._symbol_saved = False
         if self.save_best:
             if mode not in ['auto', 'min', 'max']:
                 warnings.warn('ModelCheckpoint mode %s is unknown, '
@@ -432,10 +491,16 @@ class CheckpointHandler(TrainBegin, BatchEnd, EpochEnd):
                                   .format(self.monitor.get()[0]))
                     self.monitor_op = np.less
 
+    @property
+    def batch_end_interval(self):
+        """Batches between two calls of `batch_end` that the handler needs."""
+        return self.batch_period
+
     def train_begin(self, estimator, *args, **kwargs):
         # reset all counters
         self.current_epoch = 0
         self.current_batch = 0
+        self._symbol_saved = False
         if self.save_best:
             self.best = np.Inf if self.monitor_op == np.less else -np.Inf  # pylint: disable=comparison-with-callable
         if self.resume_from_checkpoint:
@@ -453,14 +518,19 @@ class CheckpointHandler(TrainBegin, BatchEnd, EpochEnd):
             self._resume_from_checkpoint(estimator)
 
     def batch_end(self, estimator, *args, **kwargs):
+        self.current_batch = estimator.batch_idx
         # only save symbol once after first batch
-        if self.current_batch == 0:
+        if not self._symbol_saved:
             self._save_symbol(estimator)
         if self.batch_period and (self.current_batch + 1) % self.batch_period == 0:
             self._save_checkpoint(estimator)
         self.current_batch += 1
 
     def epoch_end(self, estimator, *args, **kwargs):
+        # batch_end is skipped on most batches in fused step mode
+        self.current_batch = estimator.batch_idx
+        if not self._symbol_saved:
+            self._save_symbol(estimator)
         if self.epoch_period and (self.current_epoch + 1) % self.epoch_period == 0:
             self._save_checkpoint(estimator)
         self.current_epoch += 1
@@ -512,6 +582,7 @@ class CheckpointHandler(TrainBegin, BatchEnd, EpochEnd):
                                               self.best)
 
     def _save_symbol(self, estimator):
+        self._symbol_saved = True
         symbol_file = os.path.join(self.model_dir, self.model_prefix + '-symbol.json')
         if hasattr(estimator.net, '_cached_graph') and estimator.net._cached_graph:
             sym = estimator.net._cached_graph[1]
@@ -39,7 +39,7 @@ except ImportError:
 
 from . import sampler as _sampler
 from . import batchify as _batchify
-from ... import ndarray as nd, context
+from ... import ndarray as nd, context, profiler as _profiler
 from ...util import is_np_shape, is_np_array, set_np
 from ... import numpy as _mx_np  # pylint: disable=reimported
 
@@ -482,12 +482,13 @@ class _MultiWorkerIter(object):
         assert self._rcvd_idx in self._data_buffer, "fatal error with _push_next, rcvd_idx missing"
         ret = self._data_buffer.pop(self._rcvd_idx)
         try:
-            if self._dataset is None:
-                batch = pickle.loads(ret.get(self._timeout))
-            else:
-                batch = ret.get(self._timeout)
-            if self._pin_memory:
-                batch = _as_in_context(batch, context.cpu_pinned(self._pin_device_id))
+            with _profiler.hot_path('DataLoader::wait'):
+                if self._dataset is None:
+                    batch = pickle.loads(ret.get(self._timeout))
+                else:
+                    batch = ret.get(self._timeout)
+                if self._pin_memory:
+                    batch = _as_in_context(batch, context.cpu_pinned(self._pin_device_id))
             self._rcvd_idx += 1
             return batch
         except multiprocessing.context.TimeoutError:
@@ -671,9 +672,10 @@ class DataLoader(object):
         if self._num_workers == 0:
             def same_process_iter():
                 for batch in self._batch_sampler:
-                    ret = self._batchify_fn([self._dataset[idx] for idx in batch])
-                    if self._pin_memory:
-                        ret = _as_in_context(ret, context.cpu_pinned(self._pin_device_id))
+                    with _profiler.hot_path('DataLoader::wait'):
+                        ret = self._batchify_fn([self._dataset[idx] for idx in batch])
+                        if self._pin_memory:
+                            ret = _as_in_context(ret, context.cpu_pinned(self._pin_device_id))
                     yield ret
             return same_process_iter()
 
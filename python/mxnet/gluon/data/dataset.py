@@ -19,9 +19,12 @@
 # pylint: disable=
 """Dataset container."""
 __all__ = ['Dataset', 'SimpleDataset', 'ArrayDataset',
-           'RecordFileDataset']
+           'RecordFileDataset', 'ShardedRecordFileDataset']
 
+import bisect
+import json
 import os
+from collections import OrderedDict
 
 from ... import recordio, ndarray
 from ...util import default_array
@@ -413,6 +416,146 @@ class RecordFileDataset(Dataset):
         return _RecordFileDataset(rec_file=self.filename, idx_file=self.idx_file)
 
 
+class ShardedRecordFileDataset(Dataset):
+    """A dataset wrapping over several RecordIO (.rec) file shards.
+
+    Each sample is a string representing the raw content of an record. Samples are
+    indexed shard after shard, and in file order within each shard, so that
+    consecutive indices are stored next to each other on disk. Together with
+    :py:class:`ShardedShuffleSampler`, this turns random access into mostly
+    sequential reads.
+
+    The index of each shard is read from the binary `.idx.npy` file written by
+    `tools/im2rec.py` when it exists, and from the text `.idx` file otherwise.
+
+    Parameters
+    ----------
+    filenames : str or list of str
+        Paths to the rec files, or path to the `.manifest.json` file written by
+        `tools/im2rec.py --shard-size`.
+    chunk_size : int, default 0
+        If positive, accessing a record reads the whole chunk of `chunk_size`
+        consecutive records containing it with one sequential read, and keeps the
+        chunk in memory for subsequent accesses.
+    cache_chunks : int, default 4
+        Maximum number of chunks kept in memory, per process. When used with a
+        :py:class:`ShardedShuffleSampler`, it should be at least
+        `buffer_size / chunk_size + 1` for the chunks to be read only once.
+    """
+    def __init__(self, filenames, chunk_size=0, cache_chunks=4):
+        if isinstance(filenames, str):
+            if filenames.endswith('.json'):
+                with open(filenames) as fin:
+                    manifest = json.load(fin)
+                root = os.path.dirname(filenames)
+                filenames = [os.path.join(root, manifest['shards'][name]['rec'])
+                             for name in sorted(manifest['shards'])]
+            else:
+                filenames = [filenames]
+        self.filenames = list(filenames)
+        self._records = []
+        self._keys = []
+        for filename in self.filenames:
+            base = os.path.splitext(filename)[0]
+            idx_file = base + '.idx.npy' if os.path.isfile(base + '.idx.npy') else base + '.idx'
+            record = recordio.MXIndexedRecordIO(idx_file, filename, 'r')
+            self._records.append(record)
+            self._keys.append(sorted(record.keys, key=record.idx.__getitem__))
+        # segments of (file, begin, end) covered by this dataset
+        self._segments = [(i, 0, len(keys)) for i, keys in enumerate(self._keys)]
+        self._chunk_size = chunk_size
+        self._cache_chunks = cache_chunks
+        self._init_segments()
+
+    def _init_segments(self):
+        self._offsets = [0]
+        for _, begin, end in self._segments:
+            self._offsets.append(self._offsets[-1] + end - begin)
+        self._cache = OrderedDict()
+
+    @property
+    def shard_lengths(self):
+        """Number of records of each shard in this dataset, in index order."""
+        return [end - begin for _, begin, end in self._segments]
+
+    def _locate(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('Index %d out of range for dataset of length %d' % (idx, len(self)))
+        segment = bisect.bisect_right(self._offsets, idx) - 1
+        file_id, begin, _ = self._segments[segment]
+        return file_id, begin + idx - self._offsets[segment]
+
+    def __getitem__(self, idx):
+        file_id, pos = self._locate(idx)
+        record = self._records[file_id]
+        keys = self._keys[file_id]
+        if self._chunk_size <= 0:
+            return record.read_idx(keys[pos])
+        chunk_id = (file_id, pos // self._chunk_size)
+        chunk = self._cache.get(chunk_id)
+        if chunk is None:
+            start = chunk_id[1] * self._chunk_size
+            record.seek(keys[start])
+            chunk = [record.read() for _ in range(min(self._chunk_size, len(keys) - start))]
+            self._cache[chunk_id] = chunk
+            if len(self._cache) > self._cache_chunks:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(chunk_id)
+        return chunk[pos % self._chunk_size]
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d['_cache'] = OrderedDict()
+        return d
+
+    def shard(self, num_shards, index):
+        """Returns a new dataset includes only 1/num_shards of this dataset.
+
+        Like :py:meth:`Dataset.shard`, each part holds a contiguous range of indices,
+        so it covers few rec file shards and keeps reads sequential. The returned
+        dataset is a :py:class:`ShardedRecordFileDataset` exposing the
+        `shard_lengths` of the part, so it can be combined with
+        :py:class:`ShardedShuffleSampler`.
+
+        Parameters
+        ----------
+        num_shards : int
+            A integer representing the number of data shards.
+        index : int
+            A integer representing the index of the current shard.
+
+        Returns
+        -------
+        Dataset
+            The result dataset.
+        """
+        assert index < num_shards, 'Shard index of out bound: %d out of %d'%(index, num_shards)
+        assert num_shards > 0, 'Number of shards must be greater than 0'
+        assert index >= 0, 'Index must be non-negative'
+        length = len(self)
+        shard_len = length // num_shards
+        rest = length % num_shards
+        start = shard_len * index + min(index, rest)
+        end = start + shard_len + (index < rest)
+        segments = []
+        for (file_id, begin, seg_end), offset in zip(self._segments, self._offsets):
+            lo = max(start - offset, 0) + begin
+            hi = min(end - offset, seg_end - begin) + begin
+            if lo < hi:
+                segments.append((file_id, lo, hi))
+        ret = ShardedRecordFileDataset.__new__(ShardedRecordFileDataset)
+        ret.__dict__.update(self.__dict__)
+        ret._segments = segments  # pylint: disable=protected-access
+        ret._init_segments()  # pylint: disable=protected-access
+        return ret
+
+
 class _DownloadedDataset(Dataset):
     """Base class for MNIST, cifar10, etc."""
     def __init__(self, root, transform):
@@ -19,7 +19,7 @@
 # pylint: disable=
 """Dataset sampler."""
 __all__ = ['Sampler', 'SequentialSampler', 'RandomSampler', 'FilterSampler', 'BatchSampler',
-           'IntervalSampler']
+           'IntervalSampler', 'ShardedShuffleSampler']
 
 import numpy as np
 
@@ -200,3 +200,64 @@ class IntervalSampler(Sampler):
 
     def __len__(self):
         return self._length
+
+
+class ShardedShuffleSampler(Sampler):
+    """Samples elements from [0, sum(shard_lengths)) with two-level shuffling.
+
+    The order of the shards is shuffled first. The indices of each shard are then
+    streamed in chunks of `chunk_size` consecutive indices, in random chunk order,
+    through a shuffle buffer of `buffer_size` indices from which samples are drawn
+    at random. Consecutive samples therefore come from a window of about
+    `buffer_size` records of one or two shards, which keeps reads mostly sequential
+    when used with :py:class:`ShardedRecordFileDataset`. Larger buffers give a
+    better shuffle at the cost of more records being read ahead.
+
+    Parameters
+    ----------
+    shard_lengths : list of int
+        Number of elements in each shard, for example
+        `ShardedRecordFileDataset.shard_lengths`.
+    buffer_size : int, default 1024
+        Size of the shuffle buffer. A buffer of size 1 disables shuffling within shards.
+    chunk_size : int, default None
+        Number of consecutive indices streamed at once into the buffer. Defaults to
+        `buffer_size`.
+
+    Examples
+    --------
+    >>> sampler = gluon.data.ShardedShuffleSampler([3, 3], buffer_size=1, chunk_size=3)
+    >>> list(sampler)  # shard order is random
+    [3, 4, 5, 0, 1, 2]
+    """
+    def __init__(self, shard_lengths, buffer_size=1024, chunk_size=None):
+        assert buffer_size > 0, 'buffer_size must be positive, got %d' % buffer_size
+        self._shard_lengths = list(shard_lengths)
+        self._offsets = np.concatenate([[0], np.cumsum(self._shard_lengths)]).astype(np.int64)
+        self._buffer_size = buffer_size
+        self._chunk_size = chunk_size or buffer_size
+
+    def _chunks(self):
+        for shard in np.random.permutation(len(self._shard_lengths)):
+            start, end = self._offsets[shard], self._offsets[shard + 1]
+            chunk_starts = np.arange(start, end, self._chunk_size)
+            np.random.shuffle(chunk_starts)
+            for chunk_start in chunk_starts:
+                yield range(chunk_start, min(chunk_start + self._chunk_size, end))
+
+    def __iter__(self):
+        buf = []
+        for chunk in self._chunks():
+            for i in chunk:
+                if len(buf) < self._buffer_size:
+                    buf.append(i)
+                    continue
+                j = np.random.randint(self._buffer_size)
+                yield buf[j]
+                buf[j] = i
+        np.random.shuffle(buf)
+        for i in buf:
+            yield i
+
+    def __len__(self):
+        return int(self._offsets[-1])
@@ -26,13 +26,15 @@ import gzip
 import tarfile
 import struct
 import warnings
+from numbers import Integral
+from multiprocessing.pool import ThreadPool
 import numpy as np
 
 from .. import dataset
 from ...utils import download, check_sha1, _get_repo_file_url
 from .... import ndarray as nd, image, recordio, base
 from .... import numpy as _mx_np  # pylint: disable=reimported
-from ....util import is_np_array, default_array
+from ....util import is_np_array, is_np_default_dtype, default_array
 from ....base import numeric_types
 
 
@@ -276,6 +278,50 @@ class ImageRecordDataset(dataset.RecordFileDataset):
                                        flag=self._flag)
 
 
+def _scan_image_folder(args):
+    """Lists the image files of one class folder. Runs in a scanner thread."""
+    path, exts = args
+    files, ignored = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            ext = os.path.splitext(entry.name)[1]
+            if ext.lower() in exts:
+                files.append(entry.name)
+            else:
+                ignored.append(entry.name)
+    files.sort()
+    return files, ignored
+
+
+class _ImageFolderItems(object):
+    """Sequence view of (filename, label) pairs over the compact storage
+    of :py:class:`ImageFolderDataset`."""
+    def __init__(self, dataset):
+        self._dataset = dataset
+
+    def __len__(self):
+        return len(self._dataset)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self._dataset._get_path(idx), int(self._dataset._labels[idx])
+
+    def __setitem__(self, idx, item):
+        # rebuilds the storage, prefer assigning the whole list for bulk edits
+        items = list(self)
+        items[idx] = item
+        self._dataset.items = items
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, item):
+        """Appends a (filename, label) pair."""
+        self._dataset._append_item(*item)
+
+
 class ImageFolderDataset(dataset.Dataset):
     """A dataset for loading image files stored in a folder structure.
 
@@ -288,6 +334,10 @@ class ImageFolderDataset(dataset.Dataset):
         root/bus/023.jpg
         root/bus/wwww.jpg
 
+    Class folders are scanned in parallel. Paths and labels are kept in a few flat
+    numpy arrays rather than a list of Python tuples, so that forked DataLoader
+    workers share them copy-on-write.
+
     Parameters
     ----------
     root : str
@@ -301,14 +351,24 @@ class ImageFolderDataset(dataset.Dataset):
 
             transform = lambda data, label: (data.astype(np.float32)/255, label)
 
+    num_threads : int, default None
+        Number of threads used to scan class folders. Defaults to the number of CPUs.
+    manifest : str, default None
+        Path of an on-disk manifest caching the scan result. It is reused as long as
+        the modification times of `root` and of all class folders are unchanged, and
+        rewritten otherwise.
+
     Attributes
     ----------
     synsets : list
         List of class names. `synsets[i]` is the name for the integer label `i`
-    items : list of tuples
-        List of all images in (filename, label) pairs.
+    items : sequence of tuples
+        All images in (filename, label) pairs with integer labels. This is a view
+        over compact storage rather than a list: `append` and item assignment are
+        supported, other list methods are not. For other edits assign a new list,
+        e.g. ``dataset.items = [x for x in dataset.items if keep(x)]``.
     """
-    def __init__(self, root, flag=1, transform=None):
+    def __init__(self, root, flag=1, transform=None, num_threads=None, manifest=None):
         self._root = os.path.expanduser(root)
         self._flag = flag
         if transform is not None:
@@ -317,45 +377,152 @@ class ImageFolderDataset(dataset.Dataset):
                 'Please use dataset.transform() or dataset.transform_first() instead...')
         self._transform = transform
         self._exts = ['.jpg', '.jpeg', '.png']
+        self._num_threads = num_threads
+        self._manifest = os.path.expanduser(manifest) if manifest is not None else None
+        self._set_paths([])
+        self._labels = np.zeros(0, dtype=np.int32)
+        self._appended = []
         self._list_images(self._root)
         self._handle = None
 
     def _list_images(self, root):
-        self.synsets = []
-        self.items = []
-
-        for folder in sorted(os.listdir(root)):
-            path = os.path.join(root, folder)
-            if not os.path.isdir(path):
-                warnings.warn('Ignoring %s, which is not a directory.'%path, stacklevel=3)
+        folders, mtimes = [], [os.stat(root).st_mtime_ns]
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if not entry.is_dir():
+                warnings.warn('Ignoring %s, which is not a directory.'%entry.path, stacklevel=3)
                 continue
-            label = len(self.synsets)
-            self.synsets.append(folder)
-            for filename in sorted(os.listdir(path)):
-                filename = os.path.join(path, filename)
-                ext = os.path.splitext(filename)[1]
-                if ext.lower() not in self._exts:
-                    warnings.warn('Ignoring %s of type %s. Only support %s'%(
-                        filename, ext, ', '.join(self._exts)))
-                    continue
-                self.items.append((filename, label))
+            folders.append(entry.name)
+            mtimes.append(entry.stat().st_mtime_ns)
+        mtimes = np.array(mtimes, dtype=np.int64)
+        self.synsets = folders
+
+        if self._manifest is not None and self._load_manifest(mtimes):
+            return
+
+        exts = tuple(self._exts)
+        tasks = [(os.path.join(root, folder), exts) for folder in folders]
+        if len(tasks) > 1 and self._num_threads != 1:
+            pool = ThreadPool(self._num_threads)
+            try:
+                results = pool.map(_scan_image_folder, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_scan_image_folder(task) for task in tasks]
+
+        names, labels, ignored = [], [], []
+        for label, (folder, (files, skipped)) in enumerate(zip(folders, results)):
+            names.extend(os.fsencode(os.path.join(folder, f)) for f in files)
+            labels.append(np.full(len(files), label, dtype=np.int32))
+            ignored.extend(os.path.join(folder, f) for f in skipped)
+        if ignored:
+            warnings.warn('Ignoring %d files in %s (e.g. %s). Only support %s'%(
+                len(ignored), root, ', '.join(ignored[:3]), ', '.join(self._exts)))
+
+        self._set_paths(names)
+        self._labels = np.concatenate(labels) if labels else np.zeros(0, dtype=np.int32)
+        if self._manifest is not None:
+            self._save_manifest(mtimes)
+
+    def _load_manifest(self, mtimes):
+        """Restores the scan result from the manifest if it is still valid."""
+        if not os.path.isfile(self._manifest):
+            return False
+        try:
+            with np.load(self._manifest) as f:
+                valid = (list(f['synsets']) == self.synsets and
+                         list(f['exts']) == self._exts and
+                         np.array_equal(f['mtimes'], mtimes))
+                if not valid:
+                    return False
+                self._paths, self._offsets, self._labels = \
+                    f['paths'], f['offsets'], f['labels']
+        except (OSError, KeyError, ValueError):
+            return False
+        return True
+
+    def _save_manifest(self, mtimes):
+        """Atomically writes the scan result to the manifest."""
+        tmp = '%s.%d.tmp'%(self._manifest, os.getpid())
+        with open(tmp, 'wb') as f:
+            np.savez(f, synsets=np.array(self.synsets, dtype=str),
+                     exts=np.array(self._exts, dtype=str), mtimes=mtimes,
+                     paths=self._paths, offsets=self._offsets, labels=self._labels)
+        os.replace(tmp, self._manifest)
+
+    def _set_paths(self, names):
+        """Packs encoded paths relative to `root` into the flat path storage."""
+        self._offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(n) for n in names], out=self._offsets[1:])
+        self._paths = np.frombuffer(b''.join(names), dtype=np.uint8)
+
+    def _encode_item(self, filename, label):
+        """Returns the path of `filename` relative to `root`, encoded, and `label`."""
+        if not isinstance(label, Integral):
+            raise ValueError("ImageFolderDataset labels must be integers, got %r for %s"%(
+                label, filename))
+        try:
+            name = os.path.relpath(filename, self._root)
+        except ValueError:  # on a different drive than root on Windows
+            name = os.path.abspath(filename)
+        return os.fsencode(name), label
+
+    def _append_item(self, filename, label):
+        # appends are packed into the storage on the next read
+        self._appended.append(self._encode_item(filename, label))
+        self._handle = None
+
+    def _pack_appended(self):
+        names, labels = zip(*self._appended)
+        self._appended = []
+        offsets = self._offsets[-1] + np.cumsum([len(n) for n in names], dtype=np.int64)
+        self._offsets = np.concatenate([self._offsets, offsets])
+        self._paths = np.concatenate([self._paths,
+                                      np.frombuffer(b''.join(names), dtype=np.uint8)])
+        self._labels = np.concatenate([self._labels, np.array(labels, dtype=np.int32)])
+
+    def _get_path(self, idx):
+        if self._appended:
+            self._pack_appended()
+        if idx < 0:
+            idx += len(self)
+        name = self._paths[self._offsets[idx]:self._offsets[idx + 1]].tobytes()
+        return os.path.join(self._root, os.fsdecode(name))
+
+    @property
+    def items(self):
+        return _ImageFolderItems(self)
+
+    @items.setter
+    def items(self, items):
+        encoded = [self._encode_item(filename, label) for filename, label in items]
+        names, labels = zip(*encoded) if encoded else ((), ())
+        self._set_paths(names)
+        self._labels = np.array(labels, dtype=np.int32)
+        self._appended = []
+        self._handle = None
 
     def __getitem__(self, idx):
-        img = image.imread(self.items[idx][0], self._flag)
-        label = self.items[idx][1]
+        img = image.imread(self._get_path(idx), self._flag)
+        label = int(self._labels[idx])
         if self._transform is not None:
             return self._transform(img, label)
         return img, label
 
     def __len__(self):
-        return len(self.items)
+        return len(self._labels) + len(self._appended)
 
     def __mx_handle__(self):
         if self._handle is None:
             from .._internal import ImageSequenceDataset, NDArrayDataset, GroupDataset
             path_sep = '|'
-            im_names = path_sep.join([x[0] for x in self.items])
-            label = default_array([x[1] for x in self.items])
+            im_names = path_sep.join([self._get_path(i) for i in range(len(self))])
+            # labels were passed as a list before, which gives the default float dtype
+            dtype = 'float64' if is_np_array() and is_np_default_dtype() else 'float32'
+            label = default_array(self._labels, dtype=dtype)
             self._handle = GroupDataset(datasets=(
                 ImageSequenceDataset(img_list=im_names, path_sep=path_sep, flag=self._flag),
                 NDArrayDataset(arr=label)))
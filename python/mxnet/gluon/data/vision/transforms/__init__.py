@@ -28,6 +28,7 @@ from .....util import is_np_array
 
 from . image import *
 from .image import _append_return
+from . import batch
 
 
 class Compose(Sequential):
@@ -0,0 +1,451 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# coding: utf-8
+# pylint: disable= arguments-differ
+"""Batch image transforms.
+
+These transforms take a whole (N x H x W x C) batch and draw their random
+parameters independently for every sample with vectorized random operators.
+They are built from generic tensor operators, so they run on whichever device
+the batch lives on. A typical use is to let DataLoader workers only decode
+(and resize to a common size), and to augment the batch after batchify::
+
+    aug = transforms.HybridCompose([
+        transforms.batch.RandomResizedCrop(224),
+        transforms.batch.RandomFlipLeftRight(),
+        transforms.batch.RandomColorJitter(0.4, 0.4, 0.4),
+        transforms.batch.RandomLighting(0.1),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=(0.485, 0.456, 0.406), std=(0.229, 0.224, 0.225))])
+    for data, label in loader:
+        data = aug(data.as_in_context(ctx))
+
+Except for the flips, all transforms output float32.
+"""
+import math
+
+from ....block import HybridBlock
+from .....base import numeric_types
+from .....util import is_np_array
+from .image import _append_return
+
+__all__ = ['RandomResizedCrop', 'RandomFlipLeftRight', 'RandomFlipTopBottom',
+           'RandomBrightness', 'RandomContrast', 'RandomSaturation', 'RandomHue',
+           'RandomColorJitter', 'RandomLighting', 'RandomGray']
+
+_GRAY_COEF = (0.299, 0.587, 0.114)
+# RGB to YIQ. The chroma rows sum to zero so that gray pixels have no chroma.
+_YIQ = (_GRAY_COEF,
+        (0.5959, -0.2746, -0.3213),
+        (0.2115, -0.5227, 0.3112))
+
+
+def _inverse3(m):
+    """Inverts a 3 x 3 matrix given as nested tuples."""
+    (a, b, c), (d, e, f), (g, h, i) = m
+    cof = ((e * i - f * h, c * h - b * i, b * f - c * e),
+           (f * g - d * i, a * i - c * g, c * d - a * f),
+           (d * h - e * g, b * g - a * h, a * e - b * d))
+    det = a * cof[0][0] + b * cof[1][0] + c * cof[2][0]
+    return tuple(tuple(x / det for x in row) for row in cof)
+
+
+_YIQ_INV = _inverse3(_YIQ)
+
+
+def _per_sample(F, x):
+    """Returns a float32 (N x 1 x 1 x 1) array used as shape reference for
+    per-sample random parameters."""
+    return F.cast(F.slice(x, begin=(None, 0, 0, 0), end=(None, 1, 1, 1)), dtype='float32')
+
+
+def _uniform(F, ref, low, high):
+    return F.random.uniform_like(ref, low=low, high=high)
+
+
+def _split_channels(F, x):
+    return [F.slice_axis(x, axis=3, begin=i, end=i + 1) for i in range(3)]
+
+
+def _gray(F, channels):
+    return sum(c * coef for c, coef in zip(channels, _GRAY_COEF))
+
+
+def _blend(F, x, other, alpha):
+    """Computes ``x * alpha + other * (1 - alpha)`` with per-sample `alpha`."""
+    return F.broadcast_add(F.broadcast_mul(x, alpha), F.broadcast_mul(other, 1 - alpha))
+
+
+def _adjust_brightness(F, x, ref, brightness):
+    return F.broadcast_mul(x, _uniform(F, ref, max(0, 1 - brightness), 1 + brightness))
+
+
+def _adjust_contrast(F, x, ref, contrast):
+    alpha = _uniform(F, ref, max(0, 1 - contrast), 1 + contrast)
+    mean = F.mean(_gray(F, _split_channels(F, x)), axis=(1, 2, 3), keepdims=True)
+    return _blend(F, x, mean, alpha)
+
+
+def _adjust_saturation(F, x, ref, saturation):
+    alpha = _uniform(F, ref, max(0, 1 - saturation), 1 + saturation)
+    return _blend(F, x, _gray(F, _split_channels(F, x)), alpha)
+
+
+def _adjust_hue(F, x, ref, hue):
+    # rotate the chroma plane in YIQ space by a per-sample angle
+    theta = _uniform(F, ref, -hue, hue) * (2 * math.pi)
+    u, w = F.cos(theta), F.sin(theta)
+    rgb = _split_channels(F, x)
+    y, i, q = [sum(c * coef for c, coef in zip(rgb, row)) for row in _YIQ]
+    i, q = (F.broadcast_mul(i, u) - F.broadcast_mul(q, w),
+            F.broadcast_mul(i, w) + F.broadcast_mul(q, u))
+    return F.concat(*[row[0] * y + row[1] * i + row[2] * q for row in _YIQ_INV], dim=3)
+
+
+class _BatchTransform(HybridBlock):
+    """Base class of batch transforms. Subclasses implement `_transform` with
+    legacy operators, which also serves the numpy interface."""
+    def _transform(self, F, x):
+        raise NotImplementedError
+
+    def hybrid_forward(self, F, x, *args):
+        if is_np_array():
+            return _append_return(self._transform(F, x.as_nd_ndarray()).as_np_ndarray(), *args)
+        return _append_return(self._transform(F, x), *args)
+
+
+class RandomResizedCrop(_BatchTransform):
+    """Crop every image of a batch with its own random scale and aspect ratio,
+    and resize the crops to the same size.
+
+    Crops are sampled as in :py:class:`~mxnet.gluon.data.vision.transforms.RandomResizedCrop`,
+    except that crop sides exceeding the image are clipped instead of resampled.
+    Cropping and resizing are fused into one bilinear sampling step.
+
+    Parameters
+    ----------
+    size : int or tuple of (W, H)
+        Size of the final output.
+    scale : tuple of two floats
+        If scale is `(min_area, max_area)`, the cropped image's area will
+        range from min_area to max_area of the original image's area
+    ratio : tuple of two floats
+        Range of aspect ratio of the cropped image before resizing.
+
+
+    Inputs:
+        - **data**: input tensor with (N x Hi x Wi x C) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with (N x H x W x C) shape.
+    """
+    def __init__(self, size, scale=(0.08, 1.0), ratio=(3.0/4.0, 4.0/3.0)):
+        super(RandomResizedCrop, self).__init__()
+        if isinstance(size, numeric_types):
+            size = (size, size)
+        if isinstance(scale, numeric_types):
+            scale = (scale, 1.0)
+        self._size = size
+        self._scale = scale
+        self._log_ratio = (math.log(ratio[0]), math.log(ratio[1]))
+
+    def _transform(self, F, x):
+        ref = F.reshape(_per_sample(F, x), shape=(-1, 1))
+        shape = F.cast(F.shape_array(x), dtype='float32')
+        # aspect ratio of the input, H / W
+        hw = F.reshape(F.slice_axis(shape, axis=0, begin=1, end=2) /
+                       F.slice_axis(shape, axis=0, begin=2, end=3), shape=(1, 1))
+        area = _uniform(F, ref, *self._scale)
+        ratio = F.exp(_uniform(F, ref, *self._log_ratio))
+        # crop width and height as fractions of the input width and height
+        fw = F.clip(F.sqrt(F.broadcast_mul(area * ratio, hw)), 0, 1)
+        fh = F.clip(F.sqrt(F.broadcast_div(area / ratio, hw)), 0, 1)
+        cx = _uniform(F, ref, -1, 1) * (1 - fw)
+        cy = _uniform(F, ref, -1, 1) * (1 - fh)
+        zeros = F.zeros_like(ref)
+        theta = F.concat(fw, zeros, cx, zeros, fh, cy, dim=1)
+        grid = F.GridGenerator(data=theta, transform_type='affine',
+                               target_shape=(self._size[1], self._size[0]))
+        x = F.transpose(F.cast(x, dtype='float32'), axes=(0, 3, 1, 2))
+        return F.transpose(F.BilinearSampler(x, grid), axes=(0, 2, 3, 1))
+
+
+class _RandomFlip(_BatchTransform):
+    def __init__(self, axis, p=0.5):
+        super(_RandomFlip, self).__init__()
+        self._axis = axis
+        self.p = p
+
+    def _transform(self, F, x):
+        cond = F.reshape(_per_sample(F, x), shape=(-1,))
+        cond = _uniform(F, cond, 0, 1) < self.p
+        return F.where(cond, F.flip(x, axis=self._axis), x)
+
+
+class RandomFlipLeftRight(_RandomFlip):
+    """Randomly flip every image of a batch left to right with probability `p`,
+    independently per sample.
+
+    Parameters
+    ----------
+    p : float
+        The probability of flipping each image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x C) shape.
+
+    Outputs:
+        - **out**: output tensor with same shape and type as `data`.
+    """
+    def __init__(self, p=0.5):
+        super(RandomFlipLeftRight, self).__init__(2, p)
+
+
+class RandomFlipTopBottom(_RandomFlip):
+    """Randomly flip every image of a batch top to bottom with probability `p`,
+    independently per sample.
+
+    Parameters
+    ----------
+    p : float
+        The probability of flipping each image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x C) shape.
+
+    Outputs:
+        - **out**: output tensor with same shape and type as `data`.
+    """
+    def __init__(self, p=0.5):
+        super(RandomFlipTopBottom, self).__init__(1, p)
+
+
+class RandomBrightness(_BatchTransform):
+    """Randomly jitters the brightness of every image of a batch.
+
+    Parameters
+    ----------
+    brightness : float
+        How much to jitter brightness. brightness factor is randomly
+        chosen from `[max(0, 1 - brightness), 1 + brightness]` for each image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x C) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, brightness):
+        super(RandomBrightness, self).__init__()
+        self._brightness = brightness
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        return _adjust_brightness(F, x, _per_sample(F, x), self._brightness)
+
+
+class RandomContrast(_BatchTransform):
+    """Randomly jitters the contrast of every image of a batch.
+
+    Parameters
+    ----------
+    contrast : float
+        How much to jitter contrast. contrast factor is randomly
+        chosen from `[max(0, 1 - contrast), 1 + contrast]` for each image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, contrast):
+        super(RandomContrast, self).__init__()
+        self._contrast = contrast
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        return _adjust_contrast(F, x, _per_sample(F, x), self._contrast)
+
+
+class RandomSaturation(_BatchTransform):
+    """Randomly jitters the saturation of every image of a batch.
+
+    Parameters
+    ----------
+    saturation : float
+        How much to jitter saturation. saturation factor is randomly
+        chosen from `[max(0, 1 - saturation), 1 + saturation]` for each image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, saturation):
+        super(RandomSaturation, self).__init__()
+        self._saturation = saturation
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        return _adjust_saturation(F, x, _per_sample(F, x), self._saturation)
+
+
+class RandomHue(_BatchTransform):
+    """Randomly jitters the hue of every image of a batch.
+
+    The hue is rotated in YIQ color space by an angle chosen from
+    `[-hue * 360, hue * 360]` degrees for each image.
+
+    Parameters
+    ----------
+    hue : float
+        How much to jitter hue.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, hue):
+        super(RandomHue, self).__init__()
+        self._hue = hue
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        return _adjust_hue(F, x, _per_sample(F, x), self._hue)
+
+
+class RandomColorJitter(_BatchTransform):
+    """Randomly jitters the brightness, contrast, saturation, and hue
+    of every image of a batch.
+
+    Unlike the per-sample transform, the adjustments are always applied in
+    the order brightness, contrast, saturation, hue.
+
+    Parameters
+    ----------
+    brightness : float
+        How much to jitter brightness. brightness factor is randomly
+        chosen from `[max(0, 1 - brightness), 1 + brightness]`.
+    contrast : float
+        How much to jitter contrast. contrast factor is randomly
+        chosen from `[max(0, 1 - contrast), 1 + contrast]`.
+    saturation : float
+        How much to jitter saturation. saturation factor is randomly
+        chosen from `[max(0, 1 - saturation), 1 + saturation]`.
+    hue : float
+        How much to jitter hue. The hue is rotated in YIQ space by an
+        angle chosen from `[-hue * 360, hue * 360]` degrees.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, brightness=0, contrast=0, saturation=0, hue=0):
+        super(RandomColorJitter, self).__init__()
+        self._brightness = brightness
+        self._contrast = contrast
+        self._saturation = saturation
+        self._hue = hue
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        ref = _per_sample(F, x)
+        if self._brightness > 0:
+            x = _adjust_brightness(F, x, ref, self._brightness)
+        if self._contrast > 0:
+            x = _adjust_contrast(F, x, ref, self._contrast)
+        if self._saturation > 0:
+            x = _adjust_saturation(F, x, ref, self._saturation)
+        if self._hue > 0:
+            x = _adjust_hue(F, x, ref, self._hue)
+        return x
+
+
+class RandomLighting(_BatchTransform):
+    """Add AlexNet-style PCA-based noise to every image of a batch, with
+    noise drawn independently for each image.
+
+    Parameters
+    ----------
+    alpha : float
+        Intensity of the image.
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    _eigval = (55.46, 4.794, 1.148)
+    _eigvec = ((-0.5675, 0.7192, 0.4009),
+               (-0.5808, -0.0045, -0.8140),
+               (-0.5836, -0.6948, 0.4203))
+
+    def __init__(self, alpha):
+        super(RandomLighting, self).__init__()
+        self._alpha = alpha
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        ref = _per_sample(F, x)
+        alpha = [F.random.normal_like(ref, loc=0, scale=self._alpha) * v
+                 for v in self._eigval]
+        pca = [sum(a * vec for a, vec in zip(alpha, row)) for row in self._eigvec]
+        return F.broadcast_add(x, F.concat(*pca, dim=3))
+
+
+class RandomGray(_BatchTransform):
+    """Randomly convert every image of a batch to gray with probability `p`,
+    independently per sample. Gray images keep three channels.
+
+    Parameters
+    ----------
+    p : float
+        Probability to convert each image to grayscale
+
+
+    Inputs:
+        - **data**: input tensor with (N x H x W x 3) shape.
+
+    Outputs:
+        - **out**: float32 output tensor with same shape as `data`.
+    """
+    def __init__(self, p=0.5):
+        super(RandomGray, self).__init__()
+        self.p = p
+
+    def _transform(self, F, x):
+        x = F.cast(x, dtype='float32')
+        cond = F.reshape(_per_sample(F, x), shape=(-1,))
+        cond = _uniform(F, cond, 0, 1) < self.p
+        gray = F.broadcast_like(_gray(F, _split_channels(F, x)), x)
+        return F.where(cond, gray, x)
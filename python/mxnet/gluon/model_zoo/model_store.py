@@ -19,6 +19,7 @@
 """Model zoo for pre-trained models."""
 __all__ = ['get_model_file', 'purge']
 import os
+import json
 import zipfile
 import logging
 import tempfile
@@ -28,6 +29,11 @@ import shutil
 from ..utils import download, check_sha1, replace_file
 from ... import base
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
 _model_sha1 = {name: checksum for checksum, name in [
     ('44335d1f0046b328243b32a26a4fbd62d9057b45', 'alexnet'),
     ('f27dbf2dbd5ce9a80b102d89c7483342cd33cb31', 'densenet121'),
@@ -72,12 +78,86 @@ def short_hash(name):
         raise ValueError('Pretrained model for {name} is not available.'.format(name=name))
     return _model_sha1[name][:8]
 
+_sha1_cache_name = '.sha1_cache.json'
+
+
+class _FileLock(object):
+    """Exclusive inter-process lock held on `path` for the duration of a with block.
+
+    Used so that concurrent workers fetching the same pretrained model download
+    and verify it once, while the others wait and reuse the result.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.name == 'nt':
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after 10 seconds
+                    continue
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if os.name == 'nt':
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+def _file_stat(file_path):
+    st = os.stat(file_path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_sha1_cache(root):
+    try:
+        with open(os.path.join(root, _sha1_cache_name)) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _is_verified(root, file_path, sha1_hash):
+    """Whether `file_path` was verified against `sha1_hash` and has not changed since."""
+    entry = _read_sha1_cache(root).get(os.path.basename(file_path))
+    try:
+        return entry == _file_stat(file_path) + [sha1_hash]
+    except OSError:
+        return False
+
+
+def _mark_verified(root, file_path, sha1_hash):
+    """Record a successful verification. Must be called with the cache lock held."""
+    cache = _read_sha1_cache(root)
+    cache[os.path.basename(file_path)] = _file_stat(file_path) + [sha1_hash]
+    temp_path = os.path.join(root, _sha1_cache_name + str(uuid.uuid4()))
+    with open(temp_path, 'w') as f:
+        json.dump(cache, f)
+    replace_file(temp_path, os.path.join(root, _sha1_cache_name))
+
+
 def get_model_file(name, root=os.path.join(base.data_dir(), 'models')):
     r"""Return location for the pretrained on local file system.
 
     This function will download from online model zoo when model cannot be found or has mismatch.
     The root directory will be created if it doesn't exist.
 
+    Successful sha1 verifications are cached in the root directory keyed by file size and
+    modification time, so later calls skip re-hashing an unchanged file. Concurrent callers,
+    e.g. several workers on one host, serialize on a per-model lock file so the model is
+    downloaded and verified only once.
+
     Parameters
     ----------
     name : str
@@ -95,36 +175,44 @@ def get_model_file(name, root=os.path.join(base.data_dir(), 'models')):
     root = os.path.expanduser(root)
     file_path = os.path.join(root, file_name+'.params')
     sha1_hash = _model_sha1[name]
-    if os.path.exists(file_path):
-        if check_sha1(file_path, sha1_hash):
-            return file_path
-        else:
-            logging.warning('Mismatch in the content of model file detected. Downloading again.')
-    else:
-        logging.info('Model file not found. Downloading to %s.', file_path)
+    if _is_verified(root, file_path, sha1_hash):
+        return file_path
 
     os.makedirs(root, exist_ok=True)
+    with _FileLock(os.path.join(root, file_name+'.lock')):
+        # another process may have fetched or verified the file while we waited
+        if os.path.exists(file_path):
+            if _is_verified(root, file_path, sha1_hash) or check_sha1(file_path, sha1_hash):
+                with _FileLock(os.path.join(root, _sha1_cache_name+'.lock')):
+                    _mark_verified(root, file_path, sha1_hash)
+                return file_path
+            else:
+                logging.warning('Mismatch in the content of model file detected. Downloading again.')
+        else:
+            logging.info('Model file not found. Downloading to %s.', file_path)
 
-    repo_url = os.environ.get('MXNET_GLUON_REPO', apache_repo_url)
-    if repo_url[-1] != '/':
-        repo_url = repo_url + '/'
-
-    random_uuid = str(uuid.uuid4())
-    temp_zip_file_path = os.path.join(root, file_name+'.zip'+random_uuid)
-    download(_url_format.format(repo_url=repo_url, file_name=file_name),
-             path=temp_zip_file_path, overwrite=True)
-    with zipfile.ZipFile(temp_zip_file_path) as zf:
-        temp_dir = tempfile.mkdtemp(dir=root)
-        zf.extractall(temp_dir)
-        temp_file_path = os.path.join(temp_dir, file_name+'.params')
-        replace_file(temp_file_path, file_path)
-        shutil.rmtree(temp_dir)
-    os.remove(temp_zip_file_path)
-
-    if check_sha1(file_path, sha1_hash):
-        return file_path
-    else:
-        raise ValueError('Downloaded file has different hash. Please try again.')
+        repo_url = os.environ.get('MXNET_GLUON_REPO', apache_repo_url)
+        if repo_url[-1] != '/':
+            repo_url = repo_url + '/'
+
+        random_uuid = str(uuid.uuid4())
+        temp_zip_file_path = os.path.join(root, file_name+'.zip'+random_uuid)
+        download(_url_format.format(repo_url=repo_url, file_name=file_name),
+                 path=temp_zip_file_path, overwrite=True)
+        with zipfile.ZipFile(temp_zip_file_path) as zf:
+            temp_dir = tempfile.mkdtemp(dir=root)
+            zf.extractall(temp_dir)
+            temp_file_path = os.path.join(temp_dir, file_name+'.params')
+            replace_file(temp_file_path, file_path)
+            shutil.rmtree(temp_dir)
+        os.remove(temp_zip_file_path)
+
+        if check_sha1(file_path, sha1_hash):
+            with _FileLock(os.path.join(root, _sha1_cache_name+'.lock')):
+                _mark_verified(root, file_path, sha1_hash)
+            return file_path
+        else:
+            raise ValueError('Downloaded file has different hash. Please try again.')
 
 def purge(root=os.path.join(base.data_dir(), 'models')):
     r"""Purge all pretrained model files in local file store.
@@ -137,5 +225,6 @@ def purge(root=os.path.join(base.data_dir(), 'models')):
     root = os.path.expanduser(root)
     files = os.listdir(root)
     for f in files:
-        if f.endswith(".params"):
+        # lock files are kept, another process may hold or wait on them
+        if f.endswith(".params") or f == _sha1_cache_name:
             os.remove(os.path.join(root, f))
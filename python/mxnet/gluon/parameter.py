@@ -115,6 +115,8 @@ class Parameter(object):
         self._ctx_map = None
         self._trainer = None
         self._deferred_init = ()
+        # whether initialization is postponed until the data is first accessed
+        self._lazy_init = False
         self._differentiable = differentiable
         self._allow_deferred_init = allow_deferred_init
         self._grad_req = None
@@ -265,6 +267,11 @@ class Parameter(object):
         trainer._row_sparse_pull(self, results, row_id)
         return results
 
+    def _finish_lazy_init(self):
+        """Allocates and initializes a lazily initialized parameter on first access."""
+        if self._lazy_init and self._deferred_init and shape_is_known(self.shape):
+            self._finish_deferred_init()
+
     def _load_init(self, data, ctx, cast_dtype=False, dtype_source='current'):
         """
         (Re)initializes by loading from data.
@@ -332,6 +339,7 @@ class Parameter(object):
                     self.name, str(ctx), str(self.list_ctx()))
             self.set_data(data)
         self._deferred_init = ()
+        self._lazy_init = False
 
     def _finish_deferred_init(self):
         """Finishes deferred initialization."""
@@ -339,6 +347,7 @@ class Parameter(object):
             return
         init, ctx, default_init, data = self._deferred_init
         self._deferred_init = ()
+        self._lazy_init = False
 
         assert shape_is_known(self.shape), \
             "Cannot initialize Parameter '%s' because it has " \
@@ -419,7 +428,7 @@ class Parameter(object):
         return data
 
     def initialize(self, init=None, ctx=None, default_init=initializer.Uniform(),
-                   force_reinit=False):
+                   force_reinit=False, lazy=False):
         """Initializes parameter and gradient arrays. Only used for :py:class:`NDArray` API.
 
         Parameters
@@ -440,6 +449,13 @@ class Parameter(object):
             and :py:meth:`Parameter.init` are ``None``.
         force_reinit : bool, default False
             Whether to force re-initialization if parameter is already initialized.
+        lazy : bool, default False
+            Only record the initializer and contexts, without allocating memory.
+            The parameter is allocated when its data is first accessed, or directly
+            from the loaded values if :py:meth:`Block.load_parameters` or
+            :py:meth:`set_data` is called first, in which case the initializer never
+            runs. This avoids initializing weights that are overwritten by a
+            checkpoint right away.
         Examples
         --------
         >>> weight = mx.gluon.Parameter('weight', shape=(2, 2))
@@ -474,15 +490,17 @@ class Parameter(object):
             ctx = [ctx]
         if init is None:
             init = default_init if self.init is None else self.init
+        self._lazy_init = lazy
         if not shape_is_known(self.shape):
-            if self._allow_deferred_init:
+            if self._allow_deferred_init or lazy:
                 self._deferred_init = (init, ctx, default_init, None)
                 return
             raise ValueError("Cannot initialize Parameter '%s' because it has " \
                              "invalid shape: %s."%(self.name, str(self.shape)))
 
         self._deferred_init = (init, ctx, default_init, None)
-        self._finish_deferred_init()
+        if not lazy:
+            self._finish_deferred_init()
 
     def reset_ctx(self, ctx):
         """Re-assign Parameter to other contexts.
@@ -545,6 +563,7 @@ class Parameter(object):
             raise RuntimeError("Cannot return a copy of Parameter %s via row_sparse_data() " \
                                "because its storage type is %s. Please use data() instead." \
                                %(self.name, self._stype))
+        self._finish_lazy_init()
         return self._get_row_sparse(self._data, row_id.ctx, row_id)
 
     def list_row_sparse_data(self, row_id):
@@ -565,6 +584,7 @@ class Parameter(object):
             raise RuntimeError("Cannot return copies of Parameter '%s' on all contexts via " \
                                "list_row_sparse_data() because its storage type is %s. Please " \
                                "use data() instead." % (self.name, self._stype))
+        self._finish_lazy_init()
         return self._get_row_sparse(self._data, list, row_id)
 
     def data(self, ctx=None):
@@ -585,6 +605,7 @@ class Parameter(object):
             raise RuntimeError("Cannot return a copy of Parameter '%s' on ctx %s via data() " \
                                "because its storage type is %s. Please use row_sparse_data() " \
                                "instead." % (self.name, str(ctx), self._stype))
+        self._finish_lazy_init()
         data = self._check_and_get(self._data, ctx)
         dc.set_variable(data, self.var())
         return data
@@ -602,6 +623,7 @@ class Parameter(object):
             raise RuntimeError("Cannot return copies of Parameter '%s' on all contexts via " \
                                "list_data() because its storage type is %s. Please use " \
                                "row_sparse_data() instead." % (self.name, self._stype))
+        self._finish_lazy_init()
         return self._check_and_get(self._data, list)
 
     def grad(self, ctx=None):
@@ -612,6 +634,7 @@ class Parameter(object):
         ctx : Context
             Desired context.
         """
+        self._finish_lazy_init()
         if self._data is not None and self._grad is None:
             raise RuntimeError(
                 "Cannot get gradient array for Parameter '%s' " \
@@ -621,6 +644,7 @@ class Parameter(object):
     def list_grad(self):
         """Returns gradient buffers on all contexts, in the same order
         as :py:meth:`values`."""
+        self._finish_lazy_init()
         if self._data is not None and self._grad is None:
             raise RuntimeError(
                 "Cannot get gradient array for Parameter '%s' " \
@@ -79,6 +79,8 @@ from .multinomial import *
 
 from .multivariate_normal import *
 
+from .low_rank_multivariate_normal import *
+
 from .transformed_distribution import *
 
 from .divergence import *
@@ -20,6 +20,8 @@
 """Bernoulli class."""
 __all__ = ['Bernoulli']
 
+import math
+from numbers import Number
 from .exp_family import ExponentialFamily
 from .utils import prob2logit, logit2prob, getF, cached_property, sample_n_shape_converter
 from .constraint import Boolean, Interval, Real
@@ -109,9 +111,15 @@ class Bernoulli(ExponentialFamily):
         if self._validate_args:
             self._validate_samples(value)
         F = self.F
-        if self.prob is None:
+        if 'prob' not in self.__dict__:
+            # Parameterized by logit: value * logit - log(1 + exp(logit)),
+            # with the stable softplus kernel instead of exp/log.
             logit = self.logit
-            return logit * (value - 1) - F.np.log(F.np.exp(-logit) + 1)
+            if isinstance(logit, Number):
+                softplus = max(logit, 0) + math.log1p(math.exp(-abs(logit)))
+            else:
+                softplus = F.npx.activation(logit, act_type='softrelu')
+            return value * logit - softplus
         else:
             # Parameterized by probability
             eps = 1e-12
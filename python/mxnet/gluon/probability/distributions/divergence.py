@@ -18,12 +18,14 @@
 # coding: utf-8
 # pylint: disable=wildcard-import
 """KL divergence functions."""
-__all__ = ['register_kl', 'kl_divergence', 'empirical_kl']
+__all__ = ['register_kl', 'kl_divergence', 'empirical_kl', 'empirical_kl_calls']
 
 import math
+import numbers
+import warnings
 import numpy as _np
 
-from .utils import gammaln, digamma
+from .utils import gammaln, digamma, sum_right_most
 from .exponential import Exponential
 from .pareto import Pareto
 from .uniform import Uniform
@@ -42,6 +44,9 @@ from .gumbel import Gumbel
 from .categorical import Categorical
 from .one_hot_categorical import OneHotCategorical
 from .multivariate_normal import MultivariateNormal
+from .low_rank_multivariate_normal import LowRankMultivariateNormal
+from .independent import Independent
+from .transformed_distribution import TransformedDistribution
 
 
 def empirical_kl(p, q, n_samples=1):
@@ -50,6 +55,10 @@ def empirical_kl(p, q, n_samples=1):
 
         1/M * \Sum_{i=1}^{M} log(p(x_i) / q(x_i)), x_i ~ p(x)
 
+    A warning is issued the first time this is called for a pair of
+    distribution types that has a closed-form KL registered, as
+    `kl_divergence` is both exact and cheaper in that case.
+
     Parameters
     ----------
     p : Distribution
@@ -57,30 +66,46 @@ def empirical_kl(p, q, n_samples=1):
     n_samples : int, optional
         Number of monte-carlo samples, by default 1
     """
+    types = (type(p), type(q))
+    _EMPIRICAL_KL_CALLS[types] = _EMPIRICAL_KL_CALLS.get(types, 0) + 1
+    if _EMPIRICAL_KL_CALLS[types] == 1 and _lookup_kl(*types) is not None:
+        warnings.warn('empirical_kl is sampling KL({}||{}), which has a closed-form '
+                      'implementation; use kl_divergence instead.'.format(
+                          types[0].__name__, types[1].__name__), stacklevel=2)
     samples = p.sample_n(n_samples)
     return (p.log_prob(samples) - q.log_prob(samples)).mean(0)
 
 
+def empirical_kl_calls():
+    """Return the number of `empirical_kl` calls made so far, keyed by the
+    `(type(p), type(q))` pair. Useful to check that a training loop does not
+    estimate KL terms by sampling."""
+    return dict(_EMPIRICAL_KL_CALLS)
+
+
 def register_kl(typeP, typeQ):
     """Decorator for registering custom implementation of kl divergence between
     distribution `typeP` and `typeQ`
 
+    The implementation is also used for subclasses of `typeP` and `typeQ`
+    that do not have a more specific one registered.
+
     Returns
-    ------- function
+    -------
+    function
     """
-    func_name = "_kl_" + str(typeP.__name__) \
-                + "_" + str(typeQ.__name__)
-
     def decorator(func):
         func_arg_num = func.__code__.co_argcount
         if (func_arg_num != 2):
             raise TypeError('Expect kl_divergence implementation '
                             + 'to have exactly two arguments, but got {}'.format(func_arg_num))
-        if not hasattr(_KL_storage, func_name):
-            setattr(_KL_storage, func_name, func)
+        if (typeP, typeQ) in _KL_REGISTRY:
+            warnings.warn('KL divergence between {} and {} is already registered, '
+                          'the new implementation is ignored.'.format(
+                              typeP.__name__, typeQ.__name__))
         else:
-            # Behavior TBD.
-            print("Error: Duplicate definition")
+            _KL_REGISTRY[typeP, typeQ] = func
+            _KL_MEMO.clear()
         return func
     return decorator
 
@@ -103,46 +128,112 @@ def kl_divergence(p, q):
     Tensor
         KL(p||q)
     """
-    func = _dispatch_kl(p.__class__.__name__, q.__class__.__name__)
+    func = _dispatch_kl(type(p), type(q))
     return func(p, q) # pylint: disable=not-callable
 
 
+def _lookup_kl(type_p, type_q):
+    """Find the most specific registered implementation for
+    (`type_p`, `type_q`) along both MROs, memoized per pair of types."""
+    key = (type_p, type_q)
+    if key in _KL_MEMO:
+        return _KL_MEMO[key]
+    mro_p, mro_q = type_p.__mro__, type_q.__mro__
+    best, best_rank = None, None
+    for (super_p, super_q), func in _KL_REGISTRY.items():
+        if super_p in mro_p and super_q in mro_q:
+            rank = (mro_p.index(super_p), mro_q.index(super_q))
+            if best_rank is None or rank < best_rank:
+                best, best_rank = func, rank
+    _KL_MEMO[key] = best
+    return best
+
+
 def _dispatch_kl(type_p, type_q):
-    r"""KL divergence methods should be registered
-    with distribution name,
-    i.e. the implementation of KL(P(\theta)||Q(\theta))
-    should be named after _kl_{P}_{Q}
+    r"""Return the KL implementation registered for `type_p` and `type_q`,
+    or for their closest base classes.
 
     Parameters
     ----------
-    type_q : Typename of a distribution
-    type_q : Typename of a distribution
+    type_p : Type of a distribution
+    type_q : Type of a distribution
 
 
     Returns
     -------
-    Get a class method with function name.
+    Get the registered function.
     """
-    func_name = "_kl_" + str(type_p) + "_" + str(type_q)
-    func_impl = getattr(_KL_storage, func_name, None)
-    if (not callable(func_impl)):
+    func_impl = _lookup_kl(type_p, type_q)
+    if func_impl is None:
         raise NotImplementedError(
-            "KL divergence between {} and {} is not implemented.".format(type_p, type_q))
+            "KL divergence between {} and {} is not implemented.".format(
+                type_p.__name__, type_q.__name__))
     return func_impl
 
 
-class _KL_storage():
-    r"""Class for storing the definition of kl divergence
-    between distributions.
-    All the class methods should be static
-    """
+# (typeP, typeQ) -> implementation
+_KL_REGISTRY = {}
+# (type(p), type(q)) -> resolved implementation or None
+_KL_MEMO = {}
+# (type(p), type(q)) -> number of empirical_kl calls
+_EMPIRICAL_KL_CALLS = {}
+
+
+def _same_transform(t_p, t_q):
+    """Check whether two transformations are known to be the same bijection."""
+    if t_p is t_q:
+        return True
+    if type(t_p) is not type(t_q) or not t_p.bijective:
+        return False
+    attrs_p = {k: v for k, v in vars(t_p).items() if k not in ('_F', '_inv')}
+    attrs_q = {k: v for k, v in vars(t_q).items() if k not in ('_F', '_inv')}
+    if attrs_p.keys() != attrs_q.keys():
+        return False
+    for k, v_p in attrs_p.items():
+        v_q = attrs_q[k]
+        if v_p is v_q:
+            continue
+        if isinstance(v_p, numbers.Number) and isinstance(v_q, numbers.Number) and v_p == v_q:
+            continue
+        if isinstance(v_p, (list, tuple)) and isinstance(v_q, (list, tuple)) and \
+                len(v_p) == len(v_q) and all(map(_same_transform, v_p, v_q)):
+            continue
+        return False
+    return True
+
+
+@register_kl(Normal, Normal)
+def _kl_normal_normal(p, q):
+    F = p.F
+    var_ratio = (p.scale / q.scale) ** 2
+    t1 = ((p.loc - q.loc) / q.scale) ** 2
+    return 0.5 * (var_ratio + t1 - 1 - F.np.log(var_ratio))
+
+
+@register_kl(Independent, Independent)
+def _kl_independent_independent(p, q):
+    if p.reinterpreted_batch_ndims != q.reinterpreted_batch_ndims:
+        raise NotImplementedError(
+            "KL divergence between Independent distributions with different "
+            "reinterpreted_batch_ndims is not implemented.")
+    kl = kl_divergence(p.base_dist, q.base_dist)
+    return sum_right_most(kl, p.reinterpreted_batch_ndims)
 
-    @staticmethod
-    def _kl_Normal_Normal(p, q):
-        F = p.F
-        var_ratio = (p.scale / q.scale) ** 2
-        t1 = ((p.loc - q.loc) / q.scale) ** 2
-        return 0.5 * (var_ratio + t1 - 1 - F.np.log(var_ratio))
+
+@register_kl(TransformedDistribution, TransformedDistribution)
+def _kl_transformed_transformed(p, q):
+    # KL divergence is invariant under a common bijection.
+    if len(p._transforms) != len(q._transforms) or \
+            not all(map(_same_transform, p._transforms, q._transforms)):
+        raise NotImplementedError(
+            "KL divergence between {} and {} is only implemented for the same "
+            "bijective transformations.".format(type(p).__name__, type(q).__name__))
+    if p.event_dim != q.event_dim:
+        raise NotImplementedError(
+            "KL divergence between transformed distributions with different "
+            "event_dim is not implemented.")
+    kl = kl_divergence(p._base_dist, q._base_dist)
+    return sum_right_most(kl, p.event_dim - p._base_dist.event_dim)
 
 
 @register_kl(Bernoulli, Bernoulli)
@@ -304,6 +395,9 @@ def _kl_binomial_binomial(p, q):
 
 
 @register_kl(MultivariateNormal, MultivariateNormal)
+@register_kl(MultivariateNormal, LowRankMultivariateNormal)
+@register_kl(LowRankMultivariateNormal, MultivariateNormal)
+@register_kl(LowRankMultivariateNormal, LowRankMultivariateNormal)
 def _kl_mvn_mvn(p, q):
     F = p.F
     log_det = (lambda mvn:
@@ -311,8 +405,8 @@ def _kl_mvn_mvn(p, q):
                    F.np.diagonal(mvn.scale_tril, axis1=-2, axis2=-1)
                ).sum(-1)
                )
-    # log(det(\Sigma_1) / det(\Sigma_2))
-    term1 = log_det(q) - log_det(p)
+    # log(det(\Sigma_2) / det(\Sigma_1))
+    term1 = 2 * (log_det(q) - log_det(p))
 
     # tr(inv(\Sigma_2) * \Sigma_1)
     term2 = F.np.trace(F.np.matmul(q.precision, p.cov), axis1=-2, axis2=-1)
@@ -324,7 +418,7 @@ def _kl_mvn_mvn(p, q):
         diff,
         # Batch matrix vector multiply
         F.np.einsum('...jk,...j->...k', q.precision, diff)
-    ) * -0.5
+    )
     n = F.np.ones_like(diff).sum(-1)
     return 0.5 * (term1 + term2 + term3 - n)
 
@@ -61,9 +61,9 @@ class Gamma(ExponentialFamily):
         lgamma = gammaln(F)
         # alpha (concentration)
         a = self.shape
-        # beta (rate)
-        b = 1 / self.scale
-        return a * log_fn(b) + (a - 1) * log_fn(value) - b * value - lgamma(a)
+        # theta (scale)
+        theta = self.scale
+        return (a - 1) * log_fn(value) - value / theta - (a * log_fn(theta) + lgamma(a))
 
     def broadcast_to(self, batch_shape):
         new_instance = self.__new__(type(self))
@@ -0,0 +1,205 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# coding: utf-8
+# pylint: disable=wildcard-import
+"""Multivariate Normal Distribution with low-rank plus diagonal covariance"""
+__all__ = ['LowRankMultivariateNormal']
+
+import math
+from .distribution import Distribution
+from .constraint import Real, Positive
+from .utils import getF, cached_property
+
+
+class LowRankMultivariateNormal(Distribution):
+    r"""Create a multivariate Normal distribution object whose covariance has the
+    low-rank plus diagonal form
+
+    .. math::
+
+        \Sigma = W W^T + \mathrm{diag}(D)
+
+    `log_prob`, `sample` and `entropy` only factorize the `k x k` capacitance
+    matrix :math:`I + W^T D^{-1} W`, once per instance, so their cost is linear in
+    the event size `n` instead of cubic. Without `cov_factor`, the covariance is
+    diagonal and all operations are element-wise.
+
+    Parameters
+    ----------
+    loc : Tensor
+        mean of the distribution, of shape `(..., n)`.
+    cov_factor : Tensor or None
+        factor `W` of the low-rank part of the covariance, of shape `(..., n, k)`.
+    cov_diag : Tensor
+        diagonal `D` of the covariance, of shape `(..., n)`.
+    F : mx.ndarray or mx.symbol.numpy._Symbol or None
+        Variable recording running mode, will be automatically
+        inferred from parameters if declared None.
+    """
+    # pylint: disable=abstract-method
+
+    has_grad = True
+    support = Real()
+    arg_constraints = {'loc': Real(),
+                       'cov_diag': Positive()}
+
+    def __init__(self, loc, cov_factor=None, cov_diag=None, F=None, validate_args=None):
+        if cov_diag is None:
+            raise ValueError("`cov_diag` must be specified")
+        _F = F if F is not None else getF(loc, cov_factor, cov_diag)
+        self.loc = loc
+        self.cov_factor = cov_factor
+        self.cov_diag = cov_diag
+        super(LowRankMultivariateNormal, self).__init__(
+            F=_F, event_dim=1, validate_args=validate_args)
+
+    def _eye_like(self, x):
+        """Identity matrices matching the last dimension of `x`."""
+        F = self.F
+        r = F.npx.arange_like(x, axis=-1)
+        return F.np.where(F.np.expand_dims(r, -1) == F.np.expand_dims(r, 0), 1.0, 0.0)
+
+    @cached_property
+    def _capacitance_tril(self):
+        r"""Cholesky factor of I + W^T D^{-1} W."""
+        F = self.F
+        W = self.cov_factor
+        Wt_Dinv = F.np.swapaxes(W / F.np.expand_dims(self.cov_diag, -1), -1, -2)
+        return F.np.linalg.cholesky(F.np.matmul(Wt_Dinv, W) + self._eye_like(W))
+
+    @cached_property
+    def _capacitance_inv(self):
+        F = self.F
+        L_inv = F.np.linalg.inv(self._capacitance_tril)
+        return F.np.matmul(F.np.swapaxes(L_inv, -1, -2), L_inv)
+
+    @cached_property
+    def _log_norm_const(self):
+        r"""log((2 * \pi)^{n/2} * det(\Sigma)^{1/2})"""
+        # matrix determinant lemma:
+        # det(W W^T + D) = det(I + W^T D^{-1} W) * det(D)
+        F = self.F
+        const = 0.5 * F.np.log(2 * math.pi * self.cov_diag).sum(-1)
+        if self.cov_factor is not None:
+            const = const + F.np.log(F.np.diagonal(
+                self._capacitance_tril, axis1=-2, axis2=-1)).sum(-1)
+        return const
+
+    @cached_property
+    def cov(self):
+        F = self.F
+        cov = F.np.expand_dims(self.cov_diag, -1) * self._eye_like(self.cov_diag)
+        if self.cov_factor is not None:
+            W = self.cov_factor
+            cov = cov + F.np.matmul(W, F.np.swapaxes(W, -1, -2))
+        return cov
+
+    @cached_property
+    def precision(self):
+        F = self.F
+        Dinv = 1 / self.cov_diag
+        precision = F.np.expand_dims(Dinv, -1) * self._eye_like(Dinv)
+        if self.cov_factor is not None:
+            # Woodbury identity:
+            # inv(W W^T + D) = D^{-1} - D^{-1} W inv(I + W^T D^{-1} W) W^T D^{-1}
+            Dinv_W = self.cov_factor * F.np.expand_dims(Dinv, -1)
+            precision = precision - F.np.matmul(
+                F.np.matmul(Dinv_W, self._capacitance_inv), F.np.swapaxes(Dinv_W, -1, -2))
+        return precision
+
+    @cached_property
+    def scale_tril(self):
+        return self.F.np.linalg.cholesky(self.cov)
+
+    @property
+    def mean(self):
+        return self.loc
+
+    @property
+    def variance(self):
+        if self.cov_factor is None:
+            return self.cov_diag + self.F.np.zeros_like(self.loc)
+        return (self.cov_factor ** 2).sum(-1) + self.cov_diag
+
+    def _transform_noise(self, noise_diag, noise_factor):
+        F = self.F
+        samples = self.loc + F.np.sqrt(self.cov_diag) * noise_diag
+        if self.cov_factor is not None:
+            samples = samples + F.np.einsum('...ik,...k->...i', self.cov_factor, noise_factor)
+        return samples
+
+    def sample(self, size=None):
+        F = self.F
+        # symbol does not support `np.broadcast`
+        shape_tensor = self.loc + self.cov_diag
+        factor_shape_tensor = None
+        if self.cov_factor is not None:
+            factor_shape_tensor = (F.np.expand_dims(shape_tensor, -1) +
+                                   self.cov_factor).sum(-2)
+        if size is not None:
+            if isinstance(size, int):
+                size = (size,)
+            shape_tensor = F.np.broadcast_to(shape_tensor, size + (-2,))
+            if factor_shape_tensor is not None:
+                factor_shape_tensor = F.np.broadcast_to(factor_shape_tensor, size + (-2,))
+        noise_diag = F.np.random.normal(F.np.zeros_like(shape_tensor),
+                                        F.np.ones_like(shape_tensor))
+        noise_factor = None
+        if factor_shape_tensor is not None:
+            noise_factor = F.np.random.normal(F.np.zeros_like(factor_shape_tensor),
+                                              F.np.ones_like(factor_shape_tensor))
+        return self._transform_noise(noise_diag, noise_factor)
+
+    def sample_n(self, size=None):
+        if size is None:
+            return self.sample()
+        F = self.F
+        if isinstance(size, int):
+            size = (size,)
+        # symbol does not support `np.broadcast`
+        shape_tensor = self.loc + self.cov_diag
+        noise_diag = F.np.random.normal(F.np.zeros_like(shape_tensor),
+                                        F.np.ones_like(shape_tensor), (-2,) + size)
+        noise_factor = None
+        if self.cov_factor is not None:
+            factor_shape_tensor = (F.np.expand_dims(shape_tensor, -1) +
+                                   self.cov_factor).sum(-2)
+            noise_factor = F.np.random.normal(F.np.zeros_like(factor_shape_tensor),
+                                              F.np.ones_like(factor_shape_tensor),
+                                              (-2,) + size)
+        return self._transform_noise(noise_diag, noise_factor)
+
+    def log_prob(self, value):
+        if self._validate_args:
+            self._validate_samples(value)
+        F = self.F
+        diff = value - self.loc
+        Dinv_diff = diff / self.cov_diag
+        # diff.T * inv(\Sigma) * diff, with the Woodbury identity
+        M = (diff * Dinv_diff).sum(-1)
+        if self.cov_factor is not None:
+            Wt_Dinv_diff = F.np.einsum('...ik,...i->...k', self.cov_factor, Dinv_diff)
+            M = M - F.np.einsum(
+                '...k,...k->...', Wt_Dinv_diff,
+                F.np.einsum('...kl,...l->...k', self._capacitance_inv, Wt_Dinv_diff))
+        return -0.5 * M - self._log_norm_const
+
+    def entropy(self):
+        F = self.F
+        # 0.5 * log(det(2 * \pi * e * \Sigma))
+        return self._log_norm_const + 0.5 * F.np.ones_like(self.cov_diag).sum(-1)
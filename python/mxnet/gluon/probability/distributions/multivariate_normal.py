@@ -42,6 +42,13 @@ class MultivariateNormal(Distribution):
     F : mx.ndarray or mx.symbol.numpy._Symbol or None
         Variable recording running mode, will be automatically
         inferred from parameters if declared None.
+
+    Notes
+    -----
+    The Cholesky factor, covariance, precision and log-determinant are computed
+    at most once per instance and reused by `log_prob`, `sample` and `entropy`.
+    For covariances with a low-rank-plus-diagonal or diagonal structure, use
+    `LowRankMultivariateNormal`, whose cost is linear in the event size.
     """
     # pylint: disable=abstract-method
 
@@ -113,8 +120,22 @@ class MultivariateNormal(Distribution):
 
     @property
     def variance(self):
+        if 'cov' in self.__dict__:
+            return self.F.np.diagonal(self.cov, axis1=-2, axis2=-1)
         return (self.scale_tril ** 2).sum(-1)
 
+    @cached_property
+    def _log_norm_const(self):
+        r"""log((2 * \pi)^{k/2} * det(\Sigma)^{1/2})"""
+        #   (2 * \pi)^{k/2} * det(\Sigma)^{1/2}
+        # = det(2 * \pi * L * L.T)^{1/2}
+        # = det(\sqrt(2 * \pi) * L)
+        F = self.F
+        return F.np.log(
+            F.np.diagonal(F.np.sqrt(2 * math.pi) *
+                          self.scale_tril, axis1=-2, axis2=-1)
+        ).sum(-1)
+
     def sample(self, size=None):
         F = self.F
         # symbol does not support `np.broadcast`
@@ -126,7 +147,7 @@ class MultivariateNormal(Distribution):
         noise = F.np.random.normal(F.np.zeros_like(
             shape_tensor), F.np.ones_like(shape_tensor))
         samples = self.loc + \
-            F.np.einsum('...jk,...j->...k', self.scale_tril, noise)
+            F.np.einsum('...kj,...j->...k', self.scale_tril, noise)
         return samples
 
     def sample_n(self, size=None):
@@ -140,7 +161,7 @@ class MultivariateNormal(Distribution):
         noise = F.np.random.normal(F.np.zeros_like(shape_tensor), F.np.ones_like(shape_tensor),
                                    (-2,) + size)
         samples = self.loc + \
-            F.np.einsum('...jk,...j->...k', self.scale_tril, noise)
+            F.np.einsum('...kj,...j->...k', self.scale_tril, noise)
         return samples
 
     def log_prob(self, value):
@@ -155,14 +176,7 @@ class MultivariateNormal(Distribution):
             F.np.einsum('...jk,...j->...k', self.precision,
                         diff)  # Batch matrix vector multiply
         ) * -0.5
-        #   (2 * \pi)^{-k/2} * det(\Sigma)^{-1/2}
-        # = det(2 * \pi * L * L.T)^{-1/2}
-        # = det(\sqrt(2 * \pi) * L)^{-1}
-        half_log_det = F.np.log(
-            F.np.diagonal(F.np.sqrt(2 * math.pi) *
-                          self.scale_tril, axis1=-2, axis2=-1)
-        ).sum(-1)
-        return M - half_log_det
+        return M - self._log_norm_const
 
     def entropy(self):
         F = self.F
@@ -21,10 +21,13 @@
 __all__ = ['Normal']
 
 import math
+from numbers import Number
 from .constraint import Real, Positive
 from .exp_family import ExponentialFamily
 from .utils import getF, erf, erfinv
 
+_LOG_SQRT_2PI = 0.5 * math.log(2 * math.pi)
+
 
 class Normal(ExponentialFamily):
     r"""Create a Normal distribution object.
@@ -68,11 +71,10 @@ class Normal(ExponentialFamily):
         if self._validate_args:
             self._validate_samples(value)
         F = self.F
-        log_scale = F.np.log(self.scale)
-        log_prob = -((value - self.loc) ** 2) / (2 * self.variance)
-        log_prob = log_prob - log_scale
-        log_prob = log_prob - F.np.log(F.np.sqrt(2 * math.pi))
-        return log_prob
+        scale = self.scale
+        log_scale = math.log(scale) if isinstance(scale, Number) else F.np.log(scale)
+        z = (value - self.loc) / scale
+        return -0.5 * z * z - log_scale - _LOG_SQRT_2PI
 
     def sample(self, size=None):
         r"""Generate samples of `size` from the normal distribution
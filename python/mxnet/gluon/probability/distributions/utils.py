@@ -21,13 +21,10 @@
 __all__ = ['getF', 'prob2logit', 'logit2prob', 'cached_property', 'sample_n_shape_converter',
            'constraint_check', 'digamma', 'gammaln', 'erfinv', 'erf']
 
+import math
 from functools import update_wrapper
 from numbers import Number
 import numpy as onp
-try:
-    import scipy.special as sc
-except ImportError:
-    sc = None
 from .... import symbol as sym
 from .... import ndarray as nd
 
@@ -44,6 +41,55 @@ def constraint_check(F):
     return _check
 
 
+def _digamma_scalar(x):
+    """Digamma function of a python scalar."""
+    if x <= 0 and x == math.floor(x):
+        return math.nan
+    if x < 0:
+        # reflection formula
+        return _digamma_scalar(1 - x) - math.pi / math.tan(math.pi * x)
+    result = 0.
+    while x < 6:
+        result -= 1 / x
+        x += 1
+    inv2 = 1 / (x * x)
+    return (result + math.log(x) - 0.5 / x -
+            inv2 * (1. / 12 - inv2 * (1. / 120 - inv2 * (1. / 252 - inv2 * (1. / 240 -
+                                                                          inv2 / 132)))))
+
+
+def _gammaln_scalar(x):
+    """Log of the absolute value of the gamma function of a python scalar."""
+    try:
+        return math.lgamma(x)
+    except ValueError:
+        # poles of the gamma function
+        return math.inf
+
+
+def _erfinv_scalar(y):
+    """Inverse error function of a python scalar."""
+    if y <= -1 or y >= 1:
+        return math.copysign(math.inf, y) if abs(y) == 1 else math.nan
+    # single precision approximation of M. Giles, refined by Newton steps
+    w = -math.log((1 - y) * (1 + y))
+    if w < 5:
+        w -= 2.5
+        coefs = (2.81022636e-08, 3.43273939e-07, -3.5233877e-06, -4.39150654e-06,
+                 0.00021858087, -0.00125372503, -0.00417768164, 0.246640727, 1.50140941)
+    else:
+        w = math.sqrt(w) - 3
+        coefs = (-0.000200214257, 0.000100950558, 0.00134934322, -0.00367342844,
+                 0.00573950773, -0.0076224613, 0.00943887047, 1.00167406, 2.83297682)
+    p = 0.
+    for c in coefs:
+        p = c + p * w
+    x = p * y
+    for _ in range(2):
+        x -= (math.erf(x) - y) / (2 / math.sqrt(math.pi) * math.exp(-x * x))
+    return x
+
+
 def digamma(F):
     """Unified digamma interface for both scalar and tensor
     """
@@ -51,10 +97,7 @@ def digamma(F):
         """Return digamma(value)
         """
         if isinstance(value, Number):
-            if sc is not None:
-                return sc.digamma(value, dtype='float32')
-            else:
-                raise ValueError('Numbers are not supported as input if scipy is not installed')
+            return onp.float32(_digamma_scalar(value))
         return F.npx.digamma(value)
     return compute
 
@@ -66,10 +109,7 @@ def gammaln(F):
         """Return log(gamma(value))
         """
         if isinstance(value, Number):
-            if sc is not None:
-                return sc.gammaln(value, dtype='float32')
-            else:
-                raise ValueError('Numbers are not supported as input if scipy is not installed')
+            return onp.float32(_gammaln_scalar(value))
         return F.npx.gammaln(value)
     return compute
 
@@ -79,10 +119,7 @@ def erf(F):
     """
     def compute(value):
         if isinstance(value, Number):
-            if sc is not None:
-                return sc.erf(value)
-            else:
-                raise ValueError('Numbers are not supported as input if scipy is not installed')
+            return math.erf(value)
         return F.npx.erf(value)
     return compute
 
@@ -92,10 +129,7 @@ def erfinv(F):
     """
     def compute(value):
         if isinstance(value, Number):
-            if sc is not None:
-                return sc.erfinv(value)
-            else:
-                raise ValueError('Numbers are not supported as input if scipy is not installed')
+            return _erfinv_scalar(value)
         return F.npx.erfinv(value)
     return compute
 
@@ -127,6 +127,11 @@ class RecurrentCell(Block):
     """Abstract base class for RNN cells
 
     """
+    # Whether one step of this cell can be traced as the body of a `foreach`
+    # loop. Cells that carry Python-side state from one step to the next
+    # (e.g. the previous output in ZoneoutCell) must set this to False.
+    _fusable = True
+
     def __init__(self):
         super(RecurrentCell, self).__init__()
         self._modified = False
@@ -185,7 +190,7 @@ class RecurrentCell(Block):
         return states
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         """Unrolls an RNN cell across time steps.
 
         Parameters
@@ -224,6 +229,14 @@ class RecurrentCell(Block):
             The ith element will be the length of the ith sequence in the batch.
             The last valid state will be return and the padded outputs will be masked with 0.
             Note that `valid_length` must be smaller or equal to `length`.
+        fused : bool, default False
+            If `True`, the time loop is expressed with the `foreach` control flow
+            operator instead of being unrolled in Python. One step of the cell is
+            traced once, so the size of the hybridized graph and its build time
+            do not grow with `length`, and the last valid state is tracked inside
+            the loop rather than by stacking the states of every step.
+            Cells that keep Python state between steps (e.g. `ZoneoutCell`)
+            ignore this option and are always unrolled in Python.
 
         Returns
         -------
@@ -239,6 +252,10 @@ class RecurrentCell(Block):
         # pylint: disable=too-many-locals
         self.reset()
 
+        if fused and self._fusable:
+            return self._fused_unroll(length, inputs, begin_state, layout, merge_outputs,
+                                      valid_length)
+
         inputs, axis, F, batch_size = _format_sequence(length, inputs, layout, False)
         begin_state = _get_begin_state(self, F, begin_state, inputs, batch_size)
 
@@ -261,6 +278,17 @@ class RecurrentCell(Block):
 
         return outputs, states
 
+    def _fused_unroll(self, length, inputs, begin_state, layout, merge_outputs, valid_length):
+        """Unrolls the cell with a single `foreach` loop over the time axis."""
+        inputs, axis, F, batch_size = _format_sequence(length, inputs, layout, True)
+        begin_state = _get_begin_state(self, F, begin_state, inputs, batch_size)
+        outputs, states = dynamic_unroll(self, inputs, begin_state, layout=layout,
+                                         valid_length=valid_length)
+        if merge_outputs is False:
+            outputs = _as_list(F.split(outputs, axis=axis, num_outputs=length,
+                                       squeeze_axis=1))
+        return outputs, states
+
     #pylint: disable=no-self-use
     def _get_activation(self, F, inputs, activation, **kwargs):
         """Get activation function. Convert if is string"""
@@ -719,7 +747,7 @@ class SequentialRNNCell(RecurrentCell):
         return inputs, sum(next_states, [])
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         # pylint: disable=too-many-locals
         self.reset()
 
@@ -736,7 +764,7 @@ class SequentialRNNCell(RecurrentCell):
             inputs, states = cell().unroll(length, inputs=inputs, begin_state=states,
                                            layout=layout,
                                            merge_outputs=None if i < num_cells-1 else merge_outputs,
-                                           valid_length=valid_length)
+                                           valid_length=valid_length, fused=fused)
             next_states.extend(states)
 
         return inputs, next_states
@@ -798,7 +826,7 @@ class HybridSequentialRNNCell(HybridRecurrentCell):
         return inputs, sum(next_states, [])
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         self.reset()
 
         inputs, _, F, batch_size = _format_sequence(length, inputs, layout, None)
@@ -814,7 +842,7 @@ class HybridSequentialRNNCell(HybridRecurrentCell):
             inputs, states = cell().unroll(length, inputs=inputs, begin_state=states,
                                            layout=layout,
                                            merge_outputs=None if i < num_cells-1 else merge_outputs,
-                                           valid_length=valid_length)
+                                           valid_length=valid_length, fused=fused)
             next_states.extend(states)
 
         return inputs, next_states
@@ -873,7 +901,7 @@ class DropoutCell(HybridRecurrentCell):
         return inputs, states
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         self.reset()
 
         inputs, _, F, _ = _format_sequence(length, inputs, layout, merge_outputs)
@@ -881,7 +909,7 @@ class DropoutCell(HybridRecurrentCell):
             return self.hybrid_forward(F, inputs, begin_state if begin_state else [])
         return super(DropoutCell, self).unroll(
             length, inputs, begin_state=begin_state, layout=layout,
-            merge_outputs=merge_outputs, valid_length=None)
+            merge_outputs=merge_outputs, valid_length=None, fused=fused)
 
 
 class ModifierCell(HybridRecurrentCell):
@@ -927,6 +955,8 @@ class ModifierCell(HybridRecurrentCell):
 
 class ZoneoutCell(ModifierCell):
     """Applies Zoneout on base cell."""
+    _fusable = False
+
     def __init__(self, base_cell, zoneout_outputs=0., zoneout_states=0.):
         assert not isinstance(base_cell, BidirectionalCell), \
             "BidirectionalCell doesn't support zoneout since it doesn't support step. " \
@@ -987,13 +1017,13 @@ class ResidualCell(ModifierCell):
         return output, states
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         self.reset()
 
         self.base_cell._modified = False
         outputs, states = self.base_cell.unroll(length, inputs=inputs, begin_state=begin_state,
                                                 layout=layout, merge_outputs=merge_outputs,
-                                                valid_length=valid_length)
+                                                valid_length=valid_length, fused=fused)
         self.base_cell._modified = True
 
         merge_outputs = isinstance(outputs, tensor_types) if merge_outputs is None else \
@@ -1045,7 +1075,7 @@ class BidirectionalCell(HybridRecurrentCell):
         return _cells_begin_state(self._children.values(), **kwargs)
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         # pylint: disable=too-many-locals
         self.reset()
 
@@ -1058,12 +1088,12 @@ class BidirectionalCell(HybridRecurrentCell):
         l_outputs, l_states = l_cell.unroll(length, inputs=inputs,
                                             begin_state=states[:len(l_cell.state_info(batch_size))],
                                             layout=layout, merge_outputs=merge_outputs,
-                                            valid_length=valid_length)
+                                            valid_length=valid_length, fused=fused)
         r_outputs, r_states = r_cell.unroll(length,
                                             inputs=reversed_inputs,
                                             begin_state=states[len(l_cell.state_info(batch_size)):],
                                             layout=layout, merge_outputs=False,
-                                            valid_length=valid_length)
+                                            valid_length=valid_length, fused=fused)
         reversed_r_outputs = _reverse_sequences(r_outputs, length, valid_length)
 
         if merge_outputs is None:
@@ -1177,7 +1207,7 @@ class VariationalDropoutCell(ModifierCell):
                         **self.__dict__)
 
     def unroll(self, length, inputs, begin_state=None, layout='NTC', merge_outputs=None,
-               valid_length=None):
+               valid_length=None, fused=False):
         """Unrolls an RNN cell across time steps.
 
         Parameters
@@ -1216,6 +1246,9 @@ class VariationalDropoutCell(ModifierCell):
             The ith element will be the length of the ith sequence in the batch.
             The last valid state will be return and the padded outputs will be masked with 0.
             Note that `valid_length` must be smaller or equal to `length`.
+        fused : bool, default False
+            If `True` and state dropout is disabled, the base cell is unrolled
+            with the `foreach` control flow operator. See `RecurrentCell.unroll`.
 
         Returns
         -------
@@ -1245,7 +1278,7 @@ class VariationalDropoutCell(ModifierCell):
             inputs = F.Dropout(inputs, p=self.drop_inputs, axes=(axis,))
 
         outputs, states = self.base_cell.unroll(length, inputs, states, layout, merge_outputs=True,
-                                                valid_length=valid_length)
+                                                valid_length=valid_length, fused=fused)
         if self.drop_outputs:
             outputs = F.Dropout(outputs, p=self.drop_outputs, axes=(axis,))
         merge_outputs = isinstance(outputs, tensor_types) if merge_outputs is None else \
@@ -1466,7 +1499,9 @@ def dynamic_unroll(cell, inputs, begin_state, drop_inputs=0, drop_outputs=0,
         for s in states:
             zeros.append(F.zeros_like(s))
         states = list(_as_list(states))
-        states.append(F.zeros((1)))
+        # Keep the step counter on the context and in the dtype of valid_length
+        # so that the comparison inside the loop needs no copies.
+        states.append(F.zeros_like(F.slice_axis(valid_length, axis=0, begin=0, end=1)))
         def loop_body(inputs, states):
             cell_states = states[:-1]
             iter_no = states[-1]
@@ -20,9 +20,10 @@
 """Parameter optimizer."""
 __all__ = ['Trainer']
 
+import warnings
 from collections import OrderedDict
 
-from .. import optimizer as opt
+from .. import optimizer as opt, profiler as _profiler, ndarray
 from ..model import _create_kvstore, _create_sparse_kvstore
 from .parameter import Parameter
 from ..kvstore import KVStore
@@ -41,6 +42,13 @@ class Trainer(object):
         - dist async kvstore
         - `optimizer.lr_scheduler` is not None
 
+    .. note::
+
+        With a dist kvstore, Parameters with dense weight and 'row_sparse' gradient
+        (e.g. `nn.Embedding(sparse_grad=True)`) pull the whole weight from the servers
+        after every update. Call :py:meth:`prefetch_rows` with the row ids of the next
+        batch before `step()` to pull only those rows instead.
+
     Parameters
     ----------
     params : Dict
@@ -123,6 +131,8 @@ class Trainer(object):
         self._update_on_kvstore = None
         self._distributed = None
         self._params_to_init = []
+        self._prefetch_row_ids = {}
+        self._row_buffers = {}
         self._reset_kvstore()
 
     def _check_contexts(self):
@@ -184,6 +194,7 @@ class Trainer(object):
         self._distributed = None
         self._update_on_kvstore = None
         self._params_to_init = [param for param in self._params]
+        self._row_buffers = {}
 
     def _init_kvstore(self):
         """Create kvstore."""
@@ -238,6 +249,11 @@ class Trainer(object):
             if kvstore is not None and not isinstance(kvstore, KVStore):
                 raise ValueError("Cannot use {} for multi-device training with sparse gradients"
                                  .format(type(kvstore)))
+            if update_on_kvstore and getattr(self._optimizer, 'lazy_update', True) is False:
+                warnings.warn("Optimizer %s has lazy_update=False. The servers will update "
+                              "every row of the weights with sparse gradients on each step. "
+                              "Set lazy_update=True to only update the rows present in the "
+                              "gradients."%type(self._optimizer).__name__, stacklevel=3)
 
         else:
             # Training with dense weight and dense gradients.
@@ -321,6 +337,47 @@ class Trainer(object):
         else:
             self._kvstore.row_sparse_pull(idx, out=out, row_ids=row_id, priority=-idx)
 
+    def prefetch_rows(self, row_ids):
+        """Registers the rows that the next batch reads from Parameters with dense weight
+        and 'row_sparse' gradient, such as the weight of `nn.Embedding(sparse_grad=True)`.
+
+        When training with a dist kvstore, the next `step()` or `allreduce_grads()` pulls
+        only these rows of the updated weight from the servers instead of the whole weight.
+        The remaining rows of the local weight are stale until they are pulled again, so
+        this should only be used if the next forward pass does not read them.
+        Row ids are consumed by the next step; if no row ids are registered for a
+        Parameter, the whole weight is pulled. Other kvstores ignore the row ids.
+
+        Parameters
+        ----------
+        row_ids : dict of Parameter to NDArray
+            Row ids read by the next batch for each Parameter, typically the token ids
+            of the next batch from the DataLoader. Row ids do not have to be unique
+            nor sorted.
+        """
+        for param, rows in row_ids.items():
+            if param._uuid not in self._param2idx:
+                raise ValueError("Parameter %s is not optimized by this Trainer."%param.name)
+            if param._stype != 'default' or param._grad_stype != 'row_sparse':
+                raise ValueError("prefetch_rows() requires a Parameter with dense weight and "
+                                 "'row_sparse' gradient, but Parameter %s has stype '%s' and "
+                                 "grad_stype '%s'."%(param.name, param._stype, param._grad_stype))
+            if not isinstance(rows, ndarray.NDArray):
+                raise TypeError("row_ids must have NDArray type, but %s is given"%(type(rows)))
+            self._prefetch_row_ids[param._uuid] = rows.reshape((-1,)).astype('int64', copy=False)
+
+    def _pull_rows(self, idx, param, row_ids, priority):
+        """Pulls rows `row_ids` of a dense Parameter and writes them into its data."""
+        buffers = self._row_buffers.get(param._uuid)
+        if buffers is None:
+            buffers = [ndarray.sparse.zeros('row_sparse', param.shape, ctx=data.context,
+                                            dtype=data.dtype)
+                       for data in param.list_data()]
+            self._row_buffers[param._uuid] = buffers
+        self._kvstore.row_sparse_pull(idx, out=buffers, row_ids=row_ids, priority=priority)
+        for buf, data in zip(buffers, param.list_data()):
+            data[buf.indices] = buf.data
+
     def _check_and_rescale_grad(self, scale):
         if self._update_on_kvstore and self._distributed and self._kv_initialized:
             if self._optimizer.rescale_grad != scale:
@@ -357,8 +414,10 @@ class Trainer(object):
         if self._params_to_init:
             self._init_params()
 
-        self._allreduce_grads()
-        self._update(ignore_stale_grad)
+        with _profiler.hot_path('Trainer::allreduce_grads'):
+            self._allreduce_grads()
+        with _profiler.hot_path('Trainer::update'):
+            self._update(ignore_stale_grad)
 
     def allreduce_grads(self):
         """For each parameter, reduce the gradients from different contexts.
@@ -380,9 +439,18 @@ class Trainer(object):
                 'is not supported. Try setting `update_on_kvstore` ' \
                 'to False when creating trainer.'
 
-        self._allreduce_grads()
+        with _profiler.hot_path('Trainer::allreduce_grads'):
+            self._allreduce_grads()
 
     def _allreduce_grads(self):
+        try:
+            self._allreduce_grads_impl()
+        finally:
+            # row ids only apply to the step they were registered for, also when
+            # the kvstore or the gradient type does not use them
+            self._prefetch_row_ids.clear()
+
+    def _allreduce_grads_impl(self):
         # nothing to reduce
         if not self._kvstore:
             return
@@ -393,7 +461,12 @@ class Trainer(object):
                 # sparse gradients, call push and pull separately
                 if grad_list[0].stype != 'default':
                     self._kvstore.push(idx, grad_list, priority=-i)
-                    if param._stype == 'default':
+                    row_ids = self._prefetch_row_ids.pop(param._uuid, None)
+                    if param._stype == 'default' and row_ids is not None and \
+                            self._update_on_kvstore and self._distributed:
+                        if row_ids.size:
+                            self._pull_rows(idx, param, row_ids, priority=-i)
+                    elif param._stype == 'default':
                         if self._update_on_kvstore:
                             pull_list = param.list_data()
                         else:
@@ -439,7 +512,8 @@ class Trainer(object):
                 'to False when creating trainer.'
 
         self._check_and_rescale_grad(self._scale / batch_size)
-        self._update(ignore_stale_grad)
+        with _profiler.hot_path('Trainer::update'):
+            self._update(ignore_stale_grad)
 
     def _update(self, ignore_stale_grad=False):
         loss_scaler = getattr(self, '_amp_loss_scaler', None)
@@ -19,7 +19,7 @@
 # pylint: disable=
 """Parallelization utility optimizer."""
 
-__all__ = ['split_data', 'split_and_load', 'clip_global_norm',
+__all__ = ['split_data', 'split_and_load', 'split_and_load_iter', 'clip_global_norm',
            'check_sha1', 'download', 'replace_file']
 
 import os
@@ -33,7 +33,7 @@ import requests
 
 import numpy as np
 
-from .. import ndarray
+from .. import ndarray, context
 from ..util import is_np_shape, is_np_array
 from .. import numpy as _mx_np  # pylint: disable=reimported
 
@@ -84,10 +84,33 @@ def split_data(data, num_slice, batch_axis=0, even_split=True):
     return slices
 
 
-def split_and_load(data, ctx_list, batch_axis=0, even_split=True):
+def _split_views(data, num_slice, even_split=True):
+    """Split `data` along the first axis into views sharing its memory, or return None
+    when some slice would be empty. Internal use only."""
+    size = data.shape[0]
+    if even_split and size % num_slice != 0:
+        return None
+    n_each_section, extras = divmod(size, num_slice)
+    if n_each_section == 0:
+        return None
+    views = []
+    begin = 0
+    for i in range(num_slice):
+        end = begin + n_each_section + (1 if i < extras else 0)
+        views.append(data[begin:end])
+        begin = end
+    return views
+
+
+def split_and_load(data, ctx_list, batch_axis=0, even_split=True, pin_memory=False):
     """Splits an NDArray into `len(ctx_list)` slices along `batch_axis` and loads
     each slice to one context in `ctx_list`.
 
+    Slices along the first axis are views into `data`, so each device receives
+    a single copy of its part of the batch. Slices for the context of `data` are
+    copied as well and never alias the batch. All copies are issued asynchronously
+    and do not block the caller.
+
     Parameters
     ----------
     data : NDArray or ndarray
@@ -98,6 +121,11 @@ def split_and_load(data, ctx_list, batch_axis=0, even_split=True):
         The axis along which to slice.
     even_split : bool, default True
         Whether to force all slices to have the same number of elements.
+    pin_memory : bool, default False
+        Whether to stage `data` in pinned (page-locked) host memory before copying
+        it to GPUs, which lets the host to device copies overlap with computation.
+        Data already in pinned memory, e.g. from ``DataLoader(pin_memory=True)``,
+        is never copied again on the host.
 
     Returns
     -------
@@ -106,12 +134,81 @@ def split_and_load(data, ctx_list, batch_axis=0, even_split=True):
     """
     array_fn = _mx_np.array if is_np_array() else ndarray.array
     if not isinstance(data, ndarray.NDArray):
-        data = array_fn(data, ctx=ctx_list[0])
+        if len(ctx_list) == 1 and not pin_memory:
+            return [array_fn(data, ctx=ctx_list[0])]
+        data = array_fn(data, ctx=context.cpu())
+    if pin_memory and data.context.device_type == 'cpu':
+        gpus = [ctx for ctx in ctx_list if ctx.device_type == 'gpu']
+        if gpus:
+            data = data.as_in_context(context.cpu_pinned(gpus[0].device_id))
     if len(ctx_list) == 1:
         return [data.as_in_context(ctx_list[0])]
 
-    slices = split_data(data, len(ctx_list), batch_axis, even_split)
-    return [i.as_in_context(ctx) for i, ctx in zip(slices, ctx_list)]
+    slices = None
+    if batch_axis == 0:
+        slices = _split_views(data, len(ctx_list), even_split)
+    if slices is None:
+        slices = split_data(data, len(ctx_list), batch_axis, even_split)
+    # as_in_context returns the view itself for the context of data
+    return [i.copyto(ctx) if ctx == data.context else i.as_in_context(ctx)
+            for i, ctx in zip(slices, ctx_list)]
+
+
+def split_and_load_iter(loader, ctx_list, batch_axis=0, even_split=True,
+                        pin_memory=False, prefetch=1):
+    """Iterates over `loader` and splits and loads every batch onto `ctx_list`
+    ahead of time.
+
+    The copies of the next `prefetch` batches are issued before the current batch
+    is returned, so they are queued ahead of the computation on the current batch
+    and run concurrently with it on the copy queues of the engine. Combine with
+    ``DataLoader(pin_memory=True)`` so batches arrive in pinned memory.
+
+    Parameters
+    ----------
+    loader : iterable
+        Yields batches, each either an NDArray or a list or tuple of NDArrays,
+        e.g. a `DataLoader`.
+    ctx_list : list of Context
+        A list of Contexts.
+    batch_axis : int, default 0
+        The axis along which to slice.
+    even_split : bool, default True
+        Whether to force all slices to have the same number of elements.
+    pin_memory : bool, default False
+        Whether to stage batches that are not already in pinned memory in pinned
+        memory first. See `split_and_load`.
+    prefetch : int, default 1
+        Number of batches to load ahead of the one being returned.
+
+    Returns
+    -------
+    iterator
+        Yields a list of NDArrays per batch, one for each context in `ctx_list`,
+        or a tuple of such lists when the batch is a list or tuple.
+
+    Examples
+    --------
+    >>> loader = gluon.data.DataLoader(dataset, batch_size, pin_memory=True)
+    >>> for data, label in gluon.utils.split_and_load_iter(loader, ctx_list):
+    ...     with autograd.record():
+    ...         losses = [loss_fn(net(x), y) for x, y in zip(data, label)]
+    """
+    def _load(batch):
+        if isinstance(batch, (list, tuple)):
+            return tuple(split_and_load(x, ctx_list, batch_axis, even_split, pin_memory)
+                         for x in batch)
+        return split_and_load(batch, ctx_list, batch_axis, even_split, pin_memory)
+
+    if prefetch < 0:
+        raise ValueError('prefetch must be non-negative, got %d' % prefetch)
+    pending = collections.deque()
+    for batch in loader:
+        pending.append(_load(batch))
+        if len(pending) > prefetch:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
 
 
 def clip_global_norm(arrays, max_norm, check_isfinite=True):
@@ -192,12 +289,16 @@ def check_sha1(filename, sha1_hash):
         Whether the file content matches the expected hash.
     """
     sha1 = hashlib.sha1()
-    with open(filename, 'rb') as f:
+    # read into one reused buffer; hashlib releases the GIL for large updates so
+    # concurrent verifications from several threads hash in parallel.
+    chunk = bytearray(8 * 1048576)
+    view = memoryview(chunk)
+    with open(filename, 'rb', buffering=0) as f:
         while True:
-            data = f.read(1048576)
-            if not data:
+            size = f.readinto(chunk)
+            if not size:
                 break
-            sha1.update(data)
+            sha1.update(view[:size])
 
     return sha1.hexdigest() == sha1_hash
 
@@ -567,17 +567,24 @@ class Orthogonal(Initializer):
 
     def _init_weight(self, _, arr):
         nout = arr.shape[0]
-        nin = np.prod(arr.shape[1:])
+        nin = int(np.prod(arr.shape[1:]))
+        # LQ factorization requires rows <= columns, so factorize the transpose
+        # for tall matrices. The factorization runs on the target device and
+        # avoids a host round trip through a full SVD.
+        transpose = nout > nin
+        shape = (nin, nout) if transpose else (nout, nin)
         if self.rand_type == "uniform":
-            tmp = random.uniform(-1.0, 1.0, shape=(nout, nin)).asnumpy()
+            tmp = random.uniform(-1.0, 1.0, shape=shape, ctx=arr.ctx)
         elif self.rand_type == "normal":
-            tmp = random.normal(0.0, 1.0, shape=(nout, nin)).asnumpy()
-        u, _, v = np.linalg.svd(tmp, full_matrices=False) # pylint: disable=invalid-name
-        if u.shape == tmp.shape:
-            res = u
-        else:
-            res = v
-        res = self.scale * res.reshape(arr.shape)
+            tmp = random.normal(0.0, 1.0, shape=shape, ctx=arr.ctx)
+        q, l = ndarray.linalg.gelqf(tmp) # pylint: disable=invalid-name
+        # make the factorization unique so the result is uniformly distributed
+        q = ndarray.broadcast_mul(q, ndarray.sign(ndarray.diag(l)).reshape((-1, 1)))
+        if transpose:
+            q = q.T
+        res = (self.scale * q).reshape(arr.shape).astype(arr.dtype, copy=False)
+        if is_np_array():
+            res = res.as_np_ndarray()
         arr[:] = res
 
 @register
@@ -679,15 +686,13 @@ class Bilinear(Initializer):
         super(Bilinear, self).__init__()
 
     def _init_weight(self, _, arr):
-        weight = np.zeros(np.prod(arr.shape), dtype='float32')
         shape = arr.shape
         f = np.ceil(shape[3] / 2.)
         c = (2 * f - 1 - f % 2) / (2. * f)
-        for i in range(np.prod(shape)):
-            x = i % shape[3]
-            y = (i // shape[3]) % shape[2]
-            weight[i] = (1 - abs(x / f - c)) * (1 - abs(y / f - c))
-        arr[:] = weight.reshape(shape)
+        x = 1 - np.abs(np.arange(shape[3]) / f - c)
+        y = 1 - np.abs(np.arange(shape[2]) / f - c)
+        kernel = np.outer(y, x).astype('float32')
+        arr[:] = np.broadcast_to(kernel, shape)
 
 
 @register
@@ -41,6 +41,8 @@ class LRScheduler(object):
     def __init__(self, base_lr=0.01,
                  warmup_steps=0, warmup_begin_lr=0, warmup_mode='linear'):
         self.base_lr = base_lr
+        self._cached_key = None
+        self._cached_lr = None
         assert isinstance(warmup_steps, int)
         self.warmup_steps = warmup_steps
 
@@ -83,6 +85,26 @@ class LRScheduler(object):
         """
         raise NotImplementedError("must override this")
 
+    def get_lr(self, num_update):
+        """Return the learning rate for ``num_update``, evaluating the schedule at most
+        once per update count.
+
+        The optimizer queries the learning rate for every parameter (or group of
+        parameters) on every step; all queries for the same ``num_update`` share one
+        evaluation. Assigning ``base_lr`` invalidates the cached value.
+
+        Parameters
+        ----------
+        num_update: int
+            the maximal number of updates applied to a weight.
+        """
+        # subclasses that do not call LRScheduler.__init__, or schedulers pickled
+        # before the cache existed, have no cache yet
+        if getattr(self, '_cached_key', None) != (num_update, self.base_lr):
+            self._cached_lr = self(num_update)
+            self._cached_key = (num_update, self.base_lr)
+        return self._cached_lr
+
 class FactorScheduler(LRScheduler):
     """Reduce the learning rate by a factor for every *n* steps.
 
@@ -279,3 +301,103 @@ class CosineScheduler(LRScheduler):
             self.base_lr = self.final_lr + (self.base_lr_orig - self.final_lr) * \
                 (1 + cos(pi * (num_update - self.warmup_steps) / self.max_steps)) / 2
         return self.base_lr
+
+class SequentialScheduler(LRScheduler):
+    """Run a sequence of schedulers one after another.
+
+    The *i*-th scheduler is used for ``steps[i]`` updates and sees the number of
+    updates counted from its own start. The last scheduler runs for all remaining
+    updates. For example, a linear warmup followed by a cosine decay::
+
+        SequentialScheduler([PolyScheduler(500, base_lr=0, final_lr=0.1, pwr=1),
+                             CosineScheduler(9500, base_lr=0.1)], [500])
+
+    The ``base_lr`` of the sequence is the largest ``base_lr`` of its schedulers.
+    Assigning a new ``base_lr``, e.g. through the ``learning_rate`` of the optimizer,
+    rescales the learning rates of all schedulers by the same ratio.
+
+    Parameters
+    ----------
+        schedulers: list of LRScheduler
+            schedulers to run, in order
+        steps: list of int
+            number of updates for each scheduler except the last one
+    """
+
+    def __init__(self, schedulers, steps):
+        assert isinstance(schedulers, list) and len(schedulers) >= 1
+        if len(steps) != len(schedulers) - 1:
+            raise ValueError("steps must give the length of all schedulers but the last")
+        if any(step < 1 for step in steps):
+            raise ValueError("Schedule step must be greater or equal than 1 round")
+        base_lr = max(sched.base_lr for sched in schedulers)
+        if base_lr <= 0:
+            raise ValueError("At least one scheduler must have a positive base_lr")
+        super(SequentialScheduler, self).__init__(base_lr)
+        self.base_lr_orig = base_lr
+        self.schedulers = schedulers
+        self.offsets = [0]
+        for step in steps:
+            self.offsets.append(self.offsets[-1] + step)
+
+    def __call__(self, num_update):
+        i = len(self.offsets) - 1
+        while i > 0 and num_update < self.offsets[i]:
+            i -= 1
+        lr = self.schedulers[i](num_update - self.offsets[i])
+        return lr * self.base_lr / self.base_lr_orig
+
+class OneCycleScheduler(LRScheduler):
+    """ Increase the learning rate to ``base_lr`` and anneal it back down, following
+    the one-cycle policy.
+
+    The learning rate starts at ``base_lr / div_factor``, reaches ``base_lr`` after
+    ``pct_start * max_update`` updates and then anneals to
+    ``base_lr / (div_factor * final_div_factor)`` at ``max_update``, staying there
+    afterwards.
+
+    Parameters
+    ----------
+        max_update: int
+            length of the cycle in number of updates
+        base_lr: float
+            peak learning rate
+        pct_start: float
+            fraction of the cycle spent increasing the learning rate
+        div_factor: float
+            ratio of the peak learning rate to the initial one
+        final_div_factor: float
+            ratio of the initial learning rate to the final one
+        anneal_strategy: string
+            'cos' follows a half cosine between the end points of each phase,
+            'linear' interpolates linearly
+    """
+
+    def __init__(self, max_update, base_lr=0.01, pct_start=0.3, div_factor=25.,
+                 final_div_factor=1e4, anneal_strategy='cos'):
+        super(OneCycleScheduler, self).__init__(base_lr)
+        assert isinstance(max_update, int)
+        if max_update < 2:
+            raise ValueError("maximum number of updates must be at least 2")
+        if not 0 < pct_start < 1:
+            raise ValueError("pct_start must be in (0, 1)")
+        if anneal_strategy not in ['cos', 'linear']:
+            raise ValueError("Supports only cos and linear anneal strategies")
+        self.max_update = max_update
+        self.div_factor = div_factor
+        self.final_div_factor = final_div_factor
+        self.anneal_strategy = anneal_strategy
+        self.up_steps = max(1, int(pct_start * max_update))
+        self.down_steps = max(1, max_update - self.up_steps)
+
+    def _anneal(self, start, end, pct):
+        if self.anneal_strategy == 'cos':
+            return end + (start - end) * (1 + cos(pi * pct)) / 2
+        return start + (end - start) * pct
+
+    def __call__(self, num_update):
+        initial_lr = self.base_lr / self.div_factor
+        if num_update < self.up_steps:
+            return self._anneal(initial_lr, self.base_lr, float(num_update) / self.up_steps)
+        pct = min(1., float(num_update - self.up_steps) / self.down_steps)
+        return self._anneal(self.base_lr, initial_lr / self.final_div_factor, pct)
@@ -27,6 +27,7 @@ import numpy as np
 from . import ndarray as nd
 from . import symbol as sym
 from . import kvstore as kvs
+from . import profiler
 from .context import cpu
 
 BASE_ESTIMATOR = object
@@ -133,57 +134,64 @@ def _update_params_on_kvstore_nccl(param_arrays, grad_arrays, kvstore, param_nam
     # Use aggregation by default only with NCCL
     default_batch = '16'
     batch = int(os.getenv('MXNET_UPDATE_AGGREGATION_SIZE', default_batch))
-    while start < size:
-        end = start + batch if start + batch < size else size
-        # push gradient, priority is negative index
-        # pull back the weights
-        kvstore.pushpull(valid_param_names[start:end], valid_grad_arrays[start:end],
-                         out=valid_param_arrays[start:end], priority=-start)
-        start = end
+    with profiler.hot_path('Model::update_on_kvstore'):
+        while start < size:
+            end = start + batch if start + batch < size else size
+            # push gradient, priority is negative index
+            # pull back the weights
+            kvstore.pushpull(valid_param_names[start:end], valid_grad_arrays[start:end],
+                             out=valid_param_arrays[start:end], priority=-start)
+            start = end
 
 def _update_params_on_kvstore(param_arrays, grad_arrays, kvstore, param_names):
     """Perform update of param_arrays from grad_arrays on kvstore."""
-    for index, pair in enumerate(zip(param_arrays, grad_arrays)):
-        arg_list, grad_list = pair
-        if grad_list[0] is None:
-            continue
-        name = param_names[index]
-        # push gradient, priority is negative index
-        # pull back the weights
-        if grad_list[0].stype == 'default' and arg_list[0].stype == 'default':
-            kvstore.pushpull(name, grad_list, out=arg_list, priority=-index)
-        else:
-            kvstore.push(name, grad_list, priority=-index)
-            kvstore.pull(name, out=arg_list, priority=-index)
+    with profiler.hot_path('Model::update_on_kvstore'):
+        for index, pair in enumerate(zip(param_arrays, grad_arrays)):
+            arg_list, grad_list = pair
+            if grad_list[0] is None:
+                continue
+            name = param_names[index]
+            # push gradient, priority is negative index
+            # pull back the weights
+            if grad_list[0].stype == 'default' and arg_list[0].stype == 'default':
+                kvstore.pushpull(name, grad_list, out=arg_list, priority=-index)
+            else:
+                kvstore.push(name, grad_list, priority=-index)
+                kvstore.pull(name, out=arg_list, priority=-index)
 
 def _update_params(param_arrays, grad_arrays, updater, num_device,
                    kvstore=None, param_names=None):
     """Perform update of param_arrays from grad_arrays not on kvstore."""
+    if kvstore:
+        with profiler.hot_path('Model::allreduce_grads'):
+            for index, pair in enumerate(zip(param_arrays, grad_arrays)):
+                arg_list, grad_list = pair
+                if grad_list[0] is None:
+                    continue
+                name = param_names[index]
+                # push gradient, priority is negative index
+                if grad_list[0].stype == 'default' and arg_list[0].stype == 'default':
+                    kvstore.pushpull(name, grad_list, priority=-index)
+                else:
+                    kvstore.push(name, grad_list, priority=-index)
+                    kvstore.pull(name, out=grad_list, priority=-index)
     updates = [[] for _ in range(num_device)]
-    for i, pair in enumerate(zip(param_arrays, grad_arrays)):
+    for index, pair in enumerate(zip(param_arrays, grad_arrays)):
         arg_list, grad_list = pair
         if grad_list[0] is None:
             continue
-        index = i
-        if kvstore:
-            name = param_names[index]
-            # push gradient, priority is negative index
-            if grad_list[0].stype == 'default' and arg_list[0].stype == 'default':
-                kvstore.pushpull(name, grad_list, priority=-index)
-            else:
-                kvstore.push(name, grad_list, priority=-index)
-                kvstore.pull(name, out=grad_list, priority=-index)
         for k, p in enumerate(zip(arg_list, grad_list)):
             # faked an index here, to make optimizer create diff
             # state for the same index but on diff devs, TODO(mli)
             # use a better solution later
             w, g = p
             updates[k].append((index*num_device+k, g, w))
-    for dev_updates in updates:
-        # update params if param_arrays and grad_arrays are not empty
-        if dev_updates:
-            i, w, g = zip(*dev_updates)
-            updater(i, w, g)
+    with profiler.hot_path('Model::update'):
+        for dev_updates in updates:
+            # update params if param_arrays and grad_arrays are not empty
+            if dev_updates:
+                i, w, g = zip(*dev_updates)
+                updater(i, w, g)
 
 
 def save_checkpoint(prefix, epoch, symbol, arg_params, aux_params, remove_amp_cast=True):
@@ -31,7 +31,7 @@ from ctypes import c_void_p, c_int, c_char, c_char_p, cast, c_bool
 
 from .base import _LIB, check_call, MXCallbackList, c_array, c_array_buf, mx_int, OpHandle
 from .base import c_str, mx_uint, mx_float, ctypes2numpy_shared, NDArrayHandle, py_str
-from . import symbol, context
+from . import symbol, context, profiler
 from .ndarray import NDArray, _DTYPE_NP_TO_MX, _DTYPE_MX_TO_NP
 from .ndarray.ndarray import _STORAGE_TYPE_STR_TO_ID, _STORAGE_TYPE_ID_TO_STR
 from .ndarray.ndarray import _STORAGE_TYPE_UNDEFINED, _STORAGE_TYPE_DEFAULT
@@ -990,6 +990,10 @@ def register(reg_name):
                     shapes = [[shapes[i][j] for j in range(ndims[i])] for i in range(num_inputs)]
                     dtypes = [dtypes[i] for i in range(num_inputs)]
                     op = op_prop.create_operator(ctx, shapes, dtypes)
+                    num_outputs = len(op_prop.list_outputs())
+                    num_args = len(op_prop.list_arguments())
+                    forward_name = 'CustomOp::%s::forward' % reg_name
+                    backward_name = 'CustomOp::%s::backward' % reg_name
 
                     def forward_entry(num_ndarray, ndarraies, tags, reqs, is_train, _):
                         """C Callback for CustomOp::Forward"""
@@ -1005,7 +1009,7 @@ def register(reg_name):
                                         create_ndarray_fn(cast(ndarraies[i], NDArrayHandle), writable=False)
                                     )
                             reqs = [req_enum[reqs[i]] for i in range(len(tensors[1]))]
-                            with ctx:
+                            with ctx, profiler.hot_path(forward_name):
                                 op.forward(is_train=is_train, req=reqs,
                                            in_data=tensors[0], out_data=tensors[1],
                                            aux=tensors[4])
@@ -1019,8 +1023,6 @@ def register(reg_name):
                         # pylint: disable=W0613
                         try:
                             tensors = [[] for i in range(5)]
-                            num_outputs = len(op_prop.list_outputs())
-                            num_args = len(op_prop.list_arguments())
                             for i in range(num_ndarray):
                                 if i in _registry.result_deps or i >= (num_outputs * 2 + num_args):
                                     # If it is a backward dependency or output or aux:
@@ -1043,7 +1045,7 @@ def register(reg_name):
                                                           writable=False, stype=stype)
                                     )
                             reqs = [req_enum[reqs[i]] for i in range(len(tensors[2]))]
-                            with ctx:
+                            with ctx, profiler.hot_path(backward_name):
                                 op.backward(req=reqs,
                                             in_data=tensors[0], out_data=tensors[1],
                                             in_grad=tensors[2], out_grad=tensors[3],
@@ -201,10 +201,17 @@ class Optimizer(object):
     @property
     def learning_rate(self):
         if self.lr_scheduler is not None:
-            return self.lr_scheduler(self.num_update)
+            return self._scheduled_lr()
         else:
             return self.lr
 
+    def _scheduled_lr(self):
+        get_lr = getattr(self.lr_scheduler, 'get_lr', None)
+        if get_lr is None:
+            # any callable taking the update count can serve as scheduler
+            return self.lr_scheduler(self.num_update)
+        return get_lr(self.num_update)
+
     def create_state(self, index, weight):
         """Creates auxiliary state for a given weight.
 
@@ -472,7 +479,7 @@ class Optimizer(object):
             Learning rates for those indices.
         """
         if self.lr_scheduler is not None:
-            lr = self.lr_scheduler(self.num_update)
+            lr = self._scheduled_lr()
         else:
             lr = self.lr
 
@@ -22,7 +22,15 @@
 import ctypes
 import contextlib
 import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import signal
+import threading
+import time
 import warnings
+from collections import deque, namedtuple
 from .base import _LIB, check_call, c_str, ProfileHandle, c_str_array, py_str, KVStoreHandle
 
 profiler_kvstore_handle = KVStoreHandle()
@@ -102,11 +110,14 @@ def set_state(state='stop', profile_process='worker'):
         server can only be profiled when kvstore is of type dist.
         if this is not passed, defaults to `worker`
     """
+    global _hot_path_enabled
     state2int = {'stop': 0, 'run': 1}
     profile_process2int = {'worker': 0, 'server': 1}
     check_call(_LIB.MXSetProcessProfilerState(ctypes.c_int(state2int[state]),
                                               profile_process2int[profile_process],
                                               profiler_kvstore_handle))
+    if profile_process == 'worker':
+        _hot_path_enabled = state == 'run'
 
 
 def profiler_set_state(state='stop'):
@@ -193,6 +204,145 @@ def dumps(reset=False, format='table', sort_by='total', ascending=False):
     return py_str(debug_str.value)
 
 
+AggregateStat = namedtuple('AggregateStat',
+                           ['category', 'domain', 'name', 'count', 'total', 'min', 'max', 'avg'])
+AggregateStat.__doc__ = """Aggregate statistics of one profiled entry.
+
+category is 'Time' (values in ms) or 'Memory' (values in kB, `total` is None).
+Entries of the 'Python' domain are host-side hot path timers recorded by
+:py:func:`hot_path`, all other entries come from the backend profiler."""
+
+
+def get_aggregate_stats(reset=False, sort_by='total', ascending=False):
+    """Return the aggregate profile stats as a list of :py:class:`AggregateStat`.
+
+    This is the structured counterpart of :py:func:`dumps`. Backend entries hold the
+    time spent executing each operator on the engine threads, while entries of the
+    'Python' domain hold the wall time of the framework hot paths (data loading wait,
+    gradient reduction, optimizer update, CachedOp invocation and metric update) as
+    seen from the calling Python thread. Since operators run asynchronously, the
+    Python entries measure how long the caller was blocked rather than how long the
+    work itself took.
+
+    Parameters
+    ----------
+    reset: boolean
+        indicates whether to clean aggeregate statistical data collected up to this point
+    sort_by: string
+        can take 'total', 'avg', 'min', 'max', or 'count'
+        by which stat to sort the entries in each domain
+        defaults to 'total'
+    ascending: boolean
+        whether to sort ascendingly
+        defaults to False
+    """
+    stats = json.loads(dumps(reset=reset, format='json', sort_by=sort_by, ascending=ascending))
+    records = []
+    for category in ('Time', 'Memory'):
+        for domain, entries in stats.get(category, {}).items():
+            for name, entry in entries.items():
+                records.append(AggregateStat(category, domain, name, entry['Count'],
+                                             entry.get('Total'), entry['Min'], entry['Max'],
+                                             entry['Avg']))
+    with _hot_path_lock:
+        hot_paths = list(_hot_path_stats.items())
+        if reset:
+            _hot_path_stats.clear()
+    python_records = [AggregateStat('Time', 'Python', name, count, total, min_, max_,
+                                    total / count)
+                      for name, (count, total, min_, max_) in hot_paths]
+    python_records.sort(key=lambda record: getattr(record, sort_by), reverse=not ascending)
+    return records + python_records
+
+
+class _HotPathScope(object):
+    """Timer of a single pass through a framework hot path."""
+    __slots__ = ('name', '_start')
+
+    def __init__(self, name):
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        if _hot_path_enabled or _hot_path_listeners:
+            if self.name in _hot_path_sync:
+                check_call(_LIB.MXNDArrayWaitAll())
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._start is None:
+            return
+        if self.name in _hot_path_sync:
+            check_call(_LIB.MXNDArrayWaitAll())
+        elapsed = (time.perf_counter() - self._start) * 1000
+        self._start = None
+        if _hot_path_enabled:
+            with _hot_path_lock:
+                record = _hot_path_stats.get(self.name)
+                if record is None:
+                    _hot_path_stats[self.name] = [1, elapsed, elapsed, elapsed]
+                else:
+                    record[0] += 1
+                    record[1] += elapsed
+                    record[2] = min(record[2], elapsed)
+                    record[3] = max(record[3], elapsed)
+        for listener, _ in _hot_path_listeners:
+            listener(self.name, elapsed)
+
+
+def hot_path(name):
+    """Time a framework hot path while the profiler is running.
+
+    The elapsed wall time is aggregated under `name` in the 'Python' domain of
+    :py:func:`get_aggregate_stats`. When the profiler is stopped the scope costs a
+    single flag check.
+
+    Parameters
+    ----------
+    name : string
+        Name of the hot path
+
+    Examples
+    --------
+    >>> with mx.profiler.hot_path('MyLoop::preprocess'):
+    ...     batch = preprocess(batch)
+    """
+    return _HotPathScope(name)
+
+
+def add_hot_path_listener(listener, synchronize=()):
+    """Register a callback receiving every pass through a hot path.
+
+    Listeners are called with the hot path name and its elapsed wall time in ms,
+    whether or not the profiler is running, from the thread that ran the hot path.
+
+    Parameters
+    ----------
+    listener : callable
+        Called as ``listener(name, elapsed_ms)``.
+    synchronize : iterable of str
+        Names of hot paths that wait for all pending engine operations when they
+        are entered and exited, so that their elapsed time covers the asynchronous
+        work they issued and none of the work issued before them. This adds
+        synchronization points and slows down execution. Never synchronize hot
+        paths that run on engine threads, such as custom operators.
+    """
+    global _hot_path_listeners, _hot_path_sync
+    with _hot_path_lock:
+        _hot_path_listeners = _hot_path_listeners + [(listener, frozenset(synchronize))]
+        _hot_path_sync = frozenset().union(*(sync for _, sync in _hot_path_listeners))
+
+
+def remove_hot_path_listener(listener):
+    """Unregister a callback registered with :py:func:`add_hot_path_listener`."""
+    global _hot_path_listeners, _hot_path_sync
+    with _hot_path_lock:
+        _hot_path_listeners = [(l, sync) for l, sync in _hot_path_listeners
+                               if l != listener]
+        _hot_path_sync = frozenset().union(*(sync for _, sync in _hot_path_listeners))
+
+
 def pause(profile_process='worker'):
     """Pause profiling.
 
@@ -203,10 +353,13 @@ def pause(profile_process='worker'):
         server can only be profiled when kvstore is of type dist.
         if this is not passed, defaults to `worker`
     """
+    global _hot_path_enabled
     profile_process2int = {'worker': 0, 'server': 1}
     check_call(_LIB.MXProcessProfilePause(int(1),
                                           profile_process2int[profile_process],
                                           profiler_kvstore_handle))
+    if profile_process == 'worker':
+        _hot_path_enabled = False
 
 
 def resume(profile_process='worker'):
@@ -219,10 +372,165 @@ def resume(profile_process='worker'):
         server can only be profiled when kvstore is of type dist.
         if this is not passed, defaults to `worker`
     """
+    global _hot_path_enabled
     profile_process2int = {'worker': 0, 'server': 1}
     check_call(_LIB.MXProcessProfilePause(int(0),
                                           profile_process2int[profile_process],
                                           profiler_kvstore_handle))
+    if profile_process == 'worker':
+        _hot_path_enabled = True
+
+
+class SamplingProfiler(object):
+    """Low-overhead profiler that samples short windows of a long-running job.
+
+    Instead of recording every event until :py:func:`dump` is called, the profiler is
+    only run for `window` seconds out of every `interval` seconds. At the end of each
+    window the trace of that window is written to `trace-<pid>.json` in `directory`,
+    replacing the previous one, and the aggregate stats of the window (see
+    :py:func:`get_aggregate_stats`) are appended as one JSON line to
+    `profile-<pid>.jsonl`. The summary file is rotated once it exceeds
+    `max_file_size` bytes and at most `max_files` rotated files are kept. The last
+    `buffer_size` window summaries are also kept in memory, see :py:meth:`recent`.
+
+    Sampling can be toggled at runtime with :py:meth:`install_signal_handler`, and is
+    configured from the environment when `MXNET_PROFILER_SAMPLING_DIR` is set.
+
+    Note that the sampling profiler owns the profiler configuration while it is
+    running; do not combine it with manual calls to :py:func:`set_config` or
+    :py:func:`set_state`.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where the trace and the rotating summary files are written.
+    window : float, default 5
+        Duration in seconds of each profiled window.
+    interval : float, default 60
+        Seconds between the start of two consecutive windows.
+    max_files : int, default 10
+        Number of rotated summary files to keep.
+    max_file_size : int, default 16MB
+        Size in bytes after which the summary file is rotated.
+    buffer_size : int, default 64
+        Number of window summaries kept in memory.
+    profile_memory : bool, default False
+        Whether to profile memory usage during the windows.
+    """
+    def __init__(self, directory, window=5.0, interval=60.0, max_files=10,
+                 max_file_size=16 << 20, buffer_size=64, profile_memory=False):
+        if window <= 0 or interval < window:
+            raise ValueError("window must be positive and not larger than interval, "
+                             "got window={} and interval={}".format(window, interval))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.window = window
+        self.interval = interval
+        self.profile_memory = profile_memory
+        self._trace_file = os.path.join(directory, 'trace-%d.json' % os.getpid())
+        self._sink = logging.handlers.RotatingFileHandler(
+            os.path.join(directory, 'profile-%d.jsonl' % os.getpid()),
+            maxBytes=max_file_size, backupCount=max_files, delay=True)
+        self._buffer = deque(maxlen=buffer_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        """Whether windows are currently being sampled."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start sampling in a background thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='SamplingProfiler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling. A window in progress is finished and flushed first."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def toggle(self):
+        """Start sampling if it is stopped and stop it otherwise."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def recent(self):
+        """Return the summaries of the most recent windows, oldest first.
+
+        Each summary is a dict with the wall `time` at which the window ended, its
+        `window` length in seconds and the list of :py:class:`AggregateStat` `stats`.
+        """
+        return list(self._buffer)
+
+    def install_signal_handler(self, signum=None):
+        """Toggle sampling whenever the process receives `signum`.
+
+        `signum` defaults to SIGUSR1, which is not available on Windows.
+        Must be called from the main thread.
+        """
+        if signum is None:
+            signum = getattr(signal, 'SIGUSR1', None)
+            if signum is None:
+                raise ValueError("SIGUSR1 is not available on this platform, "
+                                 "pass another signal as signum")
+
+        def _handler(sig, frame):  # pylint: disable=unused-argument
+            # stopping joins the sampling thread, do not block the interrupted frame
+            threading.Thread(target=self.toggle).start()
+        signal.signal(signum, _handler)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            start = time.time()
+            self._sample_window()
+            self._stop_event.wait(max(0.0, self.interval - (time.time() - start)))
+
+    def _sample_window(self):
+        set_config(profile_symbolic=True, profile_imperative=True,
+                   profile_memory=self.profile_memory, profile_api=False,
+                   aggregate_stats=True, filename=self._trace_file)
+        get_aggregate_stats(reset=True)
+        start = time.time()
+        set_state('run')
+        self._stop_event.wait(self.window)
+        set_state('stop')
+        # aggregate stats are collected while the events are written out
+        dump(finished=True)
+        stats = get_aggregate_stats(reset=True)
+        end = time.time()
+        summary = {'time': end, 'window': end - start, 'stats': stats}
+        self._buffer.append(summary)
+        line = json.dumps({'time': end, 'window': end - start, 'pid': os.getpid(),
+                           'stats': [stat._asdict() for stat in stats]})
+        self._sink.emit(logging.makeLogRecord({'msg': line}))
+        self._sink.flush()
+
+
+def _sampling_profiler_from_env():
+    """Create the sampling profiler configured by the MXNET_PROFILER_SAMPLING_* variables."""
+    directory = os.environ.get('MXNET_PROFILER_SAMPLING_DIR')
+    if not directory:
+        return None
+    sampler = SamplingProfiler(
+        directory,
+        window=float(os.environ.get('MXNET_PROFILER_SAMPLING_WINDOW', 5)),
+        interval=float(os.environ.get('MXNET_PROFILER_SAMPLING_INTERVAL', 60)))
+    if threading.current_thread() is threading.main_thread() and hasattr(signal, 'SIGUSR1'):
+        sampler.install_signal_handler()
+    if os.environ.get('MXNET_PROFILER_SAMPLING_AUTOSTART', '0') == '1':
+        sampler.start()
+    return sampler
 
 
 class Domain(object):
@@ -529,3 +837,14 @@ def scope(name='<unk>:', append_mode=True):
 
 # initialize the default profiler scope
 _current_scope = contextvars.ContextVar('profilerscope', default='<unk>:')
+
+# host-side hot path timers, enabled while the worker profiler is running
+_hot_path_enabled = False
+_hot_path_lock = threading.Lock()
+_hot_path_stats = {}
+# listeners of hot path passes and the hot paths they need synchronized
+_hot_path_listeners = []
+_hot_path_sync = frozenset()
+
+# always-on sampling profiler, configured through MXNET_PROFILER_SAMPLING_DIR
+sampling_profiler = _sampling_profiler_from_env()
@@ -227,7 +227,9 @@ class MXIndexedRecordIO(MXRecordIO):
     Parameters
     ----------
     idx_path : str
-        Path to the index file.
+        Path to the index file. If it ends with '.npy', the index is stored in binary
+        form as an int64 array of (key, offset) rows, which loads much faster than the
+        text index for large record files. The binary index requires integer keys.
     uri : str
         Path to the record file. Only supports seekable file types.
     flag : str
@@ -241,12 +243,19 @@ class MXIndexedRecordIO(MXRecordIO):
         self.keys = []
         self.key_type = key_type
         self.fidx = None
+        self._binary_idx = idx_path.endswith('.npy')
         super(MXIndexedRecordIO, self).__init__(uri, flag)
 
     def open(self):
         super(MXIndexedRecordIO, self).open()
         self.idx = {}
         self.keys = []
+        if self._binary_idx:
+            if not self.writable:
+                table = np.load(self.idx_path)
+                self.keys = [self.key_type(key) for key in table[:, 0].tolist()]
+                self.idx = dict(zip(self.keys, table[:, 1].tolist()))
+            return
         self.fidx = open(self.idx_path, self.flag)
         if not self.writable:
             for line in iter(self.fidx.readline, ''):
@@ -260,7 +269,11 @@ class MXIndexedRecordIO(MXRecordIO):
         if not self.is_open:
             return
         super(MXIndexedRecordIO, self).close()
-        self.fidx.close()
+        if self._binary_idx:
+            if self.writable:
+                save_binary_idx(self.idx_path, self.keys, self.idx)
+        else:
+            self.fidx.close()
 
     def __getstate__(self):
         """Override pickling behavior."""
@@ -335,11 +348,32 @@ class MXIndexedRecordIO(MXRecordIO):
         key = self.key_type(idx)
         pos = self.tell()
         self.write(buf)
-        self.fidx.write('%s\t%d\n'%(str(key), pos))
+        if not self._binary_idx:
+            self.fidx.write('%s\t%d\n'%(str(key), pos))
         self.idx[key] = pos
         self.keys.append(key)
 
 
+def save_binary_idx(path, keys, idx):
+    """Saves a record file index in the binary format read by `MXIndexedRecordIO`.
+
+    Parameters
+    ----------
+    path : str
+        Path to the output '.npy' file.
+    keys : list of int
+        Record keys in the order they were written.
+    idx : dict of int to int
+        Mapping from record key to offset in the record file.
+    """
+    table = np.empty((len(keys), 2), dtype=np.int64)
+    if keys:
+        table[:, 0] = keys
+        table[:, 1] = [idx[key] for key in keys]
+    with open(path, 'wb') as fout:
+        np.save(fout, table)
+
+
 IRHeader = namedtuple('HEADER', ['flag', 'label', 'id', 'id2'])
 """An alias for HEADER. Used to store metadata (e.g. labels) accompanying a record.
 See mxnet.recordio.pack and mxnet.recordio.pack_img for example uses.
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+# coding: utf-8
+"""Cache of inferred shapes and types of symbolic graphs."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class InferCache(object):
+    """Cache of shape and type inference results.
+
+    Entries are keyed by the hash of the graph JSON, the kind of inference and
+    the signature of the known inputs. The most recent entries are kept in memory;
+    if `directory` is given, entries are also persisted there as one small JSON
+    file each, so that later processes loading the same graph skip inference.
+
+    Parameters
+    ----------
+    directory : str or None
+        Directory for the persisted entries. Entries are only kept in memory if None.
+    capacity : int
+        Maximum number of entries kept in memory.
+    """
+    def __init__(self, directory=None, capacity=1024):
+        self.directory = directory
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @staticmethod
+    def key(graph_json, kind, signature):
+        """Returns the cache key of an inference call on a graph."""
+        digest = hashlib.sha1(graph_json.encode('utf-8'))
+        digest.update(json.dumps([kind, signature]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        """Returns the cached result for `key`, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+        if result is None and self.directory is not None:
+            try:
+                with open(self._path(key)) as f:
+                    result = json.load(f)
+            except (IOError, OSError, ValueError):
+                result = None
+            if result is not None:
+                self._remember(key, result)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """Stores a JSON serializable inference `result` under `key`."""
+        self._remember(key, result)
+        if self.directory is not None:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops the entries kept in memory and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
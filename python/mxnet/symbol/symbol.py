@@ -26,6 +26,8 @@ except ImportError:
 
 from array import array
 import ctypes
+import gzip
+import os
 import warnings
 from numbers import Number
 import numpy as _numpy  # pylint: disable=relative-import
@@ -45,8 +47,9 @@ from ._internal import SymbolBase, _set_symbol_class
 from ..util import is_np_shape
 from ..profiler import scope as _profiler_scope
 from ..profiler import _current_scope as _current_profiler_scope
+from ._infer_cache import InferCache
 
-__all__ = ["Symbol", "var", "Variable", "Group", "load", "load_json",
+__all__ = ["Symbol", "var", "Variable", "Group", "load", "load_json", "set_infer_cache",
            "pow", "power", "maximum", "minimum", "hypot", "eye", "zeros",
            "ones", "full", "arange", "linspace", "histogram", "split_v2"]
 
@@ -1019,6 +1022,7 @@ class Symbol(SymbolBase):
             raise ValueError('Can only specify known argument \
                     types either by positional or kwargs way.')
         sdata = []
+        str_keys = None
         if len(args) != 0:
             keys = c_array(ctypes.c_char_p, [])
             for s in args:
@@ -1037,6 +1041,13 @@ class Symbol(SymbolBase):
                     str_keys.append(k)
                     sdata.append(_DTYPE_NP_TO_MX[v])
             keys = c_str_array(str_keys)
+        res = self._cached_infer(['type', partial, str_keys, sdata],
+                                 lambda: self._infer_type_from_c(partial, keys, sdata))
+        return tuple(None if types is None else [_DTYPE_MX_TO_NP[t] for t in types]
+                     for types in res)
+
+    def _infer_type_from_c(self, partial, keys, sdata):
+        """Calls the type inference API. Types are returned as MXNet type flags."""
         arg_type_size = mx_uint()
         arg_type_data = ctypes.POINTER(ctypes.c_int)()
         out_type_size = mx_uint()
@@ -1061,12 +1072,9 @@ class Symbol(SymbolBase):
             ctypes.byref(aux_type_data),
             ctypes.byref(complete)))
         if complete.value != 0:
-            arg_types = [
-                _DTYPE_MX_TO_NP[arg_type_data[i]] for i in range(arg_type_size.value)]
-            out_types = [
-                _DTYPE_MX_TO_NP[out_type_data[i]] for i in range(out_type_size.value)]
-            aux_types = [
-                _DTYPE_MX_TO_NP[aux_type_data[i]] for i in range(aux_type_size.value)]
+            arg_types = arg_type_data[:arg_type_size.value]
+            out_types = out_type_data[:out_type_size.value]
+            aux_types = aux_type_data[:aux_type_size.value]
             return (arg_types, out_types, aux_types)
         else:
             return (None, None, None)
@@ -1215,6 +1223,7 @@ class Symbol(SymbolBase):
                     shapes either by positional or kwargs way.')
         sdata = []
         indptr = [0]
+        str_keys = None
         if len(args) != 0:
             keys = c_array(ctypes.c_char_p, [])
             for i, s in enumerate(args):
@@ -1234,6 +1243,16 @@ class Symbol(SymbolBase):
                 sdata.extend(v)
                 indptr.append(len(sdata))
             keys = c_str_array(str_keys)
+        res = self._cached_infer(['shape', partial, is_np_shape(), str_keys, indptr,
+                                  [int(i) for i in sdata]],
+                                 lambda: self._infer_shape_from_c(partial, keys, indptr, sdata))
+        return tuple(None if shapes is None else
+                     [None if shape is None else tuple(shape) for shape in shapes]
+                     for shapes in res)
+
+    def _infer_shape_from_c(self, partial, keys, indptr, sdata):
+        """Calls the shape inference API."""
+        # pylint: disable=too-many-locals
         arg_shape_size = mx_uint()
         arg_shape_ndim = ctypes.POINTER(mx_int)()
         out_shape_size = mx_uint()
@@ -1309,6 +1328,18 @@ class Symbol(SymbolBase):
             return (None, None, None)
         # pylint: enable=too-many-locals
 
+    def _cached_infer(self, signature, infer):
+        """Returns the result of `infer()`, looked up in the inference cache if enabled."""
+        cache = _infer_cache
+        if cache is None:
+            return infer()
+        key = cache.key(self.tojson(remove_amp_cast=False), signature[0], signature[1:])
+        res = cache.get(key)
+        if res is None:
+            res = infer()
+            cache.put(key, res)
+        return res
+
     def debug_str(self):
         """Gets a debug string of symbol.
 
@@ -1371,6 +1402,9 @@ class Symbol(SymbolBase):
         language binding of `MXNet`.
         You also get the benefit of being able to directly load/save from cloud storage(S3, HDFS).
 
+        Local files whose name ends with ".gz" are written as gzip compressed JSON,
+        which is typically an order of magnitude smaller for large graphs.
+
         Parameters
         ----------
         fname : str
@@ -1379,6 +1413,7 @@ class Symbol(SymbolBase):
             - "s3://my-bucket/path/my-s3-symbol"
             - "hdfs://my-bucket/path/my-hdfs-symbol"
             - "/path-to/my-local-symbol"
+            - "/path-to/my-local-symbol.json.gz"
         remove_amp_cast : bool, optional
             Whether to remove the amp_cast and amp_multicast operators, before saving the model.
 
@@ -1388,7 +1423,10 @@ class Symbol(SymbolBase):
         """
         if not isinstance(fname, string_types):
             raise TypeError('fname need to be string')
-        if remove_amp_cast:
+        if fname.endswith('.gz') and '://' not in fname:
+            with gzip.open(fname, 'wb') as f:
+                f.write(self.tojson(remove_amp_cast).encode('utf-8'))
+        elif remove_amp_cast:
             handle = SymbolHandle()
             check_call(_LIB.MXSymbolRemoveAmpCast(self.handle, ctypes.byref(handle)))
             check_call(_LIB.MXSymbolSaveToFile(handle, c_str(fname)))
@@ -1688,7 +1726,7 @@ class Symbol(SymbolBase):
 
     # pylint: disable=too-many-locals
     def _simple_bind(self, ctx, grad_req='write', type_dict=None, stype_dict=None,
-                     **kwargs):
+                     static_alloc=False, static_shape=False, **kwargs):
         """Bind current symbol to get an executor, allocate all the arguments needed.
         Allows specifying data types.
 
@@ -1733,6 +1771,14 @@ class Symbol(SymbolBase):
         stype_dict  : Dict of str->str
             Input storage type dictionary, name->storage_type
 
+        static_alloc : bool, default False
+            Statically allocate memory to improve speed. Memory usage may increase.
+
+        static_shape : bool, default False
+            Optimize for invariant input shapes between iterations. Must also
+            set static_alloc to True. Change of input shapes is still allowed
+            but slower.
+
         kwargs : Dict of str->shape
             Input shape dictionary, name->shape
 
@@ -1790,10 +1836,11 @@ class Symbol(SymbolBase):
                         args_grad[name] = args[i].copy()
             else:
                 args_grad = [x.copy() for x in args]
-        return Executor(self, ctx, args, args_grad, grad_req, aux_states)
+        return Executor(self, ctx, args, args_grad, grad_req, aux_states,
+                        static_alloc=static_alloc, static_shape=static_shape)
 
     def _bind(self, ctx, args, args_grad=None, grad_req='write',
-              aux_states=None):
+              aux_states=None, static_alloc=False, static_shape=False):
         """Binds the current symbol to an executor and returns it.
 
         We first declare the computation and then bind to the data to run.
@@ -1856,6 +1903,14 @@ class Symbol(SymbolBase):
               `auxiliary_states` to the corresponding `NDArray`,
             - In either case, all the auxiliary states need to be provided.
 
+        static_alloc : bool, default False
+            Statically allocate memory to improve speed. Memory usage may increase.
+
+        static_shape : bool, default False
+            Optimize for invariant input shapes between iterations. Must also
+            set static_alloc to True. Change of input shapes is still allowed
+            but slower.
+
         Returns
         -------
         executor : Executor
@@ -1872,9 +1927,14 @@ class Symbol(SymbolBase):
 
         One can give up gradient by using a dict in `args_grad` and only specify
         gradient they interested in.
+
+        Arguments that are already on `ctx` and do not require gradient are bound
+        without being copied. Auxiliary states are always copied, since the forward
+        pass updates them.
         """
         assert isinstance(grad_req, (str, dict))
-        return Executor(self, ctx, args, args_grad, grad_req, aux_states)
+        return Executor(self, ctx, args, args_grad, grad_req, aux_states,
+                        static_alloc=static_alloc, static_shape=static_shape)
 
     def gradient(self, wrt):
         """Gets the autodiff of current symbol.
@@ -2804,6 +2864,7 @@ def load(fname):
         - `s3://my-bucket/path/my-s3-symbol`
         - `hdfs://my-bucket/path/my-hdfs-symbol`
         - `/path-to/my-local-symbol`
+        - `/path-to/my-local-symbol.json.gz` (gzip compressed, see `Symbol.save`)
 
     Returns
     -------
@@ -2816,6 +2877,9 @@ def load(fname):
     """
     if not isinstance(fname, string_types):
         raise TypeError('fname need to be string')
+    if fname.endswith('.gz') and '://' not in fname:
+        with gzip.open(fname, 'rb') as f:
+            return load_json(f.read().decode('utf-8'))
     handle = SymbolHandle()
     check_call(_LIB.MXSymbolCreateFromFile(c_str(fname), ctypes.byref(handle)))
     return Symbol(handle)
@@ -2845,6 +2909,45 @@ def load_json(json_str):
     return Symbol(handle)
 
 
+_infer_cache = None
+
+
+def set_infer_cache(enabled=True, directory=None, capacity=1024):
+    """Enables or disables the cache of inferred shapes and types.
+
+    Shape and type inference of large graphs can dominate model loading. When the
+    cache is enabled, the results of `infer_shape`, `infer_type` and their partial
+    variants are keyed by the hash of the graph and the known input shapes or types,
+    and reused by later calls on an identical graph, e.g. by the next
+    `SymbolBlock.imports` of the same model. With `directory`, the cache is also
+    persisted on disk and shared between processes.
+
+    The cache can also be enabled at import time by setting the environment
+    variable `MXNET_SYMBOL_INFER_CACHE_DIR` to a directory.
+
+    Parameters
+    ----------
+    enabled : bool, default True
+        Whether to enable the cache. Disabling it drops the cached entries in memory.
+    directory : str, optional
+        Directory where entries are persisted. Entries are only kept in memory if None.
+    capacity : int, default 1024
+        Maximum number of entries kept in memory.
+
+    Returns
+    -------
+    InferCache or None
+        The new cache, which exposes `hits` and `misses` counters.
+    """
+    global _infer_cache  # pylint: disable=global-statement
+    _infer_cache = InferCache(directory, capacity) if enabled else None
+    return _infer_cache
+
+
+if os.environ.get('MXNET_SYMBOL_INFER_CACHE_DIR'):
+    set_infer_cache(directory=os.environ['MXNET_SYMBOL_INFER_CACHE_DIR'])
+
+
 # pylint: disable=no-member
 # pylint: disable=redefined-builtin
 def pow(base, exp):
@@ -41,7 +41,7 @@
 #include <mutex>
 #include <functional>
 #include <condition_variable>
-#include <queue>
+#include <list>
 #include "../operator_common.h"
 #include "../../profiler/custom_op_profiler.h"
 
@@ -100,7 +100,7 @@ class CustomOperator {
       return;
     }
     std::unique_lock<std::mutex> lock(mutex_);
-    q_.push([=]() mutable {
+    q_.emplace_back(op_type, [=]() mutable {
       bool prev_recording = Imperative::Get()->set_is_recording(recording);
       bool prev_training = Imperative::Get()->set_is_training(training);
 
@@ -162,7 +162,7 @@ class CustomOperator {
     // increase num_threads if there is not enough threads to execute custom operator
     if (q_.size() > num_free_threads_)
       CreateThreads(q_.size() - num_free_threads_);
-    cv_.notify_all();
+    cv_.notify_one();
   }
 
   static CustomOperator* Get() {
@@ -175,6 +175,10 @@ class CustomOperator {
     destructing_ = false;
     naive_engine_ = true;
     exception_ = nullptr;
+    // 0 means the pool grows with the number of pending invocations
+    max_threads_ = dmlc::GetEnv("MXNET_CUSTOM_OP_NUM_THREADS", 0);
+    // 1 (default) runs every invocation on its own worker, larger values are opt-in
+    max_batch_size_ = std::max(dmlc::GetEnv("MXNET_CUSTOM_OP_BATCH_SIZE", 1), 1);
     if (std::string("NaiveEngine") != dmlc::GetEnv("MXNET_ENGINE_TYPE", std::string())) {
       naive_engine_ = false;
     }
@@ -206,20 +210,32 @@ class CustomOperator {
   }
   void ThreadTarget() {
     std::unique_lock<std::mutex> lock(mutex_);
+    std::vector<std::function<void(void)> > batch;
     while (!q_.empty() || !destructing_) {
       cv_.wait(lock, [&] {return !q_.empty() || destructing_;});
       while (!q_.empty()) {
         --num_free_threads_;
-        auto fn = q_.front();
-        q_.pop();
+        // take the head of the queue together with the queued invocations
+        // of the same operator, so that they run back to back on this thread
+        const std::string op_type = q_.front().first;
+        for (auto it = q_.begin(); it != q_.end() && batch.size() < max_batch_size_;) {
+          if (it->first == op_type) {
+            batch.push_back(std::move(it->second));
+            it = q_.erase(it);
+          } else {
+            ++it;
+          }
+        }
         lock.unlock();
-        fn();
+        for (auto &fn : batch) fn();
+        batch.clear();
         ++num_free_threads_;
         lock.lock();
       }
     }
   }
   void SetNumThreads(int num_threads) {
+    if (max_threads_ > 0) num_threads = std::min(num_threads, max_threads_);
     for (int i = workers_.size(); i < num_threads; ++i) {
       workers_.emplace_back(std::thread([this]{this->ThreadTarget();}));
       ++num_free_threads_;
@@ -234,10 +250,12 @@ class CustomOperator {
   std::condition_variable cv_;
   std::vector<std::thread> workers_;
   std::atomic<uint32_t> num_free_threads_;
-  std::queue<std::function<void(void)> > q_;
+  std::list<std::pair<std::string, std::function<void(void)> > > q_;
   std::shared_ptr<std::exception_ptr> exception_;
   bool naive_engine_;
   bool destructing_;
+  int max_threads_;
+  size_t max_batch_size_;
 };
 
 }  // namespace custom
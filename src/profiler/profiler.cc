@@ -174,19 +174,21 @@ void Profiler::DumpProfile(bool perform_cleanup) {
   std::ofstream file;
   const bool first_pass = ++profile_dump_count_ == 1;
   const bool last_pass = perform_cleanup || !continuous_dump_;
-  if (!first_pass && continuous_dump_) {
-    file.open(filename_, std::ios::app|std::ios::out);
-  } else {
+  // a dump that is not appended to the previous one rewrites the whole file, so it
+  // needs the process metadata again, also when profiling is restarted after a dump
+  const bool new_file = first_pass || !continuous_dump_;
+  if (new_file) {
     file.open(filename_, std::ios::trunc|std::ios::out);
-  }
-  if (first_pass || !continuous_dump_) {
     file << "{" << std::endl;
     file << "    \"traceEvents\": [" << std::endl;
+    category_to_pid_.clear();
+  } else {
+    file.open(filename_, std::ios::app|std::ios::out);
   }
 
   const size_t dev_num = DeviceCount();
 
-  if (first_pass) {
+  if (new_file) {
     for (uint32_t pid = 0; pid < dev_num; ++pid) {
        if (pid) {
          file << ",\n";
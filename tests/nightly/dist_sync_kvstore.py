@@ -434,6 +434,32 @@ def test_gluon_trainer_sparse_step():
     check_trainer_sparse_step()
     print('worker ' + str(my_rank) + ' passed test_gluon_trainer_sparse_step')
 
+def test_gluon_trainer_sparse_prefetch():
+    def check_trainer_sparse_prefetch():
+        ctx = mx.cpu(0)
+        shape = (6, 4)
+        x = mx.gluon.Parameter('x', shape=shape, grad_stype='row_sparse')
+        x.initialize(ctx=ctx, init='ones')
+        trainer = mx.gluon.Trainer([x], 'sgd', {'learning_rate': 1.0, 'lazy_update': True},
+                                   kvstore=kv)
+        with mx.autograd.record():
+            y = mx.nd.Embedding(mx.nd.array([0, 1], ctx=ctx), x.data(ctx), input_dim=shape[0],
+                                output_dim=shape[1], sparse_grad=True)
+            y = (my_rank + 1) * y
+            y.backward()
+        # the next batch only reads rows 1 and 3
+        trainer.prefetch_rows({x: mx.nd.array([3, 1, 3], ctx=ctx)})
+        trainer.step(1)
+        expected = 1 - (1 + nworker) * nworker / 2
+        weight = x.data(ctx).asnumpy()
+        assert_almost_equal(weight[1], np.full(shape[1], expected))
+        assert_almost_equal(weight[3], np.ones(shape[1]))
+        # row 0 was updated on the servers but not pulled
+        assert_almost_equal(weight[0], np.ones(shape[1]))
+        assert not trainer._prefetch_row_ids
+    check_trainer_sparse_prefetch()
+    print('worker ' + str(my_rank) + ' passed test_gluon_trainer_sparse_prefetch')
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='test distributed kvstore in dist_sync mode')
     parser.add_argument('--nrepeat', type=int, default=7)
@@ -447,6 +473,8 @@ if __name__ == "__main__":
         test_gluon_trainer_step()
     elif opt.type == 'gluon_sparse_step_cpu':
         test_gluon_trainer_sparse_step()
+    elif opt.type == 'gluon_sparse_prefetch_cpu':
+        test_gluon_trainer_sparse_prefetch()
     elif opt.type == 'invalid_cpu':
         test_invalid_operations()
     elif opt.type == 'init_gpu':
@@ -0,0 +1,105 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import mxnet as mx
+import numpy as np
+import pytest
+from mxnet.gluon import nn
+from mxnet.contrib.quantization import quantize_net, _LayerHistogramCollector
+
+
+def _conv_net():
+    net = nn.HybridSequential()
+    net.add(nn.Conv2D(16, kernel_size=3, padding=1, activation='relu'),
+            nn.Conv2D(16, kernel_size=3, padding=1, activation='relu'),
+            nn.Flatten(),
+            nn.Dense(10))
+    net.initialize(mx.init.Xavier())
+    return net
+
+
+def test_histogram_collector_merge():
+    collector = _LayerHistogramCollector(['x'], num_bins=11)
+    first = mx.nd.array(np.linspace(-1, 1, 100))
+    second = mx.nd.array(np.linspace(-2.5, 2.5, 100))
+    for batch in [first, second]:
+        collector.new_batch()
+        collector.collect('x', 'op', batch)
+        # inputs reported again by another consumer are not counted twice
+        collector.collect('x', 'op', batch)
+    hist, min_val, max_val, th = collector.hist_dict['x']
+    assert hist.asnumpy().sum() == 200
+    assert (min_val, max_val) == (-2.5, 2.5)
+    assert th >= 2.5
+    # the range is widened by whole bins of the original width
+    step = 2. / 11
+    assert hist.shape[0] % 2 == 1
+    np.testing.assert_allclose(2 * th / hist.shape[0], step, rtol=1e-5)
+
+
+@pytest.mark.parametrize('calib_mode', ['none', 'naive', 'entropy'])
+def test_quantize_net(calib_mode):
+    net = _conv_net()
+    data = mx.nd.random.uniform(-1, 1, shape=(32, 3, 16, 16))
+    ref = net(data)
+    calib_data = mx.gluon.data.DataLoader(mx.gluon.data.ArrayDataset(data), batch_size=8)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for _ in range(2):
+            qnet = quantize_net(net, calib_data=calib_data, data_shapes=[(8, 3, 16, 16)],
+                                calib_mode=calib_mode, num_calib_samples=16,
+                                calib_cache_dir=cache_dir)
+            out = qnet(data[:8])
+            assert out.shape == (8, 10)
+            rel_err = mx.nd.norm(out - ref[:8]) / mx.nd.norm(ref[:8])
+            assert rel_err.asscalar() < 0.1
+        num_tables = 0 if calib_mode == 'none' else 1
+        assert len(os.listdir(cache_dir)) == num_tables
+
+
+def test_quantize_net_keeps_network_state():
+    net = _conv_net()
+    net.hybridize(static_alloc=True, static_shape=True)
+    data = mx.nd.random.uniform(-1, 1, shape=(8, 3, 16, 16))
+    net(data)
+    cached_op = net._cached_op
+    quantize_net(net, calib_data=[data], calib_mode='naive')
+    assert net._active
+    assert ('static_alloc', True) in net._flags and ('static_shape', True) in net._flags
+    assert net._cached_op is cached_op
+
+
+def test_quantize_net_num_inputs():
+    class TwoInputs(nn.HybridBlock):
+        def __init__(self):
+            super(TwoInputs, self).__init__()
+            self.fc = nn.Dense(4)
+
+        def forward(self, x, y):
+            return self.fc(x + y)
+
+    net = TwoInputs()
+    net.initialize()
+    x = mx.nd.random.uniform(shape=(4, 8))
+    y = mx.nd.random.uniform(shape=(4, 8))
+    label = mx.nd.zeros((4,))
+    # the label following the two inputs is ignored
+    qnet = quantize_net(net, calib_data=[(x, y, label)], calib_mode='naive')
+    assert qnet(x, y).shape == (4, 4)
+    with pytest.raises(ValueError):
+        quantize_net(net, calib_data=[(x,)], calib_mode='naive')
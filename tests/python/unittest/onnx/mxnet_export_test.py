@@ -50,7 +50,7 @@ def _optional_group(symbols, group=False):
         return symbols
 
 
-def _check_onnx_export(net, group_outputs=False, shape_type=tuple, extra_params={}):
+def _check_onnx_export(net, group_outputs=False, shape_type=tuple, extra_params={}, **export_kwargs):
     net.initialize()
     data = nd.random.uniform(0, 1, (1, 1024))
     output = _force_list(net(data))  # initialize weights
@@ -63,8 +63,11 @@ def _check_onnx_export(net, group_outputs=False, shape_type=tuple, extra_params=
             sym=net_sym,
             params=net_params,
             input_shape=[shape_type(data.shape)],
-            onnx_file_path=onnx_file_path)
+            onnx_file_path=onnx_file_path,
+            **export_kwargs)
         assert export_path == onnx_file_path
+        if export_kwargs.get('external_data'):
+            assert os.path.getsize(onnx_file_path + '.data') > 0
         # Try importing the model to symbol
         _assert_sym_equal(net_sym, mx.contrib.onnx.import_model(export_path)[0])
 
@@ -136,3 +139,56 @@ class TestExport(unittest.TestCase):
         net.add(nn.Dense(100, activation='relu'), SplitConcatBlock(),
                 nn.Dense(50, activation='relu'), SplitConcatBlock(), nn.Dense(10))
         _check_onnx_export(net)
+
+    def test_onnx_export_external_data(self):
+        net = nn.HybridSequential()
+        net.add(nn.Dense(100, activation='relu'), nn.Dense(10))
+        _check_onnx_export(net, external_data=True, external_data_threshold=0)
+
+    def test_onnx_export_deduplicate(self):
+        import onnx
+        net = nn.HybridSequential()
+        net.add(nn.Dense(64, in_units=64), nn.Dense(64, in_units=64))
+        net.initialize()
+        net[1].weight.set_data(net[0].weight.data())
+        # distinct biases, only the shared weight may be merged
+        net[0].bias.set_data(mx.nd.ones((64,)))
+        net[1].bias.set_data(mx.nd.full((64,), 2))
+        net_sym = net(sym.Variable('data'))
+        net_params = {param.var().name: param._reduce() for param in net.collect_params().values()}
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            for deduplicate, num_weights in [(False, 4), (True, 3)]:
+                onnx_file_path = os.path.join(tmpdirname, 'net.onnx')
+                mx.contrib.onnx.export_model(sym=net_sym, params=net_params,
+                                             input_shape=[(1, 64)],
+                                             onnx_file_path=onnx_file_path,
+                                             deduplicate=deduplicate)
+                model = onnx.load(onnx_file_path)
+                weights = [t for t in model.graph.initializer if t.name in net_params]
+                assert len(weights) == num_weights
+
+    def test_onnx_import_cache(self):
+        net = nn.HybridSequential()
+        net.add(nn.Dense(100, activation='relu'), nn.Dense(10))
+        net.initialize()
+        data = nd.random.uniform(0, 1, (1, 1024))
+        output = net(data)
+        net_sym = net(sym.Variable('data'))
+        net_params = {param.var().name: param._reduce() for param in net.collect_params().values()}
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            onnx_file_path = os.path.join(tmpdirname, 'net.onnx')
+            cache_dir = os.path.join(tmpdirname, 'cache')
+            mx.contrib.onnx.export_model(sym=net_sym, params=net_params,
+                                         input_shape=[data.shape],
+                                         onnx_file_path=onnx_file_path,
+                                         external_data=True)
+            for _ in range(2):
+                imported_net = mx.contrib.onnx.import_to_gluon(onnx_file_path, ctx=None,
+                                                               cache_dir=cache_dir)
+                assert len(os.listdir(cache_dir)) == 1
+                mx.test_utils.assert_almost_equal(output, imported_net(data),
+                                                  atol=1e-5, rtol=1e-5)
+            imported_sym, arg_params, _ = mx.contrib.onnx.import_model(onnx_file_path,
+                                                                       cache_dir=cache_dir)
+            _assert_sym_equal(net_sym, imported_sym)
+            assert set(arg_params) == set(net_params)
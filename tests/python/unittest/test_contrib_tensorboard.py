@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import threading
+from unittest import mock
+
+import mxnet as mx
+import numpy as np
+import pytest
+from mxnet.contrib import tensorboard
+from mxnet.test_utils import assert_almost_equal
+
+
+class FakeWriter(object):
+    def __init__(self):
+        self.events = []
+        self.flushed = 0
+        self.closed = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def add_scalar(self, tag, value, global_step=None):
+        self.release.wait()
+        self.events.append(('scalar', tag, value, global_step))
+
+    def add_histogram_raw(self, tag, min, max, num, sum, sum_squares, bucket_limits,
+                          bucket_counts, global_step=None):
+        # pylint: disable=redefined-builtin
+        self.events.append(('histogram', tag, (bucket_limits, bucket_counts, num),
+                            global_step))
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_async_summary_writer():
+    fake = FakeWriter()
+    writer = tensorboard.AsyncSummaryWriter(fake, max_queue=4)
+    for i in range(3):
+        writer.add_scalar('loss', mx.nd.array([i]), global_step=i)
+    writer.flush()
+    assert fake.events == [('scalar', 'loss', float(i), i) for i in range(3)]
+    assert fake.flushed >= 1
+
+    # calls are dropped rather than blocking the caller when the queue is full
+    fake.release.clear()
+    for i in range(20):
+        writer.add_scalar('acc', i)
+    assert writer.dropped > 0
+    fake.release.set()
+    writer.close()
+    assert fake.closed
+    assert len(fake.events) == 3 + 20 - writer.dropped
+    # flushing or closing again after close returns immediately
+    writer.flush()
+    writer.close()
+
+
+def test_summarize():
+    x = mx.nd.random.normal(shape=(50, 40))
+    stats, counts, edges = tensorboard.summarize(x, bins=10)
+    x_np = x.asnumpy().reshape(-1)
+    expected_counts, expected_edges = np.histogram(x_np, bins=10)
+    assert_almost_equal(edges.asnumpy(), expected_edges, rtol=1e-4, atol=1e-5)
+    assert counts.asnumpy().sum() == x_np.size
+    assert np.abs(counts.asnumpy() - expected_counts).sum() <= 2
+    assert_almost_equal(stats.asnumpy(),
+                        np.array([x_np.min(), x_np.max(), x_np.sum(), (x_np ** 2).sum(),
+                                  x_np.size]), rtol=1e-3, atol=1e-3)
+
+    fake = FakeWriter()
+    writer = tensorboard.AsyncSummaryWriter(fake)
+    writer.submit(tensorboard._add_histogram_summary, 'w', stats, counts, edges, 7)
+    writer.close()
+    kinds = [e[:2] for e in fake.events]
+    assert kinds == [('histogram', 'w'), ('scalar', 'w/mean'), ('scalar', 'w/std')]
+    limits, bucket_counts, num = fake.events[0][2]
+    assert num == x_np.size
+    assert bucket_counts == counts.asnumpy().astype(np.int64).tolist()
+    assert_almost_equal(np.array(limits), edges.asnumpy()[1:])
+    assert_almost_equal(fake.events[2][2], x_np.std(), rtol=1e-3)
+
+
+def test_histogram_summary_mxboard(tmpdir):
+    mxboard = pytest.importorskip('mxboard')
+    x = mx.nd.random.normal(shape=(1000,))
+    stats, counts, edges = [a.asnumpy() for a in tensorboard.summarize(x, bins=10)]
+    writer = mxboard.SummaryWriter(str(tmpdir))
+    tensorboard._add_histogram_summary(writer, 'w', stats, counts, edges, 1)
+    writer.close()
+    assert os.listdir(str(tmpdir))
+
+
+def test_callbacks_close_without_mxboard():
+    with mock.patch.object(tensorboard, '_create_writer', return_value=None):
+        tensorboard.LogMetricsCallback('logs').close()
+        tensorboard.LogParamsCallback('logs', {}).close()
+        tensorboard.ThroughputSink('logs').close()
@@ -17,6 +17,7 @@
 
 import numpy as np
 import mxnet as mx
+import pytest
 from mxnet.test_utils import assert_almost_equal, environment
 
 
@@ -159,3 +160,66 @@ def test_cached_op_init():
     check_init(False, False)
     check_init(True, False)
     check_init(True, True)
+
+
+def test_bind_zero_copy():
+    x = mx.sym.Variable('x')
+    w = mx.sym.Variable('w')
+    y = mx.sym.FullyConnected(x, w, num_hidden=4, no_bias=True)
+    x_arr = mx.nd.ones((5, 4))
+    w_arr = mx.nd.ones((4, 4))
+    w_grad = mx.nd.zeros((4, 4))
+    exe = y._bind(mx.cpu(), args={'x': x_arr, 'w': w_arr}, args_grad={'w': w_grad},
+                  grad_req={'x': 'null', 'w': 'write'})
+    # inputs without gradient on the right context are bound as is
+    assert exe.arg_dict['x'] is x_arr
+    # inputs with gradient are copied to keep the caller's array untouched
+    assert exe.arg_dict['w'] is not w_arr
+    assert w_arr.grad is None
+
+    data = mx.nd.full((5, 4), 2)
+    exe.forward(is_train=True, x=data)
+    assert exe.arg_dict['x'] is data
+    assert np.all(exe.outputs[0].asnumpy() == 8)
+    exe.backward(mx.nd.ones((5, 4)))
+    assert np.all(w_grad.asnumpy() == 10)
+
+    # numpy inputs and mismatching NDArrays are copied into an executor-owned
+    # array, never into the caller's array
+    exe.forward(x=np.ones((5, 4), dtype=np.float32))
+    assert exe.arg_dict['x'] is not data
+    assert np.all(data.asnumpy() == 2)
+    assert np.all(exe.outputs[0].asnumpy() == 4)
+    owned = exe.arg_dict['x']
+    exe.forward(x=mx.nd.ones((5, 4), dtype=np.float64) * 3)
+    assert exe.arg_dict['x'] is owned
+    assert np.all(data.asnumpy() == 2)
+    assert np.all(exe.outputs[0].asnumpy() == 12)
+
+
+def test_bind_aux_states_copied():
+    x = mx.sym.Variable('x')
+    y = mx.sym.BatchNorm(x, fix_gamma=False, momentum=0.5, name='bn')
+    aux = {'bn_moving_mean': mx.nd.zeros((3,)), 'bn_moving_var': mx.nd.ones((3,))}
+    args = {'x': mx.nd.ones((2, 3)), 'bn_gamma': mx.nd.ones((3,)), 'bn_beta': mx.nd.zeros((3,))}
+    exe = y._bind(mx.cpu(), args=args, aux_states=aux, grad_req='null')
+    assert exe.aux_dict['bn_moving_mean'] is not aux['bn_moving_mean']
+    exe.forward(is_train=True)
+    exe.outputs[0].wait_to_read()
+    assert np.all(aux['bn_moving_mean'].asnumpy() == 0)
+    assert np.all(aux['bn_moving_var'].asnumpy() == 1)
+
+
+def test_bind_static_alloc():
+    x = mx.sym.Variable('x')
+    y = mx.sym.FullyConnected(x, num_hidden=4)
+    for static_alloc, static_shape in [(True, False), (True, True)]:
+        exe = y._simple_bind(mx.cpu(), x=(5, 4), grad_req='null',
+                             static_alloc=static_alloc, static_shape=static_shape)
+        for name, arr in exe.arg_dict.items():
+            arr[:] = 0 if name.endswith('bias') else 1
+        for i in range(3):
+            out = exe.forward(x=mx.nd.full((5, 4), i))
+            assert np.all(out[0].asnumpy() == 4 * i)
+    with pytest.raises(AssertionError):
+        y._simple_bind(mx.cpu(), x=(5, 4), static_shape=True)
@@ -874,6 +874,66 @@ def test_deferred_init():
     layer(x)
 
 
+def test_lazy_init(tmpdir):
+    class CountingInit(mx.init.Initializer):
+        calls = 0
+        def _init_weight(self, _, arr):
+            CountingInit.calls += 1
+            arr[:] = 1
+
+    net = nn.Dense(4, in_units=3)
+    net.initialize(CountingInit(), lazy=True)
+    assert net.weight._data is None
+    assert net.weight.list_ctx() == [mx.cpu()]
+    # first access materializes the parameter with its initializer
+    assert_almost_equal(net.weight.data().asnumpy(), np.ones((4, 3)))
+    assert CountingInit.calls == 1
+    net.weight.zero_grad()
+    assert net.weight.grad().shape == (4, 3)
+
+    ref = nn.Dense(4, in_units=3)
+    ref.initialize(mx.init.Constant(2))
+    fname = os.path.join(str(tmpdir), 'dense.params')
+    ref.save_parameters(fname)
+
+    # loading a checkpoint allocates directly from the stored values
+    CountingInit.calls = 0
+    net = nn.Dense(4, in_units=3)
+    net.initialize(CountingInit(), lazy=True)
+    net.load_parameters(fname)
+    assert CountingInit.calls == 0
+    assert_almost_equal(net.weight.data().asnumpy(), np.full((4, 3), 2))
+    out = net(mx.nd.ones((2, 3)))
+    assert_almost_equal(out.asnumpy(), np.full((2, 4), 8))
+
+    # parameters with unknown shape fall back to deferred initialization
+    net = nn.Dense(4)
+    net.initialize(CountingInit(), lazy=True)
+    net(mx.nd.ones((2, 3)))
+    assert net.weight.shape == (4, 3)
+    assert CountingInit.calls == 1
+
+
+def test_bilinear_orthogonal_init():
+    arr = mx.nd.zeros((2, 3, 4, 4))
+    mx.init.Bilinear()._init_weight(None, arr)
+    f = np.ceil(4 / 2.)
+    c = (2 * f - 1 - f % 2) / (2. * f)
+    expected = np.zeros((2, 3, 4, 4), dtype='float32')
+    for i in range(expected.size):
+        x = i % 4
+        y = (i // 4) % 4
+        expected.flat[i] = (1 - abs(x / f - c)) * (1 - abs(y / f - c))
+    assert_almost_equal(arr.asnumpy(), expected)
+
+    for shape in [(6, 4), (4, 6), (8, 2, 3)]:
+        for rand_type in ['uniform', 'normal']:
+            arr = mx.nd.zeros(shape)
+            mx.init.Orthogonal(scale=1.0, rand_type=rand_type)._init_weight(None, arr)
+            w = arr.asnumpy().reshape(shape[0], -1)
+            gram = w.T.dot(w) if w.shape[0] > w.shape[1] else w.dot(w.T)
+            assert_almost_equal(gram, np.eye(min(w.shape)), rtol=1e-4, atol=1e-4)
+
 
 def check_split_data(x, num_slice, batch_axis, **kwargs):
     res = gluon.utils.split_data(x, num_slice, batch_axis, **kwargs)
@@ -915,6 +975,50 @@ def test_split_data():
         return
     assert False, "Should have failed"
 
+def test_split_and_load():
+    ctx_list = [mx.cpu(0), mx.cpu(1), mx.cpu(2)]
+    x = mx.nd.random.uniform(shape=(10, 3))
+    for batch_axis in [0, 1]:
+        res = gluon.utils.split_and_load(x, ctx_list, batch_axis=batch_axis,
+                                         even_split=False, pin_memory=True)
+        assert [r.context for r in res] == ctx_list
+        assert_almost_equal(mx.nd.concat(*[r.as_in_context(mx.cpu()) for r in res],
+                                         dim=batch_axis), x)
+    res = gluon.utils.split_and_load(x.asnumpy(), ctx_list, even_split=False)
+    assert [r.shape[0] for r in res] == [4, 3, 3]
+    with pytest.raises(ValueError):
+        gluon.utils.split_and_load(x, ctx_list)
+
+    # the slice for the context of the batch is a copy, not a view into it
+    y = mx.nd.ones((6, 2), ctx=mx.cpu(0))
+    res = gluon.utils.split_and_load(y, ctx_list)
+    y[:] = 0
+    assert all((r == 1).asnumpy().all() for r in res)
+
+    batches = [(mx.nd.full((6, 2), i), mx.nd.full((6,), i)) for i in range(5)]
+    for prefetch in [0, 2, 10]:
+        loaded = list(gluon.utils.split_and_load_iter(batches, ctx_list, prefetch=prefetch))
+        assert len(loaded) == len(batches)
+        for i, (data, label) in enumerate(loaded):
+            assert [d.shape for d in data] == [(2, 2)] * 3
+            assert [l.context for l in label] == ctx_list
+            assert all((d == i).asnumpy().all() for d in data + label)
+
+@pytest.mark.skipif(mx.context.num_gpus() == 0, reason="pinned memory requires a GPU")
+def test_split_and_load_pin_memory():
+    ctx_list = [mx.gpu(0), mx.cpu(0)]
+    x = mx.nd.random.uniform(shape=(10, 3))
+    for data in [x, x.asnumpy(), x.as_in_context(mx.cpu_pinned(0))]:
+        for batch_axis in [0, 1]:
+            res = gluon.utils.split_and_load(data, ctx_list, batch_axis=batch_axis,
+                                             even_split=False, pin_memory=True)
+            assert [r.context for r in res] == ctx_list
+            assert_almost_equal(mx.nd.concat(*[r.as_in_context(mx.cpu()) for r in res],
+                                             dim=batch_axis), x)
+    res = gluon.utils.split_and_load(x, [mx.gpu(0)], pin_memory=True)
+    assert res[0].context == mx.gpu(0)
+    assert_almost_equal(res[0], x)
+
 def test_flatten():
     flatten = nn.Flatten()
     x = mx.nd.zeros((3,4,5,6))
@@ -19,6 +19,7 @@ import os
 import tarfile
 import tempfile
 import unittest
+import warnings
 import mxnet as mx
 import numpy as np
 import random
@@ -130,6 +131,55 @@ def test_sampler():
     rand_batch_keep = gluon.data.BatchSampler(rand_sampler, 3, 'keep')
     assert sorted(sum(list(rand_batch_keep), [])) == list(range(10))
 
+def _write_record_shards(tmpdir, lengths):
+    filenames = []
+    value = 0
+    for i, length in enumerate(lengths):
+        filename = str(tmpdir.join('shard_%d.rec' % i))
+        idx_file = str(tmpdir.join('shard_%d.idx' % i)) if i % 2 else \
+            str(tmpdir.join('shard_%d.idx.npy' % i))
+        record = mx.recordio.MXIndexedRecordIO(idx_file, filename, 'w')
+        for j in range(length):
+            record.write_idx(j, str(value).encode())
+            value += 1
+        record.close()
+        filenames.append(filename)
+    return filenames
+
+def test_sharded_record_file_dataset(tmpdir):
+    lengths = [5, 3, 7]
+    filenames = _write_record_shards(tmpdir, lengths)
+    expected = [str(i).encode() for i in range(sum(lengths))]
+    for chunk_size in [0, 1, 4]:
+        dataset = gluon.data.ShardedRecordFileDataset(filenames, chunk_size=chunk_size,
+                                                      cache_chunks=2)
+        assert len(dataset) == 15
+        assert dataset.shard_lengths == lengths
+        assert [dataset[i] for i in range(len(dataset))] == expected
+        assert [dataset[i] for i in reversed(range(len(dataset)))] == expected[::-1]
+        assert dataset[-1] == expected[-1]
+    parts = [dataset.shard(4, i) for i in range(4)]
+    assert [len(part) for part in parts] == [4, 4, 4, 3]
+    assert parts[1].shard_lengths == [1, 3]
+    assert sum([[part[i] for i in range(len(part))] for part in parts], []) == expected
+
+def test_sharded_shuffle_sampler():
+    lengths = [5, 3, 7]
+    for buffer_size in [1, 4, 100]:
+        sampler = gluon.data.ShardedShuffleSampler(lengths, buffer_size=buffer_size, chunk_size=2)
+        assert len(sampler) == 15
+        assert sorted(list(sampler)) == list(range(15))
+    # without in-shard shuffling every shard is visited in one contiguous run
+    sampler = gluon.data.ShardedShuffleSampler(lengths, buffer_size=1, chunk_size=7)
+    order = list(sampler)
+    starts = {0: 5, 5: 3, 8: 7}
+    i = 0
+    while i < len(order):
+        assert order[i] in starts
+        length = starts[order[i]]
+        assert order[i:i + length] == list(range(order[i], order[i] + length))
+        i += length
+
 def test_datasets(tmpdir):
     p = tmpdir.mkdir("test_datasets")
     assert len(gluon.data.vision.MNIST(root=str(p.join('mnist')))) == 60000
@@ -159,6 +209,59 @@ def test_image_folder_dataset(prepare_record):
     assert dataset.synsets == ['test_images']
     assert len(dataset.items) == 16
 
+def test_image_folder_dataset_manifest(tmpdir):
+    root = str(tmpdir.mkdir('images'))
+    for cls, names in [('cat', ['b.jpg', 'a.PNG', 'notes.txt']), ('dog', ['c.jpeg'])]:
+        os.mkdir(os.path.join(root, cls))
+        for name in names:
+            open(os.path.join(root, cls, name), 'wb').close()
+    manifest = os.path.join(str(tmpdir), 'manifest.npz')
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        dataset = gluon.data.vision.ImageFolderDataset(root, manifest=manifest)
+    assert len(w) == 1
+    assert dataset.synsets == ['cat', 'dog']
+    assert list(dataset.items) == [(os.path.join(root, 'cat', 'a.PNG'), 0),
+                                   (os.path.join(root, 'cat', 'b.jpg'), 0),
+                                   (os.path.join(root, 'dog', 'c.jpeg'), 1)]
+    assert dataset.items[-1] == (os.path.join(root, 'dog', 'c.jpeg'), 1)
+    assert os.path.isfile(manifest)
+
+    # an unchanged tree is restored from the manifest
+    cached = gluon.data.vision.ImageFolderDataset(root, manifest=manifest, num_threads=1)
+    assert list(cached.items) == list(dataset.items)
+
+    # adding a file changes the folder mtime and invalidates the manifest
+    new_file = os.path.join(root, 'dog', 'd.jpg')
+    open(new_file, 'wb').close()
+    st = os.stat(os.path.join(root, 'dog'))
+    os.utime(os.path.join(root, 'dog'), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    rescanned = gluon.data.vision.ImageFolderDataset(root, manifest=manifest)
+    assert len(rescanned) == 4
+    assert rescanned.items[3] == (new_file, 1)
+
+    # assigning items replaces the images of the dataset
+    rescanned.items = [(new_file, 0), (os.path.join(root, 'cat', 'b.jpg'), 1)]
+    assert len(rescanned) == 2
+    assert list(rescanned.items) == [(new_file, 0), (os.path.join(root, 'cat', 'b.jpg'), 1)]
+    rescanned.items = rescanned.items[1:]
+    assert list(rescanned.items) == [(os.path.join(root, 'cat', 'b.jpg'), 1)]
+
+    # items can be appended to and assigned like a list
+    rescanned.items.append((new_file, 2))
+    assert len(rescanned) == 2
+    assert rescanned.items[1] == (new_file, 2)
+    rescanned.items[0] = (os.path.join(root, 'cat', 'a.PNG'), 0)
+    assert list(rescanned.items) == [(os.path.join(root, 'cat', 'a.PNG'), 0), (new_file, 2)]
+
+    # labels are not truncated
+    with pytest.raises(ValueError):
+        rescanned.items = [(new_file, 0.5)]
+    with pytest.raises(ValueError):
+        rescanned.items.append((new_file, 1.0))
+    assert len(rescanned) == 2
+
 def test_image_folder_dataset_handle(prepare_record):
     dataset = gluon.data.vision.ImageFolderDataset(os.path.dirname(prepare_record))
     hd = dataset.__mx_handle__()
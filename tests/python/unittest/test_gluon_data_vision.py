@@ -407,6 +407,45 @@ def test_random_gray():
             num_apply += 1
     assert_almost_equal(num_apply/float(iteration), 0.5, 0.1)
 
+def test_batch_transforms():
+    from mxnet.gluon.data.vision import transforms
+
+    data = np.random.uniform(0, 255, (64, 8, 6, 3)).astype('uint8')
+    x = mx.nd.array(data, dtype='uint8')
+    for hybridize in [False, True]:
+        flip = transforms.batch.RandomFlipLeftRight()
+        if hybridize:
+            flip.hybridize()
+        out = flip(x).asnumpy()
+        assert out.dtype == np.uint8
+        flipped = [np.array_equal(o, d[:, ::-1]) for o, d in zip(out, data)]
+        kept = [np.array_equal(o, d) for o, d in zip(out, data)]
+        assert all(f or k for f, k in zip(flipped, kept))
+        # flips are drawn per sample
+        assert any(flipped) and any(kept)
+
+    crop = transforms.batch.RandomResizedCrop((6, 8), scale=(1, 1), ratio=(0.75, 0.75))
+    assert_almost_equal(crop(x).asnumpy(), data.astype('float32'), rtol=1e-3, atol=1e-2)
+    assert transforms.batch.RandomResizedCrop(4)(x).shape == (64, 4, 4, 3)
+
+    gray = mx.nd.full((4, 5, 5, 3), 100, dtype='uint8')
+    jitter = transforms.batch.RandomColorJitter(saturation=0.5, hue=0.5)
+    assert_almost_equal(jitter(gray).asnumpy(), np.full((4, 5, 5, 3), 100), rtol=1e-3, atol=1e-2)
+    brightness = transforms.batch.RandomBrightness(0.5)(gray).asnumpy()
+    assert brightness.min() >= 50 and brightness.max() <= 150
+    # each sample gets its own factor, constant within the sample
+    assert len(np.unique(brightness.reshape(4, -1).std(axis=1).round(3))) == 1
+    assert len(np.unique(brightness[:, 0, 0, 0])) == 4
+
+    transform = transforms.HybridCompose([
+        transforms.batch.RandomResizedCrop(4),
+        transforms.batch.RandomFlipTopBottom(),
+        transforms.batch.RandomLighting(0.1),
+        transforms.batch.RandomGray(0.5),
+        transforms.ToTensor(),
+        transforms.Normalize(0.5, 0.25)])
+    assert transform(x).shape == (64, 3, 4, 4)
+
 def test_bbox_random_flip():
     from mxnet.gluon.contrib.data.vision.transforms.bbox import ImageBboxRandomFlipLeftRight
 
@@ -17,6 +17,7 @@
 
 ''' Unit tests for Gluon Estimator '''
 
+import os
 import sys
 import unittest
 import warnings
@@ -442,3 +443,100 @@ def test_val_handlers():
     logging = LoggingHandler(log_interval=1, metrics=est.val_metrics)
     est.evaluate(val_data=val_data, event_handlers=[logging])
 
+
+def test_fused_step():
+    ''' test deferred metric updates and handler cadence in fused step mode '''
+    net = _get_test_network()
+    dataloader, _ = _get_test_data()
+    ctx = mx.cpu()
+    net.initialize(ctx=ctx)
+    loss = gluon.loss.L2Loss()
+    trainer = gluon.Trainer(net.collect_params(), 'sgd', {'learning_rate': 0.001})
+    est = Estimator(net=net,
+                    loss=loss,
+                    train_metrics=mx.gluon.metric.RMSE(),
+                    trainer=trainer,
+                    context=ctx)
+
+    class CountingHandler(BatchEnd):
+        batch_end_interval = 2
+
+        def __init__(self):
+            self.calls = 0
+
+        def batch_end(self, estimator, *args, **kwargs):
+            self.calls += 1
+
+    counter = CountingHandler()
+    est.fit(train_data=dataloader, epochs=2, event_handlers=[counter],
+            fused_step=True, metric_update_interval=2, profile_handlers=True)
+    # 10 samples with batch size 4 yield 3 batches per epoch, 6 batches in total
+    assert counter.calls == 3
+    # pending metric updates are flushed at epoch end
+    _, value = est.train_metrics[0].get()
+    assert value > 0
+    assert 'CountingHandler.batch_end' in est.handler_timings
+    assert est.handler_timings['CountingHandler.batch_end'][0] == 3
+    assert est.handler_timings['BatchProcessor.fit_batch'][0] == 6
+    assert 'fit_batch' in est.handler_timing_report()
+
+    # without fused_step the handler runs on every batch, timings are not recorded
+    counter = CountingHandler()
+    est.fit(train_data=dataloader, epochs=1, event_handlers=[counter])
+    assert counter.calls == 3
+    assert not est.handler_timings
+
+
+def test_fused_step_builtin_handlers(tmpdir):
+    ''' test that built-in handlers only run at their interval and keep their counters '''
+    net = _get_test_network()
+    dataloader, _ = _get_test_data()
+    ctx = mx.cpu()
+    net.initialize(ctx=ctx)
+    trainer = gluon.Trainer(net.collect_params(), 'sgd', {'learning_rate': 0.001})
+    train_metric = mx.gluon.metric.RMSE()
+    est = Estimator(net=net,
+                    loss=gluon.loss.L2Loss(),
+                    train_metrics=train_metric,
+                    trainer=trainer,
+                    context=ctx)
+    metric = MetricHandler(metrics=est.train_metrics)
+    checkpoint = CheckpointHandler(str(tmpdir), epoch_period=None, batch_period=2)
+    logging = LoggingHandler(log_interval=4, metrics=est.train_metrics)
+    validation = ValidationHandler(val_data=dataloader, eval_fn=est.evaluate)
+    assert logging.batch_end_interval == 4 and checkpoint.batch_end_interval == 2
+    assert validation.batch_end_interval is None
+    est.fit(train_data=dataloader, epochs=2, fused_step=True, metric_update_interval=2,
+            event_handlers=[metric, checkpoint, logging, validation], profile_handlers=True)
+    # 6 batches in total: the checkpoint is saved after batches 2, 4 and 6
+    assert est.batch_idx == 6
+    assert est.handler_timings['CheckpointHandler.batch_end'][0] == 3
+    assert checkpoint.current_batch == 6
+    assert sorted(os.listdir(str(tmpdir))) == ['model-epoch0batch1.params',
+                                               'model-epoch0batch1.states',
+                                               'model-epoch1batch3.params',
+                                               'model-epoch1batch3.states',
+                                               'model-epoch1batch5.params',
+                                               'model-epoch1batch5.states']
+    assert est.handler_timings['LoggingHandler.batch_end'][0] == 1
+    assert 'ValidationHandler.batch_end' not in est.handler_timings
+    # a user supplied MetricHandler follows metric_update_interval
+    assert metric.update_interval is None
+    assert est.handler_timings['MetricHandler.batch_end'][0] == 6
+
+
+def test_metric_handler_update_interval():
+    metric = mx.gluon.metric.Loss()
+    handler = MetricHandler(metrics=[metric], update_interval=3)
+    handler.epoch_begin(None)
+    for _ in range(2):
+        handler.batch_end(None, pred=None, label=None, loss=[mx.nd.ones((2,))])
+    assert metric.num_inst == 0
+    handler.batch_end(None, pred=None, label=None, loss=[mx.nd.ones((2,))])
+    assert metric.num_inst == 6
+    handler.batch_end(None, pred=None, label=None, loss=[mx.nd.ones((2,))])
+    handler.epoch_end(None)
+    assert metric.num_inst == 8
+
+    with pytest.raises(ValueError):
+        MetricHandler(metrics=[metric], update_interval=0)
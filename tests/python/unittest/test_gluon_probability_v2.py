@@ -71,6 +71,22 @@ def test_mgp_getF():
         getF(sym.ones((2, 2)), nd.ones((2, 2)))
 
 
+def test_mgp_scalar_special_functions():
+    # Python scalars are evaluated on the host without scipy
+    utils = mgp.utils
+    for x in [0.05, 0.5, 1.0, 3.7, 25.0, -0.5, -2.3]:
+        assert_almost_equal(utils.digamma(mx.nd)(x), scipy_special.digamma(x),
+                            rtol=1e-5, atol=1e-5)
+        assert_almost_equal(utils.gammaln(mx.nd)(x), scipy_special.gammaln(x),
+                            rtol=1e-5, atol=1e-5)
+    for x in [-0.999, -0.5, 0.0, 0.3, 0.9, 0.999999]:
+        assert_almost_equal(utils.erfinv(mx.nd)(x), scipy_special.erfinv(x),
+                            rtol=1e-6, atol=1e-6)
+        assert_almost_equal(utils.erf(mx.nd)(x), scipy_special.erf(x))
+    assert utils.erfinv(mx.nd)(1.0) == float('inf')
+    assert _np.isnan(utils.digamma(mx.nd)(-2.0))
+
+
 @use_np
 def test_gluon_uniform():
     class TestUniform(HybridBlock):
@@ -1289,6 +1305,15 @@ def test_gluon_bernoulli():
         assert_almost_equal(mx_out, np_out, atol=1e-4,
                             rtol=1e-3, use_broadcast=False)
 
+    # Test log_prob with scalar parameters
+    for prob, use_logit in itertools.product([0.01, 0.3, 0.99], [True, False]):
+        sample = npx.random.bernoulli(prob=0.5, size=(4,))
+        param = float(_np.log(prob) - _np.log1p(-prob)) if use_logit else prob
+        bernoulli = mgp.Bernoulli(logit=param) if use_logit else mgp.Bernoulli(prob=param)
+        mx_out = bernoulli.log_prob(sample).asnumpy()
+        np_out = _np.log(ss.bernoulli.pmf(sample.asnumpy(), prob))
+        assert_almost_equal(mx_out, np_out, atol=1e-4, rtol=1e-3, use_broadcast=False)
+
     # Test variance
     for shape, hybridize, use_logit in itertools.product(shapes, [True, False], [True, False]):
         prob = np.random.uniform(size=shape)
@@ -1746,6 +1771,79 @@ def test_gluon_mvn():
                                     rtol=1e-3, use_broadcast=False)
 
 
+@use_np
+def test_gluon_low_rank_mvn():
+    class TestLowRankMVN(HybridBlock):
+        def __init__(self, func, low_rank):
+            super(TestLowRankMVN, self).__init__()
+            self._func = func
+            self._low_rank = low_rank
+
+        def forward(self, loc, cov_factor, cov_diag, *args):
+            if not self._low_rank:
+                cov_factor = None
+            mvn = mgp.LowRankMultivariateNormal(loc, cov_factor, cov_diag,
+                                                validate_args=True)
+            return _distribution_method_invoker(mvn, self._func, *args)
+
+    event_shape = 5
+    rank = 2
+    batch_shapes = [(), (2,), (4, 2)]
+    for batch_shape, low_rank, hybridize in itertools.product(
+            batch_shapes, [True, False], [True, False]):
+        loc = np.random.randn(*(batch_shape + (event_shape,)))
+        cov_factor = np.random.randn(*(batch_shape + (event_shape, rank)))
+        cov_diag = np.random.uniform(0.5, 1.5, batch_shape + (event_shape,))
+        samples = np.random.randn(*(batch_shape + (event_shape,)))
+        sigma = np.expand_dims(cov_diag, -1) * np.eye(event_shape)
+        if low_rank:
+            sigma = sigma + np.matmul(cov_factor, np.swapaxes(cov_factor, -1, -2))
+        dense = mgp.MultivariateNormal(loc, cov=sigma)
+
+        # Test sampling
+        loc.attach_grad()
+        cov_diag.attach_grad()
+        net = TestLowRankMVN('sample', low_rank)
+        if hybridize:
+            net.hybridize()
+        with autograd.record():
+            mx_out = net(loc, cov_factor, cov_diag)
+        assert mx_out.shape == loc.shape
+        mx_out.backward()
+        assert loc.grad.shape == loc.shape
+        assert cov_diag.grad.shape == cov_diag.shape
+
+        # Test log_prob against the dense parameterization
+        net = TestLowRankMVN('log_prob', low_rank)
+        if hybridize:
+            net.hybridize()
+        mx_out = net(loc, cov_factor, cov_diag, samples)
+        assert mx_out.shape == batch_shape
+        assert_almost_equal(mx_out.asnumpy(), dense.log_prob(samples).asnumpy(),
+                            atol=1e-4, rtol=1e-3, use_broadcast=False)
+
+        # Test entropy against the dense parameterization
+        net = TestLowRankMVN('entropy', low_rank)
+        if hybridize:
+            net.hybridize()
+        mx_out = net(loc, cov_factor, cov_diag)
+        assert mx_out.shape == batch_shape
+        assert_almost_equal(mx_out.asnumpy(), dense.entropy().asnumpy(),
+                            atol=1e-4, rtol=1e-3, use_broadcast=False)
+
+        # Dense properties are materialized lazily
+        lr_mvn = mgp.LowRankMultivariateNormal(
+            loc, cov_factor if low_rank else None, cov_diag)
+        assert_almost_equal(lr_mvn.cov.asnumpy(), sigma.asnumpy(),
+                            atol=1e-4, rtol=1e-3, use_broadcast=False)
+        assert_almost_equal(lr_mvn.variance.asnumpy(), dense.variance.asnumpy(),
+                            atol=1e-4, rtol=1e-3, use_broadcast=False)
+        assert_almost_equal(
+            np.matmul(lr_mvn.precision, sigma).asnumpy(),
+            np.broadcast_to(np.eye(event_shape), sigma.shape).asnumpy(),
+            atol=1e-4, rtol=1e-3, use_broadcast=False)
+
+
 @use_np
 def test_gluon_half_normal():
     class TestHalfNormal(HybridBlock):
@@ -2174,6 +2272,56 @@ def test_gluon_kl():
                 _test_monte_carlo(lhs_dist, rhs_dist, repeated_times)
 
 
+@use_np
+def test_gluon_kl_dispatch():
+    shape = (2, 3)
+    loc_p, loc_q = np.random.randn(*shape), np.random.randn(*shape)
+    scale_p = np.random.uniform(0.5, 1.5, shape)
+    scale_q = np.random.uniform(0.5, 1.5, shape)
+    p, q = mgp.Normal(loc_p, scale_p), mgp.Normal(loc_q, scale_q)
+    kl = mgp.kl_divergence(p, q)
+
+    # Subclasses fall back to the implementation of their closest base class
+    class MyNormal(mgp.Normal):
+        pass
+    assert_almost_equal(mgp.kl_divergence(MyNormal(loc_p, scale_p), q).asnumpy(),
+                        kl.asnumpy(), atol=1e-5, rtol=1e-4, use_broadcast=False)
+
+    # Independent
+    ind_kl = mgp.kl_divergence(mgp.Independent(p, 1), mgp.Independent(q, 1))
+    assert_almost_equal(ind_kl.asnumpy(), kl.sum(-1).asnumpy(),
+                        atol=1e-5, rtol=1e-4, use_broadcast=False)
+
+    # Same bijective transformation on both sides
+    exp_p = mgp.TransformedDistribution(p, mgp.ExpTransform())
+    exp_q = mgp.TransformedDistribution(q, mgp.ExpTransform())
+    assert_almost_equal(mgp.kl_divergence(exp_p, exp_q).asnumpy(), kl.asnumpy(),
+                        atol=1e-5, rtol=1e-4, use_broadcast=False)
+    affine_q = mgp.TransformedDistribution(
+        q, mgp.AffineTransform(loc_q, scale_q))
+    with pytest.raises(NotImplementedError):
+        mgp.kl_divergence(exp_p, affine_q)
+
+    # One dimensional MultivariateNormal agrees with Normal
+    mvn_p = mgp.MultivariateNormal(np.expand_dims(loc_p, -1),
+                                   cov=(scale_p ** 2).reshape(shape + (1, 1)))
+    mvn_q = mgp.MultivariateNormal(np.expand_dims(loc_q, -1),
+                                   cov=(scale_q ** 2).reshape(shape + (1, 1)))
+    assert_almost_equal(mgp.kl_divergence(mvn_p, mvn_q).asnumpy(), kl.asnumpy(),
+                        atol=1e-4, rtol=1e-3, use_broadcast=False)
+    lr_q = mgp.LowRankMultivariateNormal(np.expand_dims(loc_q, -1),
+                                         cov_diag=np.expand_dims(scale_q ** 2, -1))
+    assert_almost_equal(mgp.kl_divergence(mvn_p, lr_q).asnumpy(), kl.asnumpy(),
+                        atol=1e-4, rtol=1e-3, use_broadcast=False)
+
+    # Sampling a pair with a closed form warns once, and is counted
+    calls = mgp.empirical_kl_calls().get((MyNormal, mgp.Normal), 0)
+    with pytest.warns(UserWarning):
+        mgp.empirical_kl(MyNormal(loc_p, scale_p), q)
+    mgp.empirical_kl(MyNormal(loc_p, scale_p), q)
+    assert mgp.empirical_kl_calls()[(MyNormal, mgp.Normal)] == calls + 2
+
+
 @pytest.mark.garbage_expected
 @use_np
 def test_gluon_stochastic_block():
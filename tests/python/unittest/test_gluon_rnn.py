@@ -1120,3 +1120,70 @@ def test_unroll(cell_type, num_states, layout):
             weight1 = val.data()
             weight2 = params2['cell.' + key].data()
             assert_almost_equal(weight1, weight2, rtol=0.001, atol=0.0001)
+
+
+@pytest.mark.parametrize('make_cell, in_shape', [
+    (lambda: gluon.rnn.RNNCell(8), (4, 6, 5)),
+    (lambda: gluon.rnn.LSTMCell(8), (4, 6, 5)),
+    (lambda: gluon.rnn.GRUCell(8), (4, 6, 5)),
+    (lambda: gluon.rnn.Conv1DLSTMCell((3, 7), 4, (3,), (3,)), (4, 6, 3, 7)),
+])
+@pytest.mark.parametrize('use_valid_length', [False, True])
+@pytest.mark.parametrize('hybridize', [False, True])
+def test_unroll_fused(make_cell, in_shape, use_valid_length, hybridize):
+    class UnrollLayer(gluon.HybridBlock):
+        def __init__(self, cell, length, fused):
+            super(UnrollLayer, self).__init__()
+            self.cell = cell
+            self.length = length
+            self.fused = fused
+
+        def hybrid_forward(self, F, inputs, valid_length):
+            if isinstance(valid_length, list) and len(valid_length) == 0:
+                valid_length = None
+            outputs, states = self.cell.unroll(self.length, inputs, layout='NTC',
+                                               merge_outputs=True,
+                                               valid_length=valid_length,
+                                               fused=self.fused)
+            return [outputs] + states
+
+    seq_len = in_shape[1]
+    data = mx.nd.random.normal(shape=in_shape)
+    valid_length = mx.nd.array([1, 3, 6, 4]) if use_valid_length else []
+    cell = make_cell()
+    cell.initialize()
+    results = []
+    for fused in [False, True]:
+        layer = UnrollLayer(cell, seq_len, fused)
+        if hybridize:
+            layer.hybridize()
+        data.attach_grad()
+        with mx.autograd.record():
+            res = layer(data, valid_length)
+        res[0].backward()
+        results.append([r.asnumpy() for r in res] + [data.grad.asnumpy()])
+    assert len(results[0]) == len(results[1])
+    for unfused_res, fused_res in zip(*results):
+        assert_almost_equal(unfused_res, fused_res, rtol=1e-4, atol=1e-4)
+
+
+def test_unroll_fused_graph_size():
+    def num_nodes(cell, length):
+        outputs, states = cell.unroll(length, mx.sym.var('data'), fused=True,
+                                      merge_outputs=True)
+        return len(mx.sym.Group([outputs] + states).get_internals().list_outputs())
+
+    for make_cell in [lambda: gluon.rnn.LSTMCell(10),
+                      lambda: gluon.rnn.Conv1DGRUCell((3, 7), 4, (3,), (3,))]:
+        cell = make_cell()
+        assert num_nodes(cell, 3) == num_nodes(cell, 50)
+
+    stack = gluon.rnn.SequentialRNNCell()
+    stack.add(gluon.rnn.LSTMCell(10))
+    stack.add(gluon.rnn.GRUCell(10))
+    assert num_nodes(stack, 3) == num_nodes(stack, 50)
+
+    stack.initialize()
+    outputs, states = stack.unroll(5, mx.nd.ones((2, 5, 7)), fused=True, merge_outputs=False)
+    assert len(outputs) == 5 and outputs[0].shape == (2, 10)
+    assert len(states) == 3
@@ -280,6 +280,44 @@ def test_trainer_sparse_kv():
         check_trainer_sparse_kv(kv, 'row_sparse', 'row_sparse', None, True)
         check_trainer_sparse_kv(kv, 'row_sparse', 'row_sparse', False, ValueError)
 
+def test_trainer_prefetch_rows():
+    x = gluon.Parameter('x', shape=(10, 2), grad_stype='row_sparse')
+    y = gluon.Parameter('y', shape=(10, 2))
+    z = gluon.Parameter('z', shape=(10, 2), grad_stype='row_sparse')
+    for p in [x, y, z]:
+        p.initialize(ctx=[mx.cpu(0), mx.cpu(1)], init='zeros')
+    trainer = gluon.Trainer([x, y], 'sgd', {'learning_rate': 0.1}, kvstore='local')
+    pytest.raises(ValueError, trainer.prefetch_rows, {y: mx.nd.array([1, 2])})
+    pytest.raises(ValueError, trainer.prefetch_rows, {z: mx.nd.array([1, 2])})
+    pytest.raises(TypeError, trainer.prefetch_rows, {x: [1, 2]})
+
+    trainer.prefetch_rows({x: mx.nd.array([[1, 2], [2, 5]])})
+    assert trainer._prefetch_row_ids[x._uuid].dtype == np.int64
+    assert trainer._prefetch_row_ids[x._uuid].shape == (4,)
+    with mx.autograd.record():
+        for wx, wy in zip(x.list_data(), y.list_data()):
+            out = mx.nd.Embedding(mx.nd.array([0, 3]), wx, input_dim=10, output_dim=2,
+                                  sparse_grad=True) + wy.sum()
+            out.backward()
+    trainer.step(1)
+    # row ids are only used by a dist kvstore and are consumed by the step
+    assert not trainer._prefetch_row_ids
+    expected = np.zeros((10, 2))
+    expected[[0, 3]] = -0.2
+    assert_almost_equal(x.data(mx.cpu(1)), expected)
+
+    # without a kvstore the row ids are dropped as well
+    w = gluon.Parameter('w', shape=(10, 2), grad_stype='row_sparse')
+    w.initialize(ctx=mx.cpu(0), init='zeros')
+    trainer = gluon.Trainer([w], 'sgd', {'learning_rate': 0.1}, kvstore=None)
+    trainer.prefetch_rows({w: mx.nd.array([1, 2])})
+    with mx.autograd.record():
+        out = mx.nd.Embedding(mx.nd.array([0, 3]), w.data(), input_dim=10, output_dim=2,
+                              sparse_grad=True)
+    out.backward()
+    trainer.step(1)
+    assert not trainer._prefetch_row_ids
+
 def test_trainer_lr_sched():
     x = gluon.Parameter('x', shape=(10,))
     x.initialize(ctx=[mx.cpu(0), mx.cpu(1)], init='zeros')
@@ -16,6 +16,7 @@
 # under the License.
 
 import io
+import hashlib
 import os
 import warnings
 import glob
@@ -101,3 +102,29 @@ def test_download_ssl_verify():
     assert any(
         str(w.message).startswith('Unverified HTTPS request')
         for w in warnings_)
+
+
+def test_model_store_verification_cache(tmpdir):
+    """ test that a verified model file is not hashed again """
+    from mxnet.gluon.model_zoo import model_store
+    root = str(tmpdir)
+    content = b'MOCK PARAMS' * 1000
+    sha1_hash = hashlib.sha1(content).hexdigest()
+    with mock.patch.dict(model_store._model_sha1, {'mockmodel': sha1_hash}):
+        file_path = os.path.join(root, 'mockmodel-{}.params'.format(sha1_hash[:8]))
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        assert model_store.get_model_file('mockmodel', root=root) == file_path
+        assert os.path.exists(os.path.join(root, '.sha1_cache.json'))
+        with mock.patch.object(model_store, 'check_sha1', side_effect=AssertionError):
+            assert model_store.get_model_file('mockmodel', root=root) == file_path
+        # modifying the file invalidates the cached verification
+        with open(file_path, 'ab') as f:
+            f.write(b'0')
+        with mock.patch.object(model_store, 'download', side_effect=IOError):
+            with pytest.raises(IOError):
+                model_store.get_model_file('mockmodel', root=root)
+        model_store.purge(root)
+        assert not os.path.exists(os.path.join(root, '.sha1_cache.json'))
+        # lock files may be in use by other processes and are kept
+        assert glob.glob(os.path.join(root, 'mockmodel-*.lock'))
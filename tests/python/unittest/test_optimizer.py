@@ -22,6 +22,7 @@ import mxnet as mx
 import mxnet.lr_scheduler as lr_scheduler
 from mxnet import gluon
 import unittest
+from unittest import mock
 import pytest
 import math
 from mxnet.test_utils import *
@@ -978,3 +979,70 @@ def test_cosine_scheduler():
     np.testing.assert_almost_equal(cosine_sched(0), base_lr)
     np.testing.assert_almost_equal(cosine_sched(steps), final_lr)
     assert (cosine_sched(500) > 1.5)
+
+
+def test_sequential_scheduler():
+    warmup = mx.lr_scheduler.PolyScheduler(10, base_lr=0, final_lr=0.1, pwr=1)
+    cosine = mx.lr_scheduler.CosineScheduler(90, base_lr=0.1, final_lr=0.001)
+    sched = mx.lr_scheduler.SequentialScheduler([warmup, cosine], [10])
+    np.testing.assert_almost_equal(sched(0), 0)
+    np.testing.assert_almost_equal(sched(5), 0.05)
+    np.testing.assert_almost_equal(sched(10), 0.1)
+    np.testing.assert_almost_equal(sched(100), 0.001)
+    np.testing.assert_almost_equal(sched(200), 0.001)
+    # base_lr assigned to the composite rescales every scheduler
+    sched.base_lr = 0.2
+    np.testing.assert_almost_equal(sched(5), 0.1)
+    np.testing.assert_almost_equal(sched(10), 0.2)
+
+
+def test_one_cycle_scheduler():
+    sched = mx.lr_scheduler.OneCycleScheduler(100, base_lr=1, pct_start=0.3,
+                                              div_factor=25, final_div_factor=1e4)
+    np.testing.assert_almost_equal(sched(0), 1. / 25)
+    np.testing.assert_almost_equal(sched(30), 1)
+    assert sched(15) < sched(29) < sched(30)
+    assert sched(30) > sched(65) > sched(99)
+    np.testing.assert_almost_equal(sched(100), 1. / 25 / 1e4)
+    np.testing.assert_almost_equal(sched(150), 1. / 25 / 1e4)
+
+
+def test_scheduler_get_lr_cached():
+    sched = mx.lr_scheduler.FactorScheduler(10, 0.5, base_lr=1)
+    opt = mx.optimizer.SGD(learning_rate=1, lr_scheduler=sched)
+    opt.num_update = 25
+    with mock.patch.object(mx.lr_scheduler.FactorScheduler, '__call__',
+                           autospec=True, side_effect=lambda s, n: s.base_lr) as call:
+        assert opt._get_lrs(list(range(100))) == [1] * 100
+        assert opt._get_lr(3) == 1
+        assert opt.learning_rate == 1
+        assert call.call_count == 1
+        opt.num_update = 26
+        opt._get_lr(3)
+        assert call.call_count == 2
+        # assigning base_lr invalidates the cached learning rate
+        sched.base_lr = 0.5
+        assert opt._get_lr(3) == 0.5
+        assert call.call_count == 3
+
+
+def test_scheduler_without_get_lr():
+    class DuckScheduler(object):
+        def __init__(self, base_lr):
+            self.base_lr = base_lr
+
+        def __call__(self, num_update):
+            return self.base_lr / (num_update + 1)
+
+    class NoInitScheduler(mx.lr_scheduler.LRScheduler):
+        def __init__(self, base_lr):  # pylint: disable=super-init-not-called
+            self.base_lr = base_lr
+
+        def __call__(self, num_update):
+            return self.base_lr / (num_update + 1)
+
+    for sched in [DuckScheduler(1), NoInitScheduler(1)]:
+        opt = mx.optimizer.SGD(learning_rate=1, lr_scheduler=sched)
+        opt.num_update = 3
+        assert opt.learning_rate == 0.25
+        assert opt._get_lrs([0, 1]) == [0.25, 0.25]
@@ -26,7 +26,7 @@ from collections import OrderedDict
 import mxnet as mx
 from mxnet import profiler
 from mxnet.gluon import nn
-from mxnet.test_utils import is_cd_run
+from mxnet.test_utils import is_cd_run, assert_almost_equal
 from common import run_in_spawned_process
 import pytest
 
@@ -281,6 +281,131 @@ def test_aggregate_stats_sorting():
     profiler.set_state('stop')
 
 
+def test_aggregate_stats_records():
+    file_name = 'test_aggregate_stats_records.json'
+    enable_profiler(file_name, True, True, True)
+    profiler.get_aggregate_stats(reset=True)
+    inp = mx.nd.zeros(shape=(100, 100))
+    with profiler.hot_path('test::sqrt'):
+        y = mx.nd.sqrt(inp)
+        y.wait_to_read()
+    with profiler.hot_path('test::sqrt'):
+        y = mx.nd.sqrt(inp)
+        y.wait_to_read()
+    profiler.set_state('stop')
+    # hot paths are not recorded while the profiler is stopped
+    with profiler.hot_path('test::stopped'):
+        pass
+    records = profiler.get_aggregate_stats(reset=True)
+    assert all(isinstance(r, profiler.AggregateStat) for r in records)
+    python_records = {r.name: r for r in records if r.domain == 'Python'}
+    assert 'test::stopped' not in python_records
+    sqrt_path = python_records['test::sqrt']
+    assert sqrt_path.category == 'Time'
+    assert sqrt_path.count == 2
+    assert sqrt_path.min <= sqrt_path.avg <= sqrt_path.max
+    assert abs(sqrt_path.total - 2 * sqrt_path.avg) < 1e-6
+    memory_records = [r for r in records if r.category == 'Memory']
+    assert all(r.total is None for r in memory_records)
+    # reset clears the Python hot path stats as well
+    assert not [r for r in profiler.get_aggregate_stats() if r.domain == 'Python']
+
+
+def test_throughput_monitor(tmpdir):
+    records = []
+    csv_file = str(tmpdir.join('throughput.csv'))
+    monitor = mx.callback.ThroughputMonitor(
+        4, frequent=2, sinks=[records.append, mx.callback.CSVSink(csv_file)],
+        hot_paths={'test::data': 'data'})
+    inp = mx.nd.zeros(shape=(100, 100))
+    for _ in range(5):
+        with profiler.hot_path('test::data'):
+            time.sleep(0.01)
+        with monitor.phase('update'):
+            mx.nd.sqrt(inp)
+        monitor.step(epoch=0)
+    monitor.close()
+    # the first call only starts the clock
+    assert [r['step'] for r in records] == [2, 4]
+    for r in records:
+        assert r['data_ms'] >= 10
+        assert r['update_ms'] > 0
+        assert r['step_ms_p50'] <= r['step_ms_p99']
+        assert r['samples_per_sec'] > 0
+    # the listener is removed on close
+    with profiler.hot_path('test::data'):
+        time.sleep(0.01)
+    assert monitor._pending['data'] == 0
+    with open(csv_file) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2 and float(rows[1]['step']) == 4
+
+
+def test_throughput_monitor_phase_not_double_counted():
+    monitor = mx.callback.ThroughputMonitor(1, frequent=1, sinks=[],
+                                            hot_paths={'test::data': 'data'})
+    # a hot path inside a phase scope of the same phase is charged once
+    with monitor.phase('data'):
+        with profiler.hot_path('test::data'):
+            time.sleep(0.05)
+    assert 50 <= monitor._pending['data'] < 100
+    with pytest.raises(ValueError):
+        with monitor.phase('io'):
+            pass
+    monitor.close()
+    with pytest.raises(ValueError):
+        mx.callback.ThroughputMonitor(1, hot_paths={'test::data': 'io'})
+
+
+def test_throughput_monitor_model_update():
+    monitor = mx.callback.ThroughputMonitor(1, frequent=1, sinks=[])
+    weights, grads = [[mx.nd.ones((2,))]], [[mx.nd.ones((2,))]]
+    kv = mx.kv.create('local')
+    kv.init('w', weights[0][0])
+
+    def updater(index, grad, weight):
+        time.sleep(0.02)
+    # the update helpers of mx.model charge kvstore traffic and the updater
+    mx.model._update_params(weights, grads, updater, 1, kvstore=kv, param_names=['w'])
+    assert monitor._pending['comm'] > 0
+    assert monitor._pending['update'] >= 20
+    monitor.close()
+
+
+def test_sampling_profiler(tmpdir):
+    sampler = profiler.SamplingProfiler(str(tmpdir), window=0.2, interval=0.3, buffer_size=2)
+    assert not sampler.running
+    sampler.start()
+    assert sampler.running
+    inp = mx.nd.zeros(shape=(100, 100))
+    summary_file = os.path.join(str(tmpdir), 'profile-%d.jsonl' % os.getpid())
+
+    def num_windows():
+        if not os.path.exists(summary_file):
+            return 0
+        with open(summary_file) as f:
+            return sum(1 for _ in f)
+
+    # run until three windows have been written, more than the buffer keeps
+    deadline = time.time() + 10
+    while num_windows() < 3 and time.time() < deadline:
+        mx.nd.sqrt(inp).wait_to_read()
+    sampler.toggle()
+    assert not sampler.running
+    # the in-memory buffer only keeps the most recent windows
+    assert len(sampler.recent()) == 2
+    with open(summary_file) as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) >= 3
+    assert all('stats' in line and line['pid'] == os.getpid() for line in lines)
+    # every window rewrites the trace, which must stay valid after the first one
+    with open(os.path.join(str(tmpdir), 'trace-%d.json' % os.getpid())) as f:
+        trace = json.load(f)
+    assert any(event['ph'] == 'M' for event in trace['traceEvents'])
+    with pytest.raises(ValueError):
+        profiler.SamplingProfiler(str(tmpdir), window=2, interval=1)
+
+
 @pytest.mark.skip(reason='https://github.com/apache/incubator-mxnet/issues/18564')
 def test_aggregate_duplication():
     file_name = 'test_aggregate_duplication.json'
@@ -364,6 +489,45 @@ def test_custom_operator_profiling(seed=None, file_name=None):
     profiler.set_state('stop')
 
 
+def test_custom_operator_hot_path():
+    class Square(mx.operator.CustomOp):
+        def forward(self, is_train, req, in_data, out_data, aux):
+            self.assign(out_data[0], req[0], in_data[0] * in_data[0])
+
+        def backward(self, req, out_grad, in_data, out_data, in_grad, aux):
+            self.assign(in_grad[0], req[0], 2 * in_data[0] * out_grad[0])
+
+    @mx.operator.register('HotPathSquare')
+    class SquareProp(mx.operator.CustomOpProp):
+        def __init__(self):
+            super(SquareProp, self).__init__(need_top_grad=True)
+
+        def infer_shape(self, in_shapes):
+            return in_shapes, [in_shapes[0]], []
+
+        def create_operator(self, ctx, in_shapes, in_dtypes):
+            return Square()
+
+    enable_profiler('test_custom_operator_hot_path.json', True, True, True)
+    profiler.get_aggregate_stats(reset=True)
+    # independent invocations may be batched on the custom op worker threads
+    xs = [mx.nd.full((4,), i) for i in range(6)]
+    for x in xs:
+        x.attach_grad()
+    with mx.autograd.record():
+        ys = [mx.nd.Custom(x, op_type='HotPathSquare') for x in xs]
+    mx.autograd.backward(ys)
+    mx.nd.waitall()
+    profiler.set_state('stop')
+    for i, x in enumerate(xs):
+        assert_almost_equal(ys[i], np.full((4,), i * i))
+        assert_almost_equal(x.grad, np.full((4,), 2 * i))
+    records = {r.name: r for r in profiler.get_aggregate_stats(reset=True)
+               if r.domain == 'Python'}
+    assert records['CustomOp::HotPathSquare::forward'].count == 6
+    assert records['CustomOp::HotPathSquare::backward'].count == 6
+
+
 def check_custom_operator_profiling_multiple_custom_ops_output(debug_str):
     target_dict = json.loads(debug_str)
     assert 'Time' in target_dict and 'Custom Operator' in target_dict['Time'] \
@@ -54,6 +54,21 @@ def test_indexed_recordio(tmpdir):
         res = reader.read_idx(i)
         assert res == bytes(str(chr(i)), 'utf-8')
 
+def test_indexed_recordio_binary_idx(tmpdir):
+    fidx = tmpdir.join('rec.idx.npy')
+    frec = tmpdir.join('rec')
+    N = 255
+
+    writer = mx.recordio.MXIndexedRecordIO(str(fidx), str(frec), 'w')
+    for i in range(N):
+        writer.write_idx(N - i, bytes(str(chr(i)), 'utf-8'))
+    writer.close()
+
+    reader = mx.recordio.MXIndexedRecordIO(str(fidx), str(frec), 'r')
+    assert reader.keys == [N - i for i in range(N)]
+    for i in range(N):
+        assert reader.read_idx(N - i) == bytes(str(chr(i)), 'utf-8')
+
 def test_recordio_pack_label():
     N = 255
 
@@ -113,6 +113,48 @@ def test_symbol_saveload():
     assert sym.tojson() == data2.tojson()
     os.remove(fname)
 
+def test_symbol_saveload_gzip():
+    sym = models.mlp2()
+    with TemporaryDirectory() as work_dir:
+        fname = os.path.join(work_dir, 'sym.json.gz')
+        sym.save(fname)
+        with open(fname, 'rb') as f:
+            assert f.read(2) == b'\x1f\x8b'
+        assert sym.tojson() == mx.symbol.load(fname).tojson()
+
+
+def test_symbol_infer_cache():
+    data = mx.sym.var('data')
+    net = mx.sym.FullyConnected(data, num_hidden=8, name='fc')
+    net = mx.sym.Activation(net, act_type='relu')
+    expected_shapes = net.infer_shape(data=(4, 5))
+    expected_types = net.infer_type(data='float16')
+    try:
+        with TemporaryDirectory() as work_dir:
+            cache = mx.sym.set_infer_cache(directory=work_dir)
+            for _ in range(2):
+                assert net.infer_shape(data=(4, 5)) == expected_shapes
+                assert net.infer_type(data='float16') == expected_types
+            assert (cache.hits, cache.misses) == (2, 2)
+            assert net.infer_shape(data=(2, 5))[1] == [(2, 8)]
+            assert cache.misses == 3
+
+            # a new process loading the same graph reads the persisted entries
+            cache = mx.sym.set_infer_cache(directory=work_dir)
+            loaded = mx.sym.load_json(net.tojson())
+            assert loaded.infer_shape(data=(4, 5)) == expected_shapes
+            assert loaded.infer_type(data='float16') == expected_types
+            assert loaded.infer_shape_partial(data=(4, 5)) == expected_shapes
+            assert (cache.hits, cache.misses) == (2, 1)
+
+            # a different graph does not hit the cache
+            other = mx.sym.FullyConnected(data, num_hidden=3, name='fc')
+            assert other.infer_shape(data=(4, 5))[1] == [(4, 3)]
+            assert cache.misses == 2
+    finally:
+        mx.sym.set_infer_cache(False)
+
+
 def test_symbol_infer_shape():
     num_hidden = 128
     num_dim    = 64
@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Sweep distributed kvstore push/pull throughput on a single machine.
+
+Each kvstore type and worker count is launched with the local launcher of
+tools/launch.py, so the scheduler, servers and workers all run on this host
+without ssh. Inside one launch, every worker pushes and pulls all tensor size
+and key count combinations, and worker 0 reports the timings.
+
+Example::
+
+    python benchmark_kvstore.py --kv-stores dist_sync dist_async \\
+        --num-workers 1 2 4 --sizes 1000 1000000 --num-keys 1 16
+"""
+import os, sys
+import argparse
+import json
+import logging
+import subprocess
+import time
+
+curr_path = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(curr_path, "../../python"))
+
+RESULT_PREFIX = 'KVSTORE_RESULT '
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kv-stores', type=str, nargs='+',
+                        default=['dist_sync', 'dist_async', 'dist_device_sync'],
+                        help='the kvstore types to sweep')
+    parser.add_argument('--num-workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='the worker counts to sweep')
+    parser.add_argument('--num-servers', type=int, default=None,
+                        help='number of servers, in default equal to the number of workers')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 10000000],
+                        help='number of float32 elements of each tensor')
+    parser.add_argument('--num-keys', type=int, nargs='+', default=[1, 16],
+                        help='number of keys pushed and pulled together')
+    parser.add_argument('--num-batches', type=int, default=10,
+                        help='number of timed push/pull rounds')
+    parser.add_argument('--warmup', type=int, default=2,
+                        help='number of untimed push/pull rounds')
+    parser.add_argument('--gpu', action='store_true',
+                        help='place the pushed and pulled tensors on gpu(0)')
+    parser.add_argument('--output', type=str, default=None,
+                        help='write all results as JSON lines to this file')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--kv-store', type=str, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def run_worker(args):
+    """Body of a launched worker process, times push/pull for all sizes and key counts."""
+    import mxnet as mx
+    kv = mx.kv.create(args.kv_store)
+    ctx = mx.gpu(0) if args.gpu else mx.cpu()
+    sync = 'async' not in args.kv_store
+    next_key = 0
+    for size in args.sizes:
+        for num_keys in args.num_keys:
+            keys = list(range(next_key, next_key + num_keys))
+            next_key += num_keys
+            kv.init(keys, [mx.nd.zeros((size,)) for _ in keys])
+            grads = [mx.nd.ones((size,), ctx=ctx) for _ in keys]
+            weights = [mx.nd.zeros((size,), ctx=ctx) for _ in keys]
+            kv._barrier()  # pylint: disable=protected-access
+            for i in range(args.warmup + args.num_batches):
+                if i == args.warmup:
+                    mx.nd.waitall()
+                    tic = time.time()
+                kv.push(keys, grads)
+                kv.pull(keys, out=weights)
+            mx.nd.waitall()
+            elapsed = (time.time() - tic) / args.num_batches
+            # without an optimizer the servers store the sum of the pushed values
+            error = float(abs(weights[0] - kv.num_workers).max().asscalar()) if sync else None
+            kv._barrier()  # pylint: disable=protected-access
+            if kv.rank == 0:
+                nbytes = 4 * size * num_keys
+                result = {'kv_store': args.kv_store, 'num_workers': kv.num_workers,
+                          'size': size, 'num_keys': num_keys, 'time': elapsed,
+                          'bandwidth': 2 * nbytes / elapsed / 1e9, 'error': error}
+                print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def launch(args, kv_store, num_workers):
+    """Runs one kvstore type and worker count with the local launcher and
+    returns the results reported by worker 0."""
+    num_servers = args.num_servers or num_workers
+    command = [sys.executable, os.path.join(curr_path, 'benchmark_kvstore.py'), '--worker',
+               '--kv-store', kv_store,
+               '--num-batches', str(args.num_batches), '--warmup', str(args.warmup),
+               '--sizes'] + [str(s) for s in args.sizes] + \
+              ['--num-keys'] + [str(k) for k in args.num_keys]
+    if args.gpu:
+        command.append('--gpu')
+    launcher = [sys.executable, os.path.join(curr_path, '../launch.py'), '--launcher', 'local',
+                '-n', str(num_workers), '-s', str(num_servers)]
+    proc = subprocess.run(launcher + command, stdout=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode != 0:
+        logging.error('%s with %d workers failed with exit code %d',
+                      kv_store, num_workers, proc.returncode)
+    return [json.loads(line[len(RESULT_PREFIX):]) for line in proc.stdout.splitlines()
+            if line.startswith(RESULT_PREFIX)]
+
+
+def main():
+    args = parse_args()
+    if args.worker:
+        run_worker(args)
+        return
+    results = []
+    print('%-18s %-8s %-12s %-6s %-12s %-10s' % (
+        'kvstore', 'workers', 'size', 'keys', 'time (ms)', 'GB/sec'))
+    for kv_store in args.kv_stores:
+        for num_workers in args.num_workers:
+            for r in launch(args, kv_store, num_workers):
+                print('%-18s %-8d %-12d %-6d %-12.3f %-10.3f' % (
+                    r['kv_store'], r['num_workers'], r['size'], r['num_keys'],
+                    r['time'] * 1000, r['bandwidth']))
+                if r['error'] is not None and r['error'] > 1e-5:
+                    logging.warning('unexpected pulled values, error %f', r['error'])
+                results.append(r)
+    if args.output:
+        with open(args.output, 'w') as f:
+            for r in results:
+                f.write(json.dumps(r) + '\n')
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -27,6 +27,7 @@ import mxnet as mx
 import random
 import argparse
 import cv2
+import json
 import time
 import traceback
 
@@ -262,6 +263,113 @@ def write_worker(q_out, fname, working_dir):
                 pre_time = cur_time
             count += 1
 
+def shard_prefix(fname, working_dir, shard_id):
+    """Returns the path prefix of the record file shard `shard_id` created from `fname`."""
+    name = os.path.splitext(os.path.basename(fname))[0]
+    return os.path.join(working_dir, '%s_%05d' % (name, shard_id))
+
+def load_manifest(path):
+    """Loads the manifest of a sharded record database, or returns None if missing."""
+    if not os.path.isfile(path):
+        return None
+    with open(path) as fin:
+        return json.load(fin)
+
+def save_manifest(path, manifest):
+    """Atomically writes the manifest of a sharded record database."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as fout:
+        json.dump(manifest, fout, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def pack_shard(task):
+    """Encodes the images of one shard and writes its .rec, .idx and binary .idx.npy files.
+    The files are written under a temporary name and renamed once the shard is complete,
+    so an interrupted shard is simply packed again on resume.
+    Parameters
+    ----------
+    task: tuple of (args, prefix, items)
+    Returns
+    -------
+    tuple of (prefix, number of records written, bytes written, seconds spent)
+    """
+    args, prefix, items = task
+    try:
+        import Queue as queue
+    except ImportError:
+        import queue
+    start = time.time()
+    q_out = queue.Queue()
+    tmp_rec, tmp_idx = prefix + '.rec.tmp', prefix + '.idx.tmp'
+    record = mx.recordio.MXIndexedRecordIO(tmp_idx, tmp_rec, 'w')
+    for i, item in enumerate(items):
+        image_encode(args, i, item, q_out)
+        _, s, _ = q_out.get()
+        if s is not None:
+            record.write_idx(item[0], s)
+    num_bytes = record.tell()
+    mx.recordio.save_binary_idx(prefix + '.idx.npy', record.keys, record.idx)
+    record.close()
+    os.replace(tmp_idx, prefix + '.idx')
+    os.replace(tmp_rec, prefix + '.rec')
+    return prefix, len(record.keys), num_bytes, time.time() - start
+
+def write_record_shards(args, fname, working_dir):
+    """Packs the images listed in `fname` into record file shards of `args.shard_size`
+    images each, encoding with `args.num_thread` processes. Completed shards are
+    recorded in a manifest next to the list file, which is used to skip them when
+    `args.resume` is set.
+    Parameters
+    ----------
+    args: object
+    fname: string
+    working_dir: string
+    """
+    items = list(read_list(fname))
+    manifest_path = os.path.splitext(fname)[0] + '.manifest.json'
+    manifest = load_manifest(manifest_path) if args.resume else None
+    if manifest is None or manifest.get('shard_size') != args.shard_size \
+            or manifest.get('num_images') != len(items):
+        if args.resume:
+            print('No matching manifest found at %s, packing all shards' % manifest_path)
+        manifest = {'list': os.path.basename(fname), 'shard_size': args.shard_size,
+                    'num_images': len(items), 'shards': {}}
+    tasks = []
+    for shard_id, begin in enumerate(range(0, len(items), args.shard_size)):
+        prefix = shard_prefix(fname, working_dir, shard_id)
+        if os.path.basename(prefix) in manifest['shards']:
+            continue
+        tasks.append((args, prefix, items[begin:begin + args.shard_size]))
+    num_shards = (len(items) + args.shard_size - 1) // args.shard_size
+    print('Packing %d of %d shards from %s' % (len(tasks), num_shards, fname))
+
+    start = time.time()
+    total_records, total_bytes = 0, 0
+    if args.num_thread > 1 and multiprocessing is not None:
+        pool = multiprocessing.Pool(args.num_thread)
+        results = pool.imap_unordered(pack_shard, tasks)
+    else:
+        pool = None
+        results = (pack_shard(task) for task in tasks)
+    try:
+        for prefix, num_records, num_bytes, seconds in results:
+            name = os.path.basename(prefix)
+            manifest['shards'][name] = {'rec': name + '.rec', 'idx': name + '.idx',
+                                        'binary_idx': name + '.idx.npy',
+                                        'num_records': num_records, 'num_bytes': num_bytes}
+            save_manifest(manifest_path, manifest)
+            total_records += num_records
+            total_bytes += num_bytes
+            elapsed = time.time() - start
+            print('shard %s: %d images in %.1fs, %d/%d shards done, '
+                  'total %.1f images/s %.1f MB/s'
+                  % (name, num_records, seconds, len(manifest['shards']), num_shards,
+                     total_records / elapsed, total_bytes / elapsed / 1e6))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
 def parse_args():
     """Defines all arguments.
     Returns
@@ -317,6 +425,12 @@ def parse_args():
                         help='specify the encoding of the images.')
     rgroup.add_argument('--pack-label', action='store_true',
         help='Whether to also pack multi dimensional label in the record file')
+    rgroup.add_argument('--shard-size', type=int, default=0,
+                        help='if positive, write the database as shards of this many images\
+        (<prefix>_<shard>.rec/.idx/.idx.npy) packed in parallel by num-thread processes,\
+        and list the completed shards in <prefix>.manifest.json.')
+    rgroup.add_argument('--resume', action='store_true',
+                        help='with --shard-size, skip the shards already listed in the manifest.')
     args = parser.parse_args()
     args.prefix = os.path.abspath(args.prefix)
     args.root = os.path.abspath(args.root)
@@ -340,6 +454,9 @@ if __name__ == '__main__':
             if fname.startswith(args.prefix) and fname.endswith('.lst'):
                 print('Creating .rec file from', fname, 'in', working_dir)
                 count += 1
+                if args.shard_size > 0:
+                    write_record_shards(args, fname, working_dir)
+                    continue
                 image_list = read_list(fname)
                 # -- write_record -- #
                 if args.num_thread > 1 and multiprocessing is not None:
@@ -23,6 +23,9 @@ Launch a distributed job
 import argparse
 import os, sys
 import signal
+import socket
+import subprocess
+import time
 import logging
 
 curr_path = os.path.abspath(os.path.dirname(__file__))
@@ -55,6 +58,122 @@ def dmlc_opts(opts):
     return dmlc_opts
 
 
+def _free_port():
+    """Returns a free TCP port on the loopback interface."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _parse_env_pairs(pairs):
+    """Parses environment_variable:value pairs."""
+    env = {}
+    for pair in pairs:
+        key, _, value = pair.partition(':')
+        env[key] = value
+    return env
+
+
+def _terminate(procs, timeout):
+    """Terminates the process groups of procs, killing those that outlive timeout."""
+    for proc in procs:
+        if proc.poll() is None:
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except OSError:
+                pass
+    deadline = time.time() + timeout
+    for proc in procs:
+        try:
+            proc.wait(max(0, deadline - time.time()))
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            proc.wait()
+
+
+def local_submit(args):
+    """Runs the scheduler, servers and workers as processes on this machine.
+
+    Every process runs the same command, with its role and the scheduler address
+    passed through the DMLC_* environment variables. Servers and the scheduler
+    exit once all workers have finished. If a worker fails, the scheduler or a
+    server exits before the workers have finished, or the launcher is
+    interrupted, all remaining processes are terminated.
+
+    Returns the exit code of the job: 0 if all workers succeeded, otherwise the
+    exit code of the first failed process, or 1 if the workers did not finish
+    within the shutdown timeout after a server exited cleanly.
+    """
+    command = ' '.join(args.command)
+    base_env = dict(os.environ)
+    base_env.update({'DMLC_PS_ROOT_URI': '127.0.0.1',
+                     'DMLC_PS_ROOT_PORT': str(_free_port()),
+                     'DMLC_NODE_HOST': '127.0.0.1',
+                     'DMLC_NUM_SERVER': str(args.num_servers),
+                     'DMLC_NUM_WORKER': str(args.num_workers)})
+    server_env = _parse_env_pairs(args.env_server)
+    worker_env = _parse_env_pairs(args.env_worker)
+
+    def start(role, extra_env):
+        env = dict(base_env, DMLC_ROLE=role, **extra_env)
+        # each process gets its own process group so that it can be cleaned up
+        # together with the children it spawns
+        return subprocess.Popen(command, shell=True, env=env, start_new_session=True)
+
+    servers, workers = [], []
+    try:
+        servers.append(start('scheduler', {}))
+        servers += [start('server', server_env) for _ in range(args.num_servers)]
+        workers = [start('worker', worker_env) for _ in range(args.num_workers)]
+        logging.info('Started scheduler, %d servers and %d workers on port %s',
+                     args.num_servers, args.num_workers, base_env['DMLC_PS_ROOT_PORT'])
+        pending = list(workers)
+        servers_done = None
+        while pending:
+            for proc in list(pending):
+                code = proc.poll()
+                if code is None:
+                    continue
+                pending.remove(proc)
+                if code != 0:
+                    logging.error('Worker %d exited with code %d, stopping the job',
+                                  workers.index(proc), code)
+                    return code
+            if not pending:
+                break
+            # workers block in ps::Start forever if the scheduler or a server is
+            # gone. A clean exit can race with the last workers shutting down, so
+            # those get the shutdown timeout to finish.
+            for i, proc in enumerate(servers):
+                code = proc.poll()
+                if code is None:
+                    continue
+                name = 'Server %d' % (i - 1) if i else 'Scheduler'
+                if code != 0:
+                    logging.error('%s exited with code %d before the workers finished, '
+                                  'stopping the job', name, code)
+                    return code
+                if servers_done is None:
+                    servers_done = time.time()
+                elif time.time() - servers_done > args.shutdown_timeout:
+                    logging.error('%s exited before the workers finished, stopping the job',
+                                  name)
+                    return 1
+            time.sleep(0.1)
+        for proc in servers:
+            proc.wait(args.shutdown_timeout)
+        return 0
+    except subprocess.TimeoutExpired:
+        logging.warning('Servers did not exit within %d seconds after the workers',
+                        args.shutdown_timeout)
+        return 0
+    finally:
+        _terminate(workers + servers, args.shutdown_timeout)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Launch a distributed job')
     parser.add_argument('-n', '--num-workers', required=True, type=int,
@@ -89,6 +208,9 @@ def main():
                         all environment variables which are set are copied.')
     parser.add_argument('--p3', action='store_true', default=False,
                         help = 'Use P3 distributed training')
+    parser.add_argument('--shutdown-timeout', type=int, default=30,
+                        help='seconds the local launcher waits for servers to exit \
+                        after all workers finished before terminating them')
     parser.add_argument('command', nargs='+',
                         help='command for launching the program')
     args, unknown = parser.parse_known_args()
@@ -98,15 +220,15 @@ def main():
     if args.p3:
         args.command = ['DMLC_PS_VAN_TYPE=p3 DMLC_PS_WATER_MARK=10'] + args.command
 
+    if args.launcher == 'local':
+        sys.exit(local_submit(args))
+
     args = dmlc_opts(args)
 
     if args.host_file is None or args.host_file == 'None':
         if args.cluster == 'yarn':
             from dmlc_tracker import yarn
             yarn.submit(args)
-        elif args.cluster == 'local':
-            from dmlc_tracker import local
-            local.submit(args)
         elif args.cluster == 'sge':
             from dmlc_tracker import sge
             sge.submit(args)
@@ -123,8 +245,9 @@ def main():
             raise RuntimeError('Unknown submission cluster type %s' % args.cluster)
 
 
-def signal_handler(signal, frame):
+def signal_handler(signum, frame):
     logging.info('Stop launcher')
+    # raising SystemExit runs the cleanup of the local launcher
     sys.exit(0)
 
 
@@ -132,4 +255,5 @@ if __name__ == '__main__':
     fmt = '%(asctime)s %(levelname)s %(message)s'
     logging.basicConfig(format=fmt, level=logging.INFO)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     main()